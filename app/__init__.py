@@ -1,16 +1,21 @@
 # coding: utf8
 
-from loguru import logger
-
-from flask import Flask
+from flask import Flask, Response, g
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 
 from app.routes import register_routes
+from app.commands import register_commands
+from app.middlewares import compression
+from app.utils.db_router import RoutingSession, CONSISTENCY_TOKEN_HEADER
+from app.utils.entity_cache import booking_cache
+from app.utils.json_provider import FastJSONProvider
+from app.utils.query_profiler import query_profiler
+from app.utils.request_logger import request_logger
 from config import Config
 
-db: SQLAlchemy = SQLAlchemy()
-"""SQLAlchemy instance để tương tác với database."""
+db: SQLAlchemy = SQLAlchemy(session_options={"class_": RoutingSession})
+"""SQLAlchemy instance để tương tác với database (truy vấn đọc có thể được chuyển sang replica)."""
 
 
 def create_app() -> Flask:
@@ -20,22 +25,40 @@ def create_app() -> Flask:
         Ứng dụng Flask đã được cấu hình
 
     Note:
+        - Cấu hình log (sink enqueue, log request dạng JSON)
+        - Nén response theo Accept-Encoding (zstd/br/gzip)
+        - Serialize JSON của response bằng orjson (nếu có)
         - Khởi tạo CORS cho API endpoints /v1/*
         - Khởi tạo kết nối database
-        - Đăng ký routes
+        - Đăng ký routes và lệnh CLI
+        - Bật lấy mẫu truy vấn chậm (nếu được cấu hình)
+        - Bật cache chi tiết đặt chỗ
         - Cấu hình middleware
     """
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    request_logger.init_app(app)
+    compression.init_app(app)
     CORS(app, resources={r"/v1/*": {"origins": "*"}})
     app.config.from_object(Config)
 
     db.init_app(app)
+    query_profiler.init_app(app)
+    booking_cache.init_app(app, db)
     register_routes(app)
+    register_commands(app)
 
     # Đăng ký middleware hoặc các xử lý khác (nếu cần)
-    @app.before_request
-    def log_request() -> None:
-        """Middleware ghi log trước mỗi request."""
-        pass
+    @app.after_request
+    def add_consistency_token(response: Response) -> Response:
+        """Trả về LSN của primary sau request đã commit dữ liệu (lưu bởi transactional_with_lock).
+
+        Client gửi lại giá trị này qua header X-Consistency-Token ở các request GET tiếp theo
+        để chỉ đọc từ replica đã cập nhật tới thời điểm ghi (read-your-writes).
+        """
+        token = g.get("db_consistency_token")
+        if token and response.status_code < 400:
+            response.headers[CONSISTENCY_TOKEN_HEADER] = token
+        return response
 
     return app
@@ -0,0 +1,39 @@
+# coding: utf8
+
+from quart import Quart
+from quart_cors import cors
+
+from app.asgi.database import async_db
+from app.asgi.kafka import async_kafka_producer
+from app.asgi.routes import register_async_routes
+from config import Config
+
+"""Phiên bản ASGI (Quart) của API đặt chỗ.
+
+Handler, truy vấn database (SQLAlchemy asyncio + asyncpg) và gửi Kafka đều không chặn event loop,
+một process giữ được nhiều request đồng thời trong lúc chờ Postgres/Kafka thay vì mỗi request giữ
+một worker như phiên bản WSGI. Cần cài requirements-asgi.txt; chạy bằng run_asgi.py.
+"""
+
+
+def create_asgi_app() -> Quart:
+    """Tạo và cấu hình ứng dụng Quart.
+
+    Returns:
+        Ứng dụng Quart đã được cấu hình
+
+    Note:
+        - Khởi tạo CORS cho API endpoints /v1/*
+        - Khởi tạo engine database bất đồng bộ (chỉ primary, không dùng read replica)
+        - Khởi tạo producer Kafka bất đồng bộ
+        - Đăng ký routes CRUD đặt chỗ
+    """
+    app = Quart(__name__)
+    app.config.from_object(Config)
+    app = cors(app, allow_origin="*")
+
+    async_db.init_app(app)
+    async_kafka_producer.init_app(app)
+    register_async_routes(app)
+
+    return app
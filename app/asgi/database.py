@@ -0,0 +1,52 @@
+# coding: utf8
+
+from quart import g
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+
+class AsyncDatabase:
+    """Kết nối database bất đồng bộ (SQLAlchemy asyncio + asyncpg) của phiên bản ASGI.
+
+    Mỗi request dùng một AsyncSession riêng, tạo khi dùng lần đầu và đóng khi kết thúc request.
+    Trong lúc chờ database, event loop phục vụ các request khác; số kết nối đồng thời bị giới hạn
+    bởi pool (ASYNC_DB_POOL_SIZE + ASYNC_DB_MAX_OVERFLOW), request vượt quá chờ kết nối trong pool.
+
+    Attributes:
+        engine: AsyncEngine
+        sessionmaker: Factory tạo AsyncSession
+    """
+
+    def __init__(self):
+        self.engine = None
+        self.sessionmaker = None
+
+    def init_app(self, app) -> None:
+        """Tạo engine theo cấu hình của ứng dụng và đăng ký đóng session sau mỗi request.
+
+        Args:
+            app: Ứng dụng Quart
+        """
+        self.engine = create_async_engine(
+            app.config["ASYNC_SQLALCHEMY_DATABASE_URI"], **app.config["ASYNC_SQLALCHEMY_ENGINE_OPTIONS"]
+        )
+        self.sessionmaker = async_sessionmaker(self.engine, expire_on_commit=False)
+        app.teardown_appcontext(self._close_session)
+        app.after_serving(self._dispose)
+
+    @property
+    def session(self) -> AsyncSession:
+        """AsyncSession của request hiện tại."""
+        if "async_session" not in g:
+            g.async_session = self.sessionmaker()
+        return g.async_session
+
+    async def _close_session(self, exception=None) -> None:
+        session = g.pop("async_session", None)
+        if session is not None:
+            await session.close()
+
+    async def _dispose(self) -> None:
+        await self.engine.dispose()
+
+
+async_db = AsyncDatabase()
@@ -0,0 +1,194 @@
+# coding: utf8
+
+from loguru import logger
+
+from functools import wraps
+from quart import request, Response
+from sqlalchemy.exc import DBAPIError
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import quote_etag
+
+from app.asgi.database import async_db
+from app.asgi.kafka import async_kafka_producer
+from app.decorators.transactional_with_lock import LOCK_NOT_AVAILABLE
+from app.decorators.validate_request import compile_params, parse_request_params
+from app.exceptions.exception import BadRequest, CommonException, PreconditionFailed, RequestConflict, VersionConflict
+from app.services.event import PENDING_EVENTS_KEY
+from app.utils import dumps_json, parse_version_etag
+
+
+def json_response(data: dict, status_code: int = 200, headers: dict = None) -> Response:
+    """Tạo response JSON (serialize bằng dumps_json giống JSON provider của phiên bản WSGI).
+
+    Args:
+        data: Nội dung response
+        status_code: Mã trạng thái HTTP
+        headers: Header bổ sung
+
+    Returns:
+        Response: Response JSON
+    """
+    return Response(dumps_json(data) + b"\n", status=status_code, headers=headers, mimetype="application/json")
+
+
+def async_format_response(f) -> callable:
+    """
+    Định dạng response trả về cho client (như format_response, cho hàm xử lý async).
+
+    Args:
+        f: Coroutine function cần được định dạng response
+
+    Returns:
+        callable: Hàm đã được wrap với xử lý response
+    """
+    @wraps(f)
+    async def decorated_function(*args, **kwargs) -> Response:
+        try:
+            response = await f(*args, **kwargs)
+            if isinstance(response, Response):
+                return response
+
+            headers = None
+            if isinstance(response, tuple) and len(response) == 3:
+                data, status_code, headers = response
+            elif isinstance(response, tuple):
+                data, status_code = response
+            else:
+                data, status_code = response, 200
+
+            if status_code == 304:
+                return Response(status=304, headers=headers)
+
+            response_data = {
+                "success": True
+            }
+            if data:
+                response_data['data'] = data
+            return json_response(response_data, status_code, headers)
+
+        except CommonException as error:
+            return json_response({"success": False, "error": error.to_dict}, error.status_code.value)
+
+        except HTTPException as error:
+            return json_response({
+                "success": False,
+                "error": {
+                    "code": error.code,
+                    "message": error.description
+                }
+            }, error.code)
+
+        except Exception as error:
+            logger.exception(error)
+            return json_response({
+                "success": False,
+                "error": {
+                    "code": 500,
+                    "message": "Internal Server Error"
+                }
+            }, 500)
+
+    return decorated_function
+
+
+def async_validate_request(params: dict) -> callable:
+    """Decorator validate request parameters (như validate_request, cho hàm xử lý async).
+
+    Args:
+        params: Thông tin validate cho từng tham số (xem validate_request)
+
+    Returns:
+        function: Decorated function
+    """
+    compiled = compile_params(params)
+    read_json = any(location == "json" for _, location, _ in compiled)
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            body = await request.get_json() if read_json and request.is_json else None
+            kwargs.update(parse_request_params(compiled, body, request.args))
+            return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def async_if_match(id_key: str, etag_func: callable = None) -> callable:
+    """
+    Decorator bật cập nhật lạc quan theo header If-Match (như if_match, cho hàm xử lý async).
+
+    Args:
+        id_key: Tên tham số chứa ID của bản ghi (để đối chiếu với ID trong ETag)
+        etag_func: Hàm nhận kết quả của hàm xử lý và trả về ETag mới (trả về trong header ETag)
+
+    Returns:
+        callable: Decorator function
+    """
+    def decorator(func: callable) -> callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            precondition = bool(request.if_match) and not request.if_match.star_tag
+            if precondition:
+                etags = request.if_match.as_set()
+                if len(etags) != 1:
+                    raise BadRequest("If-Match chỉ hỗ trợ một ETag")
+                parsed = parse_version_etag(etags.pop())
+                if parsed is None or parsed[0] != kwargs.get(id_key):
+                    raise PreconditionFailed("ETag trong If-Match không khớp với bản ghi")
+                kwargs["version"] = parsed[1]
+
+            try:
+                result = await func(*args, **kwargs)
+            except VersionConflict as e:
+                if precondition:
+                    raise PreconditionFailed(e.message)
+                raise e
+
+            if etag_func is None or result is None:
+                return result
+            return result, 200, {"ETag": quote_etag(etag_func(result))}
+
+        return wrapper
+
+    return decorator
+
+
+def async_transactional(func: callable) -> callable:
+    """
+    Decorator quản lý transaction của AsyncSession (như transactional_with_lock, không lock trước).
+
+    Commit khi hàm xử lý thành công, rollback khi lỗi. Sự kiện của chế độ direct (EVENT_PUBLISH_MODE)
+    được gửi tới Kafka sau khi commit. Bản ghi đang bị lock bởi transaction khác trả về lỗi 409.
+
+    Args:
+        func: Coroutine function cần chạy trong transaction
+
+    Returns:
+        wrapper: Hàm decorator đã được wrap
+
+    Raises:
+        RequestConflict: Khi bản ghi đang bị lock bởi transaction khác
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        session = async_db.session
+        try:
+            result = await func(*args, **kwargs)
+            await session.commit()
+        except DBAPIError as e:
+            await session.rollback()
+            if getattr(e.orig, "pgcode", None) == LOCK_NOT_AVAILABLE:
+                raise RequestConflict("Bản ghi đang được cập nhật bởi yêu cầu khác, vui lòng thử lại")
+            raise e
+        except Exception as e:
+            await session.rollback()
+            raise e
+        finally:
+            events = session.info.pop(PENDING_EVENTS_KEY, None)
+            await session.close()
+
+        if events:
+            await async_kafka_producer.publish(events)
+        return result
+
+    return wrapper
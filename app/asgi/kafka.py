@@ -0,0 +1,129 @@
+# coding: utf8
+
+from loguru import logger
+
+from confluent_kafka import KafkaException, Producer
+from threading import Thread
+
+from app.constants.globals import (
+    KAFKA_BACKPRESSURE_POLICY, KAFKA_BACKPRESSURE_TIMEOUT, KAFKA_CLOSE_TIMEOUT, KAFKA_PRODUCER_MODE
+)
+from app.enum import BackpressurePolicy, KafkaProducerMode
+from app.utils import event_codec, kafka_producer
+
+import asyncio
+
+POLL_INTERVAL = 0.1
+
+
+class AsyncKafkaProducer:
+    """Gửi message tới Kafka từ event loop (phiên bản ASGI).
+
+    send() trả về khi broker xác nhận mà không chặn event loop: delivery callback (chạy trong luồng
+    poll nền) hoàn thành future của message qua loop.call_soon_threadsafe. Khi hàng đợi của
+    librdkafka đầy, xử lý theo KAFKA_BACKPRESSURE_POLICY như KafkaProducer (block chờ bằng
+    asyncio.sleep nên không chặn các request khác). Dùng chung producer librdkafka (cấu hình
+    linger.ms, batch.size, nén) với KafkaProducer.
+
+    Attributes:
+        mode: Chế độ gửi sự kiện sau commit (sync: chờ broker xác nhận, async: không chờ)
+    """
+
+    def __init__(self, producer: Producer):
+        self.mode = KAFKA_PRODUCER_MODE
+        self.producer = producer
+        self._poller = None
+        self._closed = False
+        self._background = set()
+
+    def init_app(self, app) -> None:
+        """Bắt đầu luồng poll khi server khởi động và gửi hết hàng đợi khi dừng.
+
+        Args:
+            app: Ứng dụng Quart
+        """
+        app.before_serving(self._start)
+        app.after_serving(self._close)
+
+    async def send(self, topic: str, key: str, value: bytes, headers: list = None) -> None:
+        """Gửi một message và chờ broker xác nhận.
+
+        Raises:
+            RuntimeError: Khi gửi lỗi hoặc hàng đợi đầy (policy error, hoặc block quá thời gian chờ)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_delivery(err, msg):
+            loop.call_soon_threadsafe(self._resolve, future, err)
+
+        deadline = loop.time() + KAFKA_BACKPRESSURE_TIMEOUT
+        while True:
+            try:
+                self.producer.produce(topic=topic, key=key, value=value, headers=headers, on_delivery=on_delivery)
+                break
+            except BufferError:
+                if KAFKA_BACKPRESSURE_POLICY == BackpressurePolicy.DROP.value:
+                    logger.warning(f"Kafka: hàng đợi đầy, bỏ message {topic}/{key}")
+                    return
+                if KAFKA_BACKPRESSURE_POLICY == BackpressurePolicy.ERROR.value or loop.time() >= deadline:
+                    raise RuntimeError("Kafka produce failed: hàng đợi gửi đầy")
+                await asyncio.sleep(POLL_INTERVAL)
+        await future
+
+    async def publish(self, events: list) -> None:
+        """Gửi các sự kiện (topic, key, payload) đã mã hóa bằng event_codec.
+
+        Chế độ sync chờ broker xác nhận tất cả sự kiện; chế độ async gửi nền và chỉ ghi log lỗi.
+        Lỗi không được ném ra (giống gửi sự kiện sau commit của phiên bản WSGI).
+
+        Args:
+            events: Danh sách tuple (topic, key, payload)
+        """
+        sends = [self._send_event(topic, key, payload) for topic, key, payload in events]
+        if self.mode == KafkaProducerMode.SYNC.value:
+            await asyncio.gather(*sends)
+        else:
+            for send in sends:
+                # Giữ tham chiếu tới task tới khi gửi xong (event loop chỉ giữ tham chiếu yếu)
+                task = asyncio.ensure_future(send)
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+
+    async def _send_event(self, topic: str, key: str, payload: dict) -> None:
+        try:
+            value, headers = event_codec.encode(payload)
+            await self.send(topic, key, value, headers)
+        except (RuntimeError, KafkaException) as e:
+            logger.error(f"Không thể gửi sự kiện {topic}/{key}: {e}")
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, err) -> None:
+        if future.done():
+            return
+        if err is None:
+            future.set_result(None)
+        else:
+            future.set_exception(RuntimeError(f"Kafka produce failed: {err}"))
+
+    async def _start(self) -> None:
+        self._closed = False
+        self._poller = Thread(target=self._run, name="kafka-poll", daemon=True)
+        self._poller.start()
+
+    async def _close(self) -> None:
+        self._closed = True
+        remaining = await asyncio.to_thread(self.producer.flush, KAFKA_CLOSE_TIMEOUT)
+        if remaining:
+            logger.error(f"Kafka: {remaining} message chưa được gửi khi dừng")
+
+    def _run(self) -> None:
+        """Vòng lặp của luồng nền: xử lý delivery callback."""
+        while not self._closed:
+            try:
+                self.producer.poll(POLL_INTERVAL)
+            except Exception as e:
+                logger.warning(f"Kafka poll lỗi: {e}")
+
+
+async_kafka_producer = AsyncKafkaProducer(kafka_producer.producer)
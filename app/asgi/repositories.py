@@ -0,0 +1,135 @@
+# coding: utf8
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Row
+
+from app.asgi.database import async_db
+from app.enum import CountMode
+from app.repositories.booking import BookingRepository
+from app.repositories.outbox import OutboxRepository
+from app.utils import page_format
+
+
+class AsyncBookingRepository(BookingRepository):
+    """Repository đặt phòng dùng AsyncSession (phiên bản ASGI).
+
+    Cùng tên phương thức, tham số và kết quả với BookingRepository nhưng là coroutine; câu lệnh SQL
+    được tạo bởi các phương thức _*_statement của BookingRepository nên hai phiên bản luôn giống nhau.
+    Không commit, transaction được quản lý bởi tầng service.
+
+    Inheritance:
+        BookingRepository: Dùng lại READ_COLUMNS, bộ lọc và các câu lệnh
+    """
+
+    async def paginate_all(self, **kwargs) -> object:
+        """Lấy danh sách đặt phòng có phân trang và lọc (xem BookingRepository.paginate_all).
+
+        count=estimate đếm chính xác và cache theo bộ lọc trong COUNT_CACHE_TTL giây (không dùng EXPLAIN).
+
+        Returns:
+            object: Đối tượng pagination đã được format thêm thông tin phân trang, items là danh sách Row.
+        """
+        page = kwargs.get("page")
+        size = kwargs.get("size")
+        count_mode = kwargs.get("count") or CountMode.EXACT.value
+        statement = self._apply_filters(self._select_active(), **kwargs)
+
+        items = (await async_db.session.execute(self._page_statement(statement, **kwargs))).all()
+
+        if count_mode == CountMode.EXACT.value:
+            total = await self._count_total(statement)
+        elif count_mode == CountMode.ESTIMATE.value:
+            cache_key = self._filter_key(**kwargs)
+            total = self.count_cache.get(cache_key)
+            if total is None:
+                total = await self._count_total(statement)
+                self.count_cache.set(cache_key, total)
+        else:
+            total = None
+
+        return page_format(items[:size], page, size, total, len(items) > size)
+
+    async def paginate_cursor(self, **kwargs) -> object:
+        """Lấy danh sách đặt phòng phân trang theo cursor (xem BookingRepository.paginate_cursor).
+
+        Returns:
+            object: Đối tượng phân trang theo cursor, items là danh sách Row
+        """
+        statement, backward = self._cursor_statement(**kwargs)
+        items = (await async_db.session.execute(statement)).all()
+        return self._cursor_page(items, backward, **kwargs)
+
+    async def bulk_insert(self, rows: list) -> list:
+        """Thêm mới nhiều bản ghi bằng INSERT ... RETURNING.
+
+        Returns:
+            list: Danh sách Row các bản ghi đã thêm, theo đúng thứ tự của rows
+        """
+        return (await async_db.session.execute(self._insert_statement(), self._insert_values(rows))).all()
+
+    async def lock_phones(self, phones: list) -> None:
+        """Lấy advisory lock (giữ tới hết transaction) theo số điện thoại (xem BookingRepository.lock_phones)."""
+        await async_db.session.execute(self.LOCK_PHONES_SQL, {"phones": list(phones)})
+
+    async def select_duplicates(self, pairs: list, ignored_statuses: list) -> set:
+        """Tìm các booking chưa xóa trùng số điện thoại và thời gian đặt.
+
+        Returns:
+            set: Các tuple (phone, booking_date) đã tồn tại
+        """
+        rows = (await async_db.session.execute(self._duplicates_statement(pairs, ignored_statuses))).all()
+        return {(row.phone, row.booking_date) for row in rows}
+
+    async def select_row_by_id(self, entity_id: int) -> Row | None:
+        """Lấy bản ghi đặt phòng (chưa xóa) theo ID dưới dạng Row."""
+        return (await async_db.session.execute(
+            self._select_active().where(self.model.id == entity_id)
+        )).first()
+
+    async def select_version_by_id(self, entity_id: int) -> int | None:
+        """Lấy phiên bản hiện tại của bản ghi chưa xóa."""
+        return (await async_db.session.execute(self._version_statement(entity_id))).scalar()
+
+    async def update_returning(self, entity_id: int, version: int = None, **kwargs) -> Row | None:
+        """Cập nhật bản ghi bằng một câu lệnh UPDATE ... RETURNING (xem BookingRepository.update_returning).
+
+        Returns:
+            Row | None: Row (previous_status, *READ_COLUMNS) sau khi cập nhật, hoặc None nếu bản ghi
+            không tồn tại/đã xóa hoặc phiên bản không khớp
+        """
+        return (await async_db.session.execute(
+            self._update_returning_statement(entity_id, version, **kwargs)
+        )).first()
+
+    async def soft_delete_returning(self, entity_id: int, version: int = None) -> Row | None:
+        """Xóa mềm bản ghi bằng một câu lệnh UPDATE ... RETURNING.
+
+        Returns:
+            Row | None: Row (READ_COLUMNS) của bản ghi đã xóa, hoặc None nếu bản ghi không tồn tại/đã
+            xóa hoặc phiên bản không khớp
+        """
+        return (await async_db.session.execute(self._soft_delete_statement(entity_id, version))).first()
+
+    async def _count_total(self, statement) -> int:
+        return (await async_db.session.execute(self._count_statement(statement))).scalar()
+
+
+class AsyncOutboxRepository(OutboxRepository):
+    """Repository ghi sự kiện vào outbox dùng AsyncSession (phiên bản ASGI).
+
+    Inheritance:
+        OutboxRepository: Dùng lại model của outbox
+    """
+
+    async def add_events(self, events: list) -> None:
+        """Ghi các sự kiện vào outbox trong transaction hiện tại (một câu lệnh INSERT).
+
+        Args:
+            events: Danh sách dict (topic, message_key, event_type, payload)
+        """
+        if events:
+            await async_db.session.execute(insert(self.model), events)
+
+
+async_booking_repo = AsyncBookingRepository()
+async_outbox_repo = AsyncOutboxRepository()
@@ -0,0 +1,87 @@
+# coding: utf8
+
+from quart import Blueprint, request
+from werkzeug.http import quote_etag
+
+from app.asgi.decorators import async_format_response, async_if_match, async_validate_request, json_response
+from app.asgi.services import AsyncBookingService
+from app.routes.schemas import CREATE_SCHEMA, PAGINATE_SCHEMA, UPDATE_SCHEMA
+from app.services import BookingService
+from app.utils import remove_none_in_dict
+
+"""Routes của phiên bản ASGI.
+
+Chỉ gồm các endpoint CRUD đặt chỗ (cùng URL, tham số và response với phiên bản WSGI):
+- Phân trang và tìm kiếm đặt chỗ (GET /v1/bookings) -> dict
+- Tạo đặt chỗ mới (POST /v1/bookings) -> dict
+- Xem chi tiết đặt chỗ (GET /v1/bookings/<id>) -> dict
+- Cập nhật thông tin đặt chỗ (PUT /v1/bookings/<id>) -> dict
+- Xóa (xóa mềm) đặt chỗ (DELETE /v1/bookings/<id>) -> None
+
+Các endpoint còn lại (xuất file, thao tác theo lô, báo cáo, quản trị) vẫn do phiên bản WSGI phục vụ.
+"""
+
+health_check_async_bp = Blueprint("health_check_async", __name__)
+booking_async_bp = Blueprint("bookings_async", __name__)
+
+
+@health_check_async_bp.route("/ping", methods=["GET"])
+async def health_check():
+    return json_response({"success": True, "data": "pong"})
+
+
+@booking_async_bp.route("/bookings", methods=["GET"])
+@async_format_response
+@async_validate_request(PAGINATE_SCHEMA)
+async def paginate_booking(**kwargs) -> dict:
+    """Lấy danh sách đặt chỗ theo phân trang và bộ lọc (tham số như BookingRoute._paginate_booking)."""
+    return await AsyncBookingService.paginate_booking(**remove_none_in_dict(kwargs))
+
+
+@booking_async_bp.route("/bookings", methods=["POST"])
+@async_format_response
+@async_validate_request(CREATE_SCHEMA)
+async def create_booking(**kwargs) -> dict:
+    """Tạo đặt chỗ mới (tham số như BookingRoute._create_booking)."""
+    return await AsyncBookingService.create_booking(**remove_none_in_dict(kwargs))
+
+
+@booking_async_bp.route("/bookings/<int:booking_id>", methods=["GET"])
+@async_format_response
+async def get_booking(booking_id: int) -> tuple:
+    """Lấy thông tin chi tiết đặt chỗ, kèm ETag theo phiên bản (304 nếu khớp If-None-Match).
+
+    Chỉ đọc phiên bản trước khi so sánh với If-None-Match, bản ghi đầy đủ chỉ được đọc khi cần trả về.
+    """
+    etag = await AsyncBookingService.booking_etag(booking_id)
+    if etag in request.if_none_match:
+        return None, 304, {"ETag": quote_etag(etag)}
+    booking = await AsyncBookingService.get_booking(booking_id)
+    return booking, 200, {"ETag": quote_etag(BookingService.response_etag(booking))}
+
+
+@booking_async_bp.route("/bookings/<int:booking_id>", methods=["PUT"])
+@async_format_response
+@async_validate_request(UPDATE_SCHEMA)
+@async_if_match("booking_id", BookingService.response_etag)
+async def update_booking(booking_id: int, **kwargs) -> dict:
+    """Cập nhật thông tin đặt chỗ (tham số như BookingRoute._update_booking, hỗ trợ If-Match)."""
+    return await AsyncBookingService.update_booking(booking_id=booking_id, **remove_none_in_dict(kwargs))
+
+
+@booking_async_bp.route("/bookings/<int:booking_id>", methods=["DELETE"])
+@async_format_response
+@async_if_match("booking_id")
+async def delete_booking(booking_id: int, version: int = None) -> None:
+    """Xóa (xóa mềm) đặt chỗ (hỗ trợ If-Match)."""
+    return await AsyncBookingService.delete_booking(**remove_none_in_dict({"booking_id": booking_id, "version": version}))
+
+
+def register_async_routes(app) -> None:
+    """Đăng ký các routes của phiên bản ASGI.
+
+    Args:
+        app: Ứng dụng Quart
+    """
+    app.register_blueprint(health_check_async_bp, url_prefix="/v1")
+    app.register_blueprint(booking_async_bp, url_prefix="/v1")
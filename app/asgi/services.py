@@ -0,0 +1,197 @@
+# coding: utf8
+
+from datetime import datetime
+
+from app.asgi.database import async_db
+from app.asgi.decorators import async_transactional
+from app.asgi.repositories import async_booking_repo, async_outbox_repo
+from app.constants.globals import BOOKING_DUPLICATE_CHECK, EVENT_PUBLISH_MODE, KAFKA_BOOKING_TOPIC
+from app.decorators.validate_func import validate_params
+from app.enum import BookingEvent, EventPublishMode, PaginationMode
+from app.exceptions.exception import BadRequest, NotFound, RequestConflict, VersionConflict
+from app.services.base import BaseService
+from app.services.booking import (
+    BookingService, CREATE_BOOKING_SCHEMA, DELETE_BOOKING_SCHEMA, DUPLICATE_BOOKING_MESSAGE,
+    DUPLICATE_IGNORED_STATUSES, PAGINATE_BOOKING_SCHEMA, UPDATE_BOOKING_SCHEMA
+)
+from app.services.event import PENDING_EVENTS_KEY
+from app.utils import make_version_etag
+
+# Các tham số thời gian (chuỗi RFC 3339 đã validate) được chuyển thành datetime trước khi truy vấn,
+# asyncpg không tự chuyển chuỗi sang timestamptz như psycopg2
+DATETIME_FIELDS = ("booking_date", "booking_from", "booking_to", "created_from", "created_to")
+
+
+class AsyncEventService(BaseService):
+    """Service phát sự kiện booking của phiên bản ASGI (như EventService.publish).
+
+    Chế độ outbox ghi sự kiện vào booking_outbox trong transaction hiện tại (relay của phiên bản WSGI
+    gửi tới Kafka); chế độ direct giữ sự kiện trong session, async_transactional gửi sau khi commit.
+    """
+
+    @classmethod
+    async def publish(cls, events: list, topic: str = KAFKA_BOOKING_TOPIC) -> None:
+        """Phát các sự kiện trong transaction hiện tại (chỉ được gửi đi nếu transaction commit).
+
+        Args:
+            events: Danh sách tuple (event_type, key, payload)
+            topic: Topic Kafka
+        """
+        if not events:
+            return
+        if EVENT_PUBLISH_MODE == EventPublishMode.DIRECT.value:
+            async_db.session.info.setdefault(PENDING_EVENTS_KEY, []).extend(
+                (topic, key, payload) for _, key, payload in events
+            )
+            return
+
+        await async_outbox_repo.add_events([
+            {"topic": topic, "message_key": key, "event_type": event_type, "payload": payload}
+            for event_type, key, payload in events
+        ])
+
+
+class AsyncBookingService(BaseService):
+    """Service booking của phiên bản ASGI.
+
+    Cùng nghiệp vụ và định dạng kết quả với BookingService (dùng lại schema, định dạng response và
+    sự kiện) nhưng truy vấn qua AsyncBookingRepository. Không dùng cache chi tiết/danh sách của
+    phiên bản WSGI (cache nằm trong bộ nhớ của từng process WSGI và được làm mới qua LISTEN).
+
+    Inheritance:
+        BaseService: Kế thừa các phương thức cơ bản từ base service
+    """
+
+    @classmethod
+    async def paginate_booking(cls, **kwargs) -> dict:
+        """Lấy danh sách booking có phân trang (tham số như BookingService.paginate_booking).
+
+        Returns:
+            dict: Kết quả phân trang
+        """
+        validate_params(PAGINATE_BOOKING_SCHEMA, kwargs)
+        kwargs = cls._parse_datetimes(kwargs)
+        if kwargs.get("pagination") == PaginationMode.CURSOR.value:
+            return BookingService._cursor_page_response(await async_booking_repo.paginate_cursor(**kwargs))
+        return BookingService._page_response(await async_booking_repo.paginate_all(**kwargs), **kwargs)
+
+    @classmethod
+    async def get_booking(cls, booking_id: int) -> dict:
+        """Lấy thông tin chi tiết của một booking.
+
+        Raises:
+            NotFound: Khi booking không tồn tại hoặc đã bị xóa
+        """
+        row = await async_booking_repo.select_row_by_id(booking_id)
+        if row is None:
+            raise NotFound(f"#{booking_id} không tồn tại trên hệ thống")
+        return BookingService._format_booking_rows([row])[0]
+
+    @classmethod
+    async def booking_etag(cls, booking_id: int) -> str:
+        """Tính ETag của booking từ ID và phiên bản, chỉ đọc phiên bản (xem BookingService.booking_etag).
+
+        Raises:
+            NotFound: Khi booking không tồn tại hoặc đã bị xóa
+        """
+        version = await async_booking_repo.select_version_by_id(booking_id)
+        if version is None:
+            raise NotFound(f"#{booking_id} không tồn tại trên hệ thống")
+        return make_version_etag(booking_id, version)
+
+    @classmethod
+    @async_transactional
+    async def create_booking(cls, **kwargs) -> dict:
+        """Tạo mới booking (tham số như BookingService.create_booking).
+
+        Returns:
+            dict: Thông tin booking đã tạo
+
+        Raises:
+            RequestConflict: Khi bật BOOKING_DUPLICATE_CHECK và đã có booking cùng số điện thoại, thời gian đặt
+        """
+        kwargs = cls._parse_datetimes(validate_params(CREATE_BOOKING_SCHEMA, kwargs))
+        if BOOKING_DUPLICATE_CHECK:
+            pair = (kwargs["phone"], kwargs["booking_date"])
+            await async_booking_repo.lock_phones([kwargs["phone"]])
+            if await async_booking_repo.select_duplicates([pair], DUPLICATE_IGNORED_STATUSES):
+                raise RequestConflict(DUPLICATE_BOOKING_MESSAGE)
+
+        rows = await async_booking_repo.bulk_insert([kwargs])
+        booking = BookingService._format_booking_rows(rows)[0]
+        await AsyncEventService.publish([BookingService._booking_event(BookingEvent.CREATED, booking)])
+        return booking
+
+    @classmethod
+    @async_transactional
+    async def update_booking(cls, **kwargs) -> dict:
+        """Cập nhật booking bằng một câu lệnh UPDATE ... RETURNING (tham số như BookingService.update_booking).
+
+        Returns:
+            dict: Thông tin booking sau khi cập nhật
+
+        Raises:
+            NotFound: Khi booking cần cập nhật không tồn tại hoặc đã bị xóa
+            VersionConflict: Khi phiên bản không khớp
+        """
+        validate_params(UPDATE_BOOKING_SCHEMA, kwargs)
+        kwargs = cls._parse_datetimes(kwargs)
+        booking_id, version = kwargs.get("booking_id"), kwargs.get("version")
+        changes = {field: kwargs[field] for field in async_booking_repo.UPDATE_FIELDS if field in kwargs}
+        if not changes:
+            row = await async_booking_repo.select_row_by_id(booking_id)
+            if row is None or (version is not None and row.version != version):
+                await cls._raise_write_error(booking_id, version)
+            return BookingService._format_booking_rows([row])[0]
+
+        row = await async_booking_repo.update_returning(booking_id, version, **changes)
+        if row is None:
+            await cls._raise_write_error(booking_id, version)
+        previous_status, booking = row[0], BookingService._format_booking_rows([row[1:]])[0]
+        await AsyncEventService.publish([BookingService._update_event(booking, previous_status)])
+        return booking
+
+    @classmethod
+    @async_transactional
+    async def delete_booking(cls, **kwargs) -> None:
+        """Xóa mềm booking bằng một câu lệnh UPDATE ... RETURNING (tham số như BookingService.delete_booking).
+
+        Raises:
+            NotFound: Khi booking cần xóa không tồn tại hoặc đã bị xóa
+            VersionConflict: Khi phiên bản không khớp
+        """
+        validate_params(DELETE_BOOKING_SCHEMA, kwargs)
+        booking_id, version = kwargs.get("booking_id"), kwargs.get("version")
+        row = await async_booking_repo.soft_delete_returning(booking_id, version)
+        if row is None:
+            await cls._raise_write_error(booking_id, version)
+        booking = BookingService._format_booking_rows([row])[0]
+        await AsyncEventService.publish([BookingService._booking_event(BookingEvent.DELETED, booking)])
+
+    @classmethod
+    async def _raise_write_error(cls, booking_id: int, version: int = None) -> None:
+        """Báo lỗi khi câu lệnh cập nhật/xóa không tác động tới bản ghi nào (xem BookingService._raise_write_error).
+
+        Raises:
+            NotFound: Khi booking không tồn tại hoặc đã bị xóa
+            VersionConflict: Khi booking tồn tại nhưng phiên bản khác version
+        """
+        current = await async_booking_repo.select_version_by_id(booking_id) if version is not None else None
+        if current is None:
+            raise NotFound(f"#{booking_id} không tồn tại trên hệ thống")
+        raise VersionConflict(f"#{booking_id} đã được cập nhật (phiên bản {current}, yêu cầu phiên bản {version})")
+
+    @staticmethod
+    def _parse_datetimes(kwargs: dict) -> dict:
+        """Chuyển các tham số thời gian dạng chuỗi thành datetime.
+
+        Raises:
+            BadRequest: Khi giá trị không phải thời gian hợp lệ
+        """
+        try:
+            return {
+                key: datetime.fromisoformat(value) if key in DATETIME_FIELDS and isinstance(value, str) else value
+                for key, value in kwargs.items()
+            }
+        except ValueError:
+            raise BadRequest("Thời gian không hợp lệ")
@@ -0,0 +1,96 @@
+# coding: utf8
+
+from loguru import logger
+
+from app.constants.globals import (
+    CONSUMER_BATCH_SIZE, CONSUMER_COMMIT_INTERVAL, CONSUMER_MAX_RETRIES, CONSUMER_POLL_TIMEOUT,
+    CONSUMER_STATS_INTERVAL, CONSUMER_WORKERS, KAFKA_BOOKING_TOPIC, KAFKA_CONSUMER_GROUP,
+    OUTBOX_BATCH_SIZE, OUTBOX_POLL_INTERVAL
+)
+
+import click
+import json
+import signal
+import time
+
+# Chu kỳ xóa sự kiện đã gửi khỏi outbox (giây)
+OUTBOX_PURGE_INTERVAL = 3600
+
+
+def register_commands(app):
+    """Đăng ký các lệnh CLI (flask --app run <lệnh>).
+
+    Args:
+        app: Ứng dụng Flask
+    """
+    from app.services import AdminService, EventService, IdempotencyService
+
+    @app.cli.command("index-advice")
+    @click.option("--since-hours", default=24, show_default=True, help="Số giờ gần nhất cần phân tích")
+    def index_advice(since_hours: int) -> None:
+        """Gợi ý index cho các tổ hợp bộ lọc có truy vấn chậm."""
+        click.echo(json.dumps(AdminService.index_advice(since_hours), indent=2, ensure_ascii=False, default=str))
+
+    @app.cli.command("query-samples")
+    @click.option("--since-hours", default=24, show_default=True, help="Số giờ gần nhất cần thống kê")
+    def query_samples(since_hours: int) -> None:
+        """Thống kê các truy vấn chậm đã được lấy mẫu."""
+        click.echo(json.dumps(AdminService.query_samples(since_hours), indent=2, ensure_ascii=False, default=str))
+
+    @app.cli.command("outbox-relay")
+    @click.option("--batch-size", default=OUTBOX_BATCH_SIZE, show_default=True, help="Số sự kiện tối đa mỗi lô")
+    @click.option("--interval", default=OUTBOX_POLL_INTERVAL, show_default=True, help="Thời gian chờ khi outbox trống (giây)")
+    @click.option("--once", is_flag=True, help="Chỉ gửi một lô rồi dừng")
+    def outbox_relay(batch_size: int, interval: float, once: bool) -> None:
+        """Gửi các sự kiện trong outbox tới Kafka theo lô."""
+        stopping = []
+        signal.signal(signal.SIGTERM, lambda signum, frame: stopping.append(signum))
+
+        last_purge = 0
+        try:
+            while not stopping:
+                try:
+                    claimed = EventService.relay_batch(batch_size)
+                    if time.monotonic() - last_purge >= OUTBOX_PURGE_INTERVAL:
+                        EventService.purge_sent()
+                        last_purge = time.monotonic()
+                except Exception as e:
+                    logger.error(f"Outbox relay lỗi: {e}")
+                    claimed = 0
+                if once:
+                    break
+                # Lô đầy thì gửi tiếp ngay, ngược lại chờ sự kiện mới
+                if claimed < batch_size:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+    @app.cli.command("purge-idempotency-keys")
+    def purge_idempotency_keys() -> None:
+        """Xóa các Idempotency-Key đã hết hạn (chạy định kỳ, ví dụ bằng cron)."""
+        click.echo(f"Đã xóa {IdempotencyService.purge_expired()} key hết hạn")
+
+    @app.cli.command("booking-consumer")
+    @click.option("--group-id", default=KAFKA_CONSUMER_GROUP, show_default=True, help="Consumer group")
+    @click.option("--workers", default=CONSUMER_WORKERS, show_default=True, help="Số worker xử lý song song")
+    @click.option("--batch-size", default=CONSUMER_BATCH_SIZE, show_default=True, help="Số message tối đa mỗi lần consume")
+    def booking_consumer(group_id: str, workers: int, batch_size: int) -> None:
+        """Consume sự kiện booking và gọi các handler đã đăng ký."""
+        from app.consumers import ConsumerRuntime, event_handlers
+
+        runtime = ConsumerRuntime(
+            app,
+            topics=[KAFKA_BOOKING_TOPIC],
+            group_id=group_id,
+            registry=event_handlers,
+            workers=workers,
+            batch_size=batch_size,
+            poll_timeout=CONSUMER_POLL_TIMEOUT,
+            commit_interval=CONSUMER_COMMIT_INTERVAL,
+            max_retries=CONSUMER_MAX_RETRIES
+        )
+        signal.signal(signal.SIGTERM, lambda signum, frame: runtime.stop())
+        try:
+            runtime.run(stats_interval=CONSUMER_STATS_INTERVAL)
+        except KeyboardInterrupt:
+            pass
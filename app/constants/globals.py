@@ -5,5 +5,91 @@ import os
 DEFAULT_PAGE_LIMIT = 50
 DEFAULT_PAGE_NUMBER = 1
 TIMEOUT_VALUE = 30
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", 1000))
+EXPORT_FETCH_SIZE = int(os.environ.get("EXPORT_FETCH_SIZE", 1000))
 
-KAFKA_BOOKING_TOPIC = os.environ.get("KAFKA_BOOKING_TOPIC", "<your-kafka-booking-topic>")
\ No newline at end of file
+# Đếm tổng số bản ghi khi phân trang (count=estimate)
+COUNT_CACHE_TTL = int(os.environ.get("COUNT_CACHE_TTL", 60))
+COUNT_CACHE_MAX_SIZE = int(os.environ.get("COUNT_CACHE_MAX_SIZE", 1024))
+COUNT_ESTIMATE_THRESHOLD = int(os.environ.get("COUNT_ESTIMATE_THRESHOLD", 10000))
+
+KAFKA_BOOKING_TOPIC = os.environ.get("KAFKA_BOOKING_TOPIC", "<your-kafka-booking-topic>")
+
+# Kafka producer: sync (flush sau mỗi message) hoặc async (luồng nền poll, gửi theo lô)
+KAFKA_PRODUCER_MODE = os.environ.get("KAFKA_PRODUCER_MODE", "async")
+KAFKA_LINGER_MS = int(os.environ.get("KAFKA_LINGER_MS", 20))
+KAFKA_BATCH_SIZE = int(os.environ.get("KAFKA_BATCH_SIZE", 65536))
+KAFKA_COMPRESSION = os.environ.get("KAFKA_COMPRESSION", "lz4")
+KAFKA_QUEUE_MAX_MESSAGES = int(os.environ.get("KAFKA_QUEUE_MAX_MESSAGES", 100000))
+KAFKA_BACKPRESSURE_POLICY = os.environ.get("KAFKA_BACKPRESSURE_POLICY", "block")
+KAFKA_BACKPRESSURE_TIMEOUT = float(os.environ.get("KAFKA_BACKPRESSURE_TIMEOUT", 1))
+KAFKA_MAX_RETRIES = int(os.environ.get("KAFKA_MAX_RETRIES", 3))
+KAFKA_RETRY_QUEUE_SIZE = int(os.environ.get("KAFKA_RETRY_QUEUE_SIZE", 10000))
+KAFKA_CLOSE_TIMEOUT = float(os.environ.get("KAFKA_CLOSE_TIMEOUT", 10))
+
+# Phát sự kiện booking: outbox (ghi cùng transaction, relay gửi Kafka) hoặc direct (gửi Kafka sau commit)
+EVENT_PUBLISH_MODE = os.environ.get("EVENT_PUBLISH_MODE", "outbox")
+# Định dạng mã hóa sự kiện: msgpack (nén, cần cài msgpack) hoặc json
+EVENT_CODEC = os.environ.get("EVENT_CODEC", "msgpack")
+OUTBOX_BATCH_SIZE = int(os.environ.get("OUTBOX_BATCH_SIZE", 500))
+OUTBOX_POLL_INTERVAL = float(os.environ.get("OUTBOX_POLL_INTERVAL", 0.5))
+OUTBOX_PUBLISH_TIMEOUT = float(os.environ.get("OUTBOX_PUBLISH_TIMEOUT", 30))
+OUTBOX_RETENTION_HOURS = int(os.environ.get("OUTBOX_RETENTION_HOURS", 24))
+
+# Consumer sự kiện booking
+KAFKA_CONSUMER_GROUP = os.environ.get("KAFKA_CONSUMER_GROUP", "booking-consumer")
+CONSUMER_WORKERS = int(os.environ.get("CONSUMER_WORKERS", 8))
+CONSUMER_BATCH_SIZE = int(os.environ.get("CONSUMER_BATCH_SIZE", 500))
+CONSUMER_POLL_TIMEOUT = float(os.environ.get("CONSUMER_POLL_TIMEOUT", 1))
+CONSUMER_COMMIT_INTERVAL = float(os.environ.get("CONSUMER_COMMIT_INTERVAL", 5))
+CONSUMER_MAX_RETRIES = int(os.environ.get("CONSUMER_MAX_RETRIES", 3))
+CONSUMER_STATS_INTERVAL = float(os.environ.get("CONSUMER_STATS_INTERVAL", 60))
+
+# Serialize JSON của response: orjson (nếu đã cài) hoặc stdlib
+JSON_SERIALIZER = os.environ.get("JSON_SERIALIZER", "orjson")
+
+# Nén response theo Accept-Encoding (zstd/br/gzip), chỉ nén khi nội dung lớn hơn COMPRESSION_MIN_SIZE byte
+COMPRESSION_ENABLED = os.environ.get("COMPRESSION_ENABLED", "true").lower() in ("true", "1", "yes")
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+COMPRESSION_LEVEL_GZIP = int(os.environ.get("COMPRESSION_LEVEL_GZIP", 6))
+COMPRESSION_LEVEL_BR = int(os.environ.get("COMPRESSION_LEVEL_BR", 4))
+COMPRESSION_LEVEL_ZSTD = int(os.environ.get("COMPRESSION_LEVEL_ZSTD", 3))
+
+# Idempotency-Key của request tạo booking: thời gian lưu response (giây)
+IDEMPOTENCY_TTL = int(os.environ.get("IDEMPOTENCY_TTL", 86400))
+# Từ chối tạo booking trùng số điện thoại và thời gian đặt với một booking đang hiệu lực
+BOOKING_DUPLICATE_CHECK = os.environ.get("BOOKING_DUPLICATE_CHECK", "false").lower() in ("true", "1", "yes")
+
+# Log: cấp độ log ứng dụng, log request (một dòng JSON mỗi request, lấy mẫu theo cấp độ/route)
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+REQUEST_LOG_ENABLED = os.environ.get("REQUEST_LOG_ENABLED", "true").lower() in ("true", "1", "yes")
+REQUEST_LOG_SAMPLE_RATES = os.environ.get("REQUEST_LOG_SAMPLE_RATES", "INFO=1,WARNING=1,ERROR=1")
+REQUEST_LOG_ROUTE_SAMPLE_RATES = os.environ.get("REQUEST_LOG_ROUTE_SAMPLE_RATES", "/v1/ping=0")
+REQUEST_LOG_SLOW_MS = float(os.environ.get("REQUEST_LOG_SLOW_MS", 1000))
+LOG_REDACT_FIELDS = os.environ.get("LOG_REDACT_FIELDS", "phone,customer_name")
+
+# Lấy mẫu truy vấn chậm và gợi ý index
+QUERY_PROFILER_ENABLED = os.environ.get("QUERY_PROFILER_ENABLED", "false").lower() in ("true", "1", "yes")
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", 200))
+SLOW_QUERY_SAMPLE_RATE = float(os.environ.get("SLOW_QUERY_SAMPLE_RATE", 0.1))
+SLOW_QUERY_QUEUE_SIZE = int(os.environ.get("SLOW_QUERY_QUEUE_SIZE", 100))
+
+ADMIN_API_KEY = os.environ.get("ADMIN_API_KEY", "")
+
+# Định tuyến truy vấn đọc sang replica
+REPLICA_MAX_LAG_SECONDS = float(os.environ.get("REPLICA_MAX_LAG_SECONDS", 5))
+REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get("REPLICA_LAG_CHECK_INTERVAL", 5))
+
+# Cache chi tiết đặt chỗ (invalidate giữa các worker qua LISTEN/NOTIFY)
+BOOKING_CACHE_ENABLED = os.environ.get("BOOKING_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+BOOKING_CACHE_MAX_SIZE = int(os.environ.get("BOOKING_CACHE_MAX_SIZE", 10000))
+BOOKING_CACHE_TTL = int(os.environ.get("BOOKING_CACHE_TTL", 300))
+
+# Cache kết quả danh sách đặt chỗ (theo tham số lọc và thế hệ ghi của bảng booking)
+LIST_CACHE_TTL = float(os.environ.get("LIST_CACHE_TTL", 5))
+LIST_CACHE_MAX_SIZE = int(os.environ.get("LIST_CACHE_MAX_SIZE", 1024))
+
+# Báo cáo
+REPORT_TIMEZONE = os.environ.get("REPORT_TIMEZONE", "Asia/Ho_Chi_Minh")
+REPORT_MAX_DAYS = int(os.environ.get("REPORT_MAX_DAYS", 366))
+REPORT_DEFAULT_DAYS = int(os.environ.get("REPORT_DEFAULT_DAYS", 30))
@@ -0,0 +1,7 @@
+# coding: utf8
+
+from .registry import HandlerRegistry, event_handlers
+from .runtime import ConsumerRuntime
+
+# Import để đăng ký các handler
+from . import booking
@@ -0,0 +1,16 @@
+# coding: utf8
+
+from loguru import logger
+
+from app.consumers.registry import event_handlers
+from app.enum import BookingEvent
+
+
+@event_handlers.register(*(event.value for event in BookingEvent))
+def log_booking_events(events: list) -> None:
+    """Ghi log các sự kiện booking nhận được (handler mẫu, thay bằng xử lý thực tế như gửi thông báo).
+
+    Args:
+        events: Danh sách payload liên tiếp cùng loại sự kiện
+    """
+    logger.info(f"Nhận {len(events)} sự kiện {events[0]['event']}: {[event.get('booking_id') for event in events]}")
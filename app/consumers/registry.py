@@ -0,0 +1,55 @@
+# coding: utf8
+
+
+class HandlerRegistry:
+    """Danh sách handler xử lý sự kiện theo loại sự kiện.
+
+    Handler nhận một danh sách payload (dict) liên tiếp cùng loại trong một partition, theo đúng
+    thứ tự trong partition. Handler cần idempotent vì sự kiện có thể được gửi lại (at-least-once).
+
+    Ví dụ:
+        @event_handlers.register("booking_created")
+        def notify_customer(events: list) -> None:
+            ...
+    """
+
+    def __init__(self):
+        self._handlers = {}
+
+    def register(self, *event_types: str) -> callable:
+        """Decorator đăng ký handler cho một hoặc nhiều loại sự kiện.
+
+        Args:
+            *event_types: Các loại sự kiện (ví dụ booking_created)
+
+        Returns:
+            callable: Decorator trả về chính handler
+
+        Raises:
+            ValueError: Khi loại sự kiện đã có handler
+        """
+        def decorator(handler: callable) -> callable:
+            for event_type in event_types:
+                if event_type in self._handlers:
+                    raise ValueError(f"Sự kiện {event_type} đã có handler {self._handlers[event_type].__name__}")
+                self._handlers[event_type] = handler
+            return handler
+        return decorator
+
+    def get(self, event_type: str) -> callable:
+        """Lấy handler của loại sự kiện.
+
+        Args:
+            event_type: Loại sự kiện
+
+        Returns:
+            callable: Handler hoặc None nếu chưa đăng ký
+        """
+        return self._handlers.get(event_type)
+
+    @property
+    def event_types(self) -> list:
+        return sorted(self._handlers)
+
+
+event_handlers = HandlerRegistry()
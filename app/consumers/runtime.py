@@ -0,0 +1,231 @@
+# coding: utf8
+
+from loguru import logger
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from confluent_kafka import Consumer, KafkaError, KafkaException, TopicPartition
+from itertools import groupby
+from queue import Empty, Queue
+from threading import Lock
+
+from app.consumers.registry import HandlerRegistry
+from app.utils import event_codec
+from config import Config
+
+import json
+import time
+
+RETRY_BACKOFF = 0.5
+
+
+class ConsumerRuntime:
+    """Chạy consumer Kafka và gọi handler đã đăng ký theo loại sự kiện.
+
+    - Thứ tự theo partition: mỗi lần consume, message được gom theo partition thành một lô và giao
+      cho worker; partition bị pause tới khi lô xử lý xong nên không có hai lô của cùng một partition
+      chạy song song. Các partition khác nhau được xử lý song song bởi pool worker.
+    - Micro-batch: trong một lô, các message liên tiếp cùng loại sự kiện được truyền cho handler
+      trong một lần gọi.
+    - Commit theo lô: offset chỉ được lưu (store) sau khi lô xử lý xong và được commit định kỳ mỗi
+      commit_interval giây, commit đồng bộ khi rebalance hoặc khi dừng (at-least-once).
+    - Handler lỗi được gọi lại tối đa max_retries lần, sau đó lô bị bỏ qua và ghi log lỗi để không
+      chặn partition.
+
+    Attributes:
+        topics: Danh sách topic
+        registry: HandlerRegistry chứa các handler
+        batch_size: Số message tối đa mỗi lần consume
+    """
+
+    def __init__(self, app, topics: list, group_id: str, registry: HandlerRegistry, workers: int,
+                 batch_size: int, poll_timeout: float, commit_interval: float, max_retries: int):
+        self.app = app
+        self.topics = topics
+        self.registry = registry
+        self.batch_size = batch_size
+        self.poll_timeout = poll_timeout
+        self.commit_interval = commit_interval
+        self.max_retries = max_retries
+        self.consumer = Consumer({
+            'bootstrap.servers': Config.KAFKA_BROKER,
+            'group.id': group_id,
+            'enable.auto.commit': False,
+            'enable.auto.offset.store': False,
+            'auto.offset.reset': 'earliest',
+        })
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="consumer")
+        self._in_flight = {}
+        self._completed = Queue()
+        self._uncommitted = 0
+        self._running = False
+        self._lock = Lock()
+        self._metrics = {"consumed": 0, "processed": 0, "failed": 0, "skipped": 0, "batches": 0, "commits": 0}
+        self._started_at = None
+        self._last_stats = (time.monotonic(), 0)
+
+    def run(self, stats_interval: float) -> None:
+        """Vòng lặp chính: consume, giao lô cho worker, lưu offset và commit định kỳ tới khi stop().
+
+        Args:
+            stats_interval: Chu kỳ ghi log thống kê (giây)
+        """
+        self.consumer.subscribe(self.topics, on_revoke=self._on_revoke)
+        self._running = True
+        self._started_at = last_commit = last_stats = time.monotonic()
+        logger.info(f"Consumer bắt đầu: topics={self.topics}, sự kiện={self.registry.event_types}")
+        try:
+            while self._running:
+                self._drain_completed()
+                self._dispatch(self.consumer.consume(num_messages=self.batch_size, timeout=self.poll_timeout))
+
+                now = time.monotonic()
+                if self._uncommitted and now - last_commit >= self.commit_interval:
+                    self._commit(asynchronous=True)
+                    last_commit = now
+                if now - last_stats >= stats_interval:
+                    logger.info(f"Consumer: {json.dumps(self.stats())}")
+                    last_stats = now
+        finally:
+            self._shutdown()
+
+    def stop(self) -> None:
+        """Yêu cầu dừng vòng lặp chính (gọi được từ signal handler)."""
+        self._running = False
+
+    def stats(self) -> dict:
+        """Thống kê của consumer (chỉ gọi từ luồng chính).
+
+        Returns:
+            dict: Số message đã nhận/xử lý/lỗi/bỏ qua, số lô, số lần commit, throughput trung bình và
+            gần nhất (message/giây), lag theo partition và tổng lag
+        """
+        now = time.monotonic()
+        with self._lock:
+            metrics = dict(self._metrics)
+        last_time, last_processed = self._last_stats
+        self._last_stats = (now, metrics["processed"])
+        metrics["throughput"] = round(metrics["processed"] / max(now - self._started_at, 1e-9), 2)
+        metrics["recent_throughput"] = round((metrics["processed"] - last_processed) / max(now - last_time, 1e-9), 2)
+        metrics["in_flight"] = len(self._in_flight)
+        metrics["lag"] = self._lag()
+        metrics["total_lag"] = sum(metrics["lag"].values())
+        return metrics
+
+    def _lag(self) -> dict:
+        """Lag (high watermark - vị trí hiện tại) của các partition đang được gán."""
+        lag = {}
+        try:
+            for partition in self.consumer.position(self.consumer.assignment()):
+                _, high = self.consumer.get_watermark_offsets(partition, cached=True) or (None, None)
+                if high is not None and partition.offset >= 0:
+                    lag[f"{partition.topic}[{partition.partition}]"] = max(high - partition.offset, 0)
+        except KafkaException as e:
+            logger.warning(f"Không thể lấy lag của consumer: {e}")
+        return lag
+
+    def _dispatch(self, messages: list) -> None:
+        """Gom message theo partition, pause partition và giao từng lô cho worker."""
+        batches = {}
+        for message in messages:
+            if message.error():
+                if message.error().code() != KafkaError._PARTITION_EOF:
+                    logger.error(f"Consumer lỗi: {message.error()}")
+                continue
+            batches.setdefault((message.topic(), message.partition()), []).append(message)
+
+        for key, batch in batches.items():
+            self._increase("consumed", len(batch))
+            self.consumer.pause([TopicPartition(*key)])
+            future = self._executor.submit(self._process, batch)
+            self._in_flight[key] = (future, batch[-1].offset(), len(batch))
+            future.add_done_callback(lambda future, key=key: self._completed.put((key, future)))
+
+    def _drain_completed(self) -> None:
+        """Lưu offset của các lô đã xử lý xong và resume partition tương ứng."""
+        while True:
+            try:
+                key, future = self._completed.get_nowait()
+            except Empty:
+                return
+            entry = self._in_flight.get(key)
+            # Lô đã được lưu offset khi rebalance
+            if entry is not None and entry[0] is future:
+                self._store_offset(key)
+
+    def _store_offset(self, key: tuple) -> None:
+        """Lưu offset của lô đã xử lý xong của partition key và resume partition."""
+        _, offset, count = self._in_flight.pop(key)
+        partition = TopicPartition(*key, offset + 1)
+        try:
+            self.consumer.store_offsets(offsets=[partition])
+            self.consumer.resume([partition])
+        except KafkaException as e:
+            # Partition đã bị thu hồi trong lúc xử lý
+            logger.warning(f"Không thể lưu offset {key}: {e}")
+        self._uncommitted += count
+
+    def _process(self, messages: list) -> None:
+        """Xử lý một lô message của một partition theo thứ tự (chạy trong worker)."""
+        events = []
+        for message in messages:
+            try:
+                events.append(event_codec.decode(message.value(), message.headers()))
+            except (TypeError, ValueError) as e:
+                self._increase("failed")
+                logger.error(f"Message {message.topic()}[{message.partition()}]@{message.offset()} không hợp lệ: {e}")
+
+        for event_type, group in groupby(events, key=lambda event: event.get("event")):
+            group = list(group)
+            handler = self.registry.get(event_type)
+            if handler is None:
+                self._increase("skipped", len(group))
+                continue
+            self._call(handler, event_type, group)
+
+    def _call(self, handler: callable, event_type: str, events: list) -> None:
+        """Gọi handler với một micro-batch, gọi lại khi lỗi."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.app.app_context():
+                    handler(events)
+                self._increase("processed", len(events))
+                self._increase("batches")
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._increase("failed", len(events))
+                    logger.error(f"Handler {handler.__name__} ({event_type}) lỗi, bỏ qua {len(events)} sự kiện: {e}")
+                    return
+                logger.warning(f"Handler {handler.__name__} ({event_type}) lỗi, thử lại lần {attempt + 1}: {e}")
+                time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    def _commit(self, asynchronous: bool) -> None:
+        try:
+            self.consumer.commit(asynchronous=asynchronous)
+            self._uncommitted = 0
+            self._increase("commits")
+        except KafkaException as e:
+            if e.args[0].code() != KafkaError._NO_OFFSET:
+                logger.error(f"Commit offset lỗi: {e}")
+
+    def _on_revoke(self, consumer, partitions: list) -> None:
+        """Rebalance: chờ các lô của partition bị thu hồi xử lý xong và commit trước khi trả partition."""
+        revoked = {(partition.topic, partition.partition) for partition in partitions}
+        keys = [key for key in self._in_flight if key in revoked]
+        wait([self._in_flight[key][0] for key in keys])
+        # Lưu offset trực tiếp từ _in_flight: callback của future có thể chưa chạy khi wait() trả về
+        for key in keys:
+            self._store_offset(key)
+        self._drain_completed()
+        self._commit(asynchronous=False)
+
+    def _shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._drain_completed()
+        self._commit(asynchronous=False)
+        logger.info(f"Consumer dừng: {json.dumps(self.stats())}")
+        self.consumer.close()
+
+    def _increase(self, metric: str, value: int = 1) -> None:
+        with self._lock:
+            self._metrics[metric] += value
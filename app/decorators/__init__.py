@@ -3,3 +3,10 @@
 from .validate_func import validate_func
 from .validate_request import validate_request
 from .transactional_with_lock import transactional_with_lock
+from .profile_query import profile_query
+from .require_admin_key import require_admin_key
+from .read_replica import read_replica
+from .conditional_get import conditional_get
+from .compress import compress
+from .if_match import if_match
+from .idempotent import idempotent
@@ -0,0 +1,34 @@
+# coding: utf8
+
+from functools import wraps
+from flask import g
+
+
+def compress(levels: dict = None, min_size: int = None, enabled: bool = True) -> callable:
+    """
+    Decorator chỉnh cấu hình nén response cho một route.
+
+    Ví dụ route xuất file dữ liệu lớn dùng mức nén thấp để giảm CPU, route trả ảnh/dữ liệu đã nén
+    thì tắt nén. Các giá trị không truyền dùng cấu hình chung (COMPRESSION_*).
+
+    Args:
+        levels: Mức nén theo thuật toán, ví dụ {"gzip": 1, "br": 1, "zstd": 1}
+        min_size: Kích thước tối thiểu (byte) để nén
+        enabled: Bật/tắt nén
+
+    Returns:
+        callable: Decorator function
+    """
+    options = {"enabled": enabled, "levels": levels or {}}
+    if min_size is not None:
+        options["min_size"] = min_size
+
+    def decorator(func: callable) -> callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            g.compression = options
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,37 @@
+# coding: utf8
+
+from functools import wraps
+from flask import request
+from werkzeug.http import quote_etag
+
+from app.middlewares.compression import etag_variants
+from app.utils import remove_none_in_dict
+
+
+def conditional_get(etag_func: callable) -> callable:
+    """
+    Decorator hỗ trợ GET có điều kiện (ETag / If-None-Match).
+
+    ETag được tính bởi etag_func từ tham số của request trước khi gọi hàm xử lý. Nếu khớp với
+    If-None-Match (kể cả ETag của bản đã nén, dạng <etag>-gzip), trả về 304 ngay mà không truy
+    vấn/định dạng dữ liệu; nếu không, kết quả được trả về kèm header ETag. Dùng sau validate_request
+    và trước format_response.
+
+    Args:
+        etag_func: Hàm nhận các tham số của request (đã bỏ None) và trả về giá trị ETag
+
+    Returns:
+        callable: Decorator function
+    """
+    def decorator(func: callable) -> callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            etag = etag_func(**remove_none_in_dict(kwargs))
+            for variant in etag_variants(etag):
+                if request.if_none_match.contains_weak(variant):
+                    return None, 304, {"ETag": quote_etag(variant)}
+            return func(*args, **kwargs), 200, {"ETag": quote_etag(etag)}
+
+        return wrapper
+
+    return decorator
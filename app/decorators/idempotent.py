@@ -0,0 +1,102 @@
+# coding: utf8
+
+from functools import wraps
+from flask import make_response, request, Response
+
+from app import db
+from app.decorators.transactional_with_lock import OUTER_TRANSACTION_KEY
+from app.exceptions.exception import BadRequest, CommonException
+from app.middlewares import error_response
+from app.utils.db_router import store_consistency_token
+
+import hashlib
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+def idempotent(scope: str) -> callable:
+    """
+    Decorator hỗ trợ header Idempotency-Key cho request ghi (ví dụ tạo booking).
+
+    Ghi key, xử lý request và lưu response nằm trong cùng một transaction (các decorator
+    transactional_with_lock bên trong chạy trong SAVEPOINT), nên response chỉ được lưu khi thay đổi của
+    request được commit và ngược lại. Request gửi lại đồng thời với cùng key chờ transaction đầu tiên
+    kết thúc rồi nhận lại response đã lưu (header Idempotent-Replayed: true) mà không validate/ghi lại;
+    cùng key nhưng khác nội dung trả về 422. Response 5xx không được lưu (toàn bộ transaction được
+    rollback để client thử lại). Request không có header được xử lý như bình thường.
+    Dùng trước (bên ngoài) format_response để lưu đúng response trả về client.
+
+    Args:
+        scope: Phạm vi của key (mỗi route một phạm vi)
+
+    Returns:
+        callable: Decorator function
+    """
+    def decorator(func: callable) -> callable:
+        # Import khi áp dụng decorator: app.decorators được import bởi tầng repository (trước app.services)
+        from app.services.idempotency import IdempotencyService
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+            if key is None:
+                return func(*args, **kwargs)
+
+            if not key or len(key) > MAX_KEY_LENGTH:
+                return error_response(BadRequest(f"{IDEMPOTENCY_KEY_HEADER} phải có từ 1 tới {MAX_KEY_LENGTH} ký tự"))
+
+            session = db.session
+            session.info[OUTER_TRANSACTION_KEY] = True
+            try:
+                try:
+                    stored = IdempotencyService.begin(scope, key, _request_hash())
+                except CommonException as error:
+                    session.rollback()
+                    return error_response(error)
+
+                if stored is not None:
+                    session.rollback()
+                    return Response(
+                        stored.response_body,
+                        status=stored.status_code,
+                        content_type=stored.content_type,
+                        headers={IDEMPOTENT_REPLAYED_HEADER: "true"}
+                    )
+
+                response = make_response(func(*args, **kwargs))
+                if response.status_code >= 500:
+                    session.rollback()
+                    return response
+
+                if response.is_streamed:
+                    IdempotencyService.release(scope, key)
+                else:
+                    IdempotencyService.complete(
+                        scope, key, response.status_code, response.get_data(as_text=True), response.content_type
+                    )
+                session.commit()
+                store_consistency_token(session)
+                return response
+
+            except Exception:
+                session.rollback()
+                raise
+
+            finally:
+                session.info.pop(OUTER_TRANSACTION_KEY, None)
+                session.close()
+
+        return wrapper
+
+    return decorator
+
+
+def _request_hash() -> str:
+    """Hash nội dung request (method, path, query string, body) để phát hiện key bị dùng lại cho request khác."""
+    digest = hashlib.sha256()
+    for part in (request.method, request.path, request.query_string.decode()):
+        digest.update(part.encode() + b"\n")
+    digest.update(request.get_data())
+    return digest.hexdigest()
@@ -0,0 +1,53 @@
+# coding: utf8
+
+from functools import wraps
+from flask import request
+from werkzeug.http import quote_etag
+
+from app.exceptions.exception import BadRequest, PreconditionFailed, VersionConflict
+from app.utils import parse_version_etag
+
+
+def if_match(id_key: str, etag_func: callable = None) -> callable:
+    """
+    Decorator bật cập nhật lạc quan (optimistic concurrency) theo header If-Match.
+
+    ETag trong If-Match (dạng "<id>.<version>" của make_version_etag, kể cả có hậu tố nén) được
+    đọc thành phiên bản và truyền cho hàm xử lý qua tham số version; khi phiên bản không khớp trả
+    về 412 (PreconditionFailed) thay cho 409. Không có If-Match (hoặc If-Match: *) thì hàm xử lý
+    chạy như bình thường. Dùng sau validate_request và trước format_response.
+
+    Args:
+        id_key: Tên tham số chứa ID của bản ghi (để đối chiếu với ID trong ETag)
+        etag_func: Hàm nhận kết quả của hàm xử lý và trả về ETag mới (trả về trong header ETag)
+
+    Returns:
+        callable: Decorator function
+    """
+    def decorator(func: callable) -> callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            precondition = bool(request.if_match) and not request.if_match.star_tag
+            if precondition:
+                etags = request.if_match.as_set()
+                if len(etags) != 1:
+                    raise BadRequest("If-Match chỉ hỗ trợ một ETag")
+                parsed = parse_version_etag(etags.pop())
+                if parsed is None or parsed[0] != kwargs.get(id_key):
+                    raise PreconditionFailed("ETag trong If-Match không khớp với bản ghi")
+                kwargs["version"] = parsed[1]
+
+            try:
+                result = func(*args, **kwargs)
+            except VersionConflict as e:
+                if precondition:
+                    raise PreconditionFailed(e.message)
+                raise e
+
+            if etag_func is None or result is None:
+                return result
+            return result, 200, {"ETag": quote_etag(etag_func(result))}
+
+        return wrapper
+
+    return decorator
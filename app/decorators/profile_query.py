@@ -0,0 +1,33 @@
+# coding: utf8
+
+from functools import wraps
+
+from app.utils.query_profiler import query_profiler
+
+
+def profile_query(name: str) -> callable:
+    """
+    Decorator gắn chữ ký bộ lọc cho các truy vấn của một phương thức repository.
+
+    Chữ ký có dạng "<bảng>.<name>:<các tham số lọc có giá trị>", ví dụ
+    "booking.paginate_all:phone,status", dùng để nhóm các mẫu truy vấn chậm.
+
+    Args:
+        name: Tên truy vấn
+
+    Returns:
+        callable: Decorator function
+    """
+    def decorator(func: callable) -> callable:
+        @wraps(func)
+        def wrapper(self, **kwargs):
+            if not query_profiler.enabled:
+                return func(self, **kwargs)
+
+            fields = ",".join(field for field in self.FILTER_FIELDS if kwargs.get(field))
+            with query_profiler.tag(f"{self.model.__tablename__}.{name}:{fields}"):
+                return func(self, **kwargs)
+
+        return wrapper
+
+    return decorator
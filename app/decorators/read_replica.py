@@ -0,0 +1,25 @@
+# coding: utf8
+
+from functools import wraps
+from flask import g
+
+
+def read_replica(func: callable) -> callable:
+    """
+    Decorator đánh dấu request chỉ đọc để các câu lệnh SELECT được chuyển sang replica.
+
+    Replica được chọn bởi ReplicaRouter (bỏ qua replica trễ quá ngưỡng và tôn trọng
+    header X-Consistency-Token), nếu không có replica phù hợp thì dùng primary.
+
+    Args:
+        func: Hàm xử lý route
+
+    Returns:
+        callable: Hàm đã được wrap
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        g.db_read_replica = True
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,36 @@
+# coding: utf8
+
+from functools import wraps
+from flask import request
+
+from app.constants.globals import ADMIN_API_KEY
+from app.exceptions.exception import Forbidden, Unauthorized
+
+import hmac
+
+
+def require_admin_key(func: callable) -> callable:
+    """
+    Decorator yêu cầu header X-Admin-Key khớp với ADMIN_API_KEY.
+
+    Các API quản trị bị tắt nếu ADMIN_API_KEY không được cấu hình.
+
+    Args:
+        func: Hàm xử lý route cần bảo vệ
+
+    Returns:
+        callable: Hàm đã được wrap
+
+    Raises:
+        Forbidden: Nếu ADMIN_API_KEY chưa được cấu hình
+        Unauthorized: Nếu header X-Admin-Key không hợp lệ
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not ADMIN_API_KEY:
+            raise Forbidden("API quản trị chưa được bật")
+        if not hmac.compare_digest(request.headers.get("X-Admin-Key", ""), ADMIN_API_KEY):
+            raise Unauthorized("X-Admin-Key không hợp lệ")
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -3,16 +3,30 @@
 from loguru import logger
 
 from app.constants.globals import TIMEOUT_VALUE
-from app.exceptions.exception import NotFound
+from app.exceptions.exception import NotFound, RequestConflict
 from functools import wraps
+from sqlalchemy.exc import OperationalError
 
 from app import db
+from app.utils.db_router import store_consistency_token
+
+# SQLSTATE lock_not_available: bản ghi đang bị lock bởi transaction khác (FOR UPDATE NOWAIT)
+LOCK_NOT_AVAILABLE = "55P03"
+# Đánh dấu trong session.info khi transaction được quản lý bởi bên ngoài (ví dụ decorator idempotent)
+OUTER_TRANSACTION_KEY = "outer_transaction"
 
 
 def transactional_with_lock(lock_models: list = None) -> callable:
     """
     Decorator quản lý transaction và lock bản ghi trong database.
 
+    Khi bản ghi đang bị lock bởi transaction khác, trả về lỗi 409 (RequestConflict) để client
+    thử lại thay vì lỗi 500.
+
+    Nếu session đang nằm trong transaction do bên ngoài quản lý (session.info[OUTER_TRANSACTION_KEY]),
+    hàm chạy trong một SAVEPOINT: lỗi chỉ rollback về SAVEPOINT, việc commit/đóng session do bên ngoài
+    thực hiện.
+
     Args:
         lock_models: Danh sách các tuple (model, filter_func), trong đó:
             - model: SQLAlchemy model class
@@ -22,7 +36,8 @@ def transactional_with_lock(lock_models: list = None) -> callable:
         wrapper: Hàm decorator đã được wrap
 
     Raises:
-        Exception: Khi không tìm thấy bản ghi cần lock
+        NotFound: Khi không tìm thấy bản ghi cần lock
+        RequestConflict: Khi bản ghi cần lock đang bị lock bởi transaction khác
     """
     def decorator(func: callable) -> callable:
         @wraps(func)
@@ -48,6 +63,7 @@ def transactional_with_lock(lock_models: list = None) -> callable:
                         raise ValueError("filter_func phải là một callable function")
 
             session = db.session
+            savepoint = session.begin_nested() if session.info.get(OUTER_TRANSACTION_KEY) else None
             locked_records = []
 
             try:
@@ -65,16 +81,27 @@ def transactional_with_lock(lock_models: list = None) -> callable:
                 # Gọi hàm chính
                 result = func(*args, **kwargs)
 
-                # Commit transaction
-                session.commit()
+                # Commit transaction (hoặc giải phóng SAVEPOINT)
+                if savepoint is not None:
+                    savepoint.commit()
+                else:
+                    session.commit()
+                    store_consistency_token(session)
                 return result
 
+            except OperationalError as e:
+                (savepoint or session).rollback()
+                if getattr(e.orig, "pgcode", None) == LOCK_NOT_AVAILABLE:
+                    raise RequestConflict("Bản ghi đang được cập nhật bởi yêu cầu khác, vui lòng thử lại")
+                raise e
+
             except Exception as e:
-                session.rollback()
+                (savepoint or session).rollback()
                 raise e
 
             finally:
-                session.close()
+                if savepoint is None:
+                    session.close()
 
         return wrapper
 
@@ -3,96 +3,166 @@
 from loguru import logger
 
 from datetime import datetime
-from jsonschema import validate, ValidationError, FormatChecker
+from jsonschema import ValidationError, FormatChecker
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from functools import wraps
 
 from app.exceptions.exception import BadRequest
 
 
-def validate_func(**schema) -> callable:
+def get_field_name(schema: dict, field: str) -> str:
     """
-    Decorator kiểm tra và xác thực tham số dựa trên JSON Schema.
+    Lấy tên cho trường từ schema nếu có.
 
     Args:
-        **schema: JSON Schema định nghĩa cấu trúc và ràng buộc của tham số
+        schema: JSON Schema
+        field: Tên trường cần lấy
 
     Returns:
-        Decorator function
+        Tên của trường hoặc tên trường gốc nếu không có tên của trường
     """
-    # Đảm bảo schema có properties
-    if schema and "properties" not in schema:
-        schema["properties"] = {}
+    try:
+        if field in schema["properties"] and "name" in schema["properties"][field]:
+            return schema["properties"][field]["name"]
+    except (KeyError, TypeError) as e:
+        logger.debug(e)
+    return field
 
-    def decorated(func):
-        def validate_required(params: dict) -> None:
-            """
-            Kiểm tra các trường bắt buộc trong params.
 
-            Args:
-                params: Các tham số cần kiểm tra
+FORMAT_CHECKER = FormatChecker()
+ERROR_TYPES = frozenset(("type", "format", "pattern", "maxLength", "minLength", "enum", "minimum", "maximum"))
+# Giới hạn số schema được biên dịch qua validate_params (schema tạo mới mỗi lần gọi)
+MAX_COMPILED_SCHEMAS = 256
 
-            Raises:
-                BadRequest: Nếu thiếu trường bắt buộc
-            """
-            for field in schema.get("required", []):
-                if field not in params or not params[field]:
-                    raise BadRequest(f"{get_field_name(field)} bắt buộc")
 
-        def get_field_name(field: str) -> str:
-            """
-            Lấy tên cho trường từ schema nếu có.
+class SchemaValidator:
+    """Validator đã được biên dịch sẵn từ JSON Schema.
 
-            Args:
-                field: Tên trường cần lấy
+    Schema được kiểm tra và validator jsonschema được tạo một lần khi khởi tạo, mỗi lần validate
+    chỉ lọc tham số, kiểm tra trường bắt buộc và chạy validator đã có.
 
-            Returns:
-                Tên của trường hoặc tên trường gốc nếu không có tên của trường
-            """
-            try:
-                if field in schema["properties"] and "name" in schema["properties"][field]:
-                    return schema["properties"][field]["name"]
-            except (KeyError, TypeError) as e:
-                logger.debug(e)
-            return field
-
-        def validate_properties(params: dict) -> None:
-            """
-            Kiểm tra tính hợp lệ của các tham số dựa trên schema.
+    Attributes:
+        schema: JSON Schema
+    """
 
-            Args:
-                params: Các tham số cần kiểm tra
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self.properties = frozenset(schema.get("properties", {}))
+        self.required = tuple(schema.get("required", ()))
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self.validator = validator_class(schema, format_checker=FORMAT_CHECKER)
 
-            Raises:
-                BadRequest: Nếu tham số không hợp lệ
-            """
-            try:
-                validate(instance=params, schema=schema, format_checker=FormatChecker())
-            except ValidationError as exp:
-                exp_info = list(exp.schema_path)
-                error_type = ("type", "format", "pattern", "maxLength", "minLength")
-                if set(exp_info).intersection(set(error_type)):
-                    try:
-                        field = exp_info[1]
-                        field_name = get_field_name(field)
-                        message = f"{field_name} không hợp lệ"
-                    except IndexError:
-                        message = "Dữ liệu không hợp lệ"
-                else:
-                    message = exp.message
-                raise BadRequest(message)
-
-        def remove_unexpected_params(params: dict) -> dict:
-            """
-            Loại bỏ các tham số không được định nghĩa trong schema.
+    def validate(self, params: dict) -> dict:
+        """Lọc và kiểm tra tham số theo schema.
 
-            Args:
-                params: Các tham số đầu vào
+        Args:
+            params: Các tham số đầu vào
+
+        Returns:
+            Dict các tham số hợp lệ theo schema
+
+        Raises:
+            BadRequest: Nếu thiếu trường bắt buộc hoặc tham số không hợp lệ
+        """
+        # Lọc các tham số hợp lệ
+        req_args = {field: value for field, value in params.items() if field in self.properties}
+
+        # Kiểm tra các trường bắt buộc
+        for field in self.required:
+            if not req_args.get(field):
+                raise BadRequest(f"{get_field_name(self.schema, field)} bắt buộc")
+
+        # Kiểm tra tính hợp lệ của các tham số (cùng lỗi được chọn như jsonschema.validate)
+        error = best_match(self.validator.iter_errors(req_args))
+        if error is not None:
+            raise_validation_error(self.schema, error)
+        return req_args
+
+
+def raise_validation_error(schema: dict, exp: ValidationError) -> None:
+    """
+    Chuyển lỗi của jsonschema thành BadRequest với thông báo theo tên trường.
+
+    Args:
+        schema: JSON Schema
+        exp: Lỗi validate
+
+    Raises:
+        BadRequest: Luôn raise
+    """
+    exp_info = list(exp.schema_path)
+    if ERROR_TYPES.intersection(exp_info):
+        try:
+            field = exp_info[1]
+            field_name = get_field_name(schema, field)
+            message = f"{field_name} không hợp lệ"
+        except IndexError:
+            message = "Dữ liệu không hợp lệ"
+    else:
+        message = exp.message
+    raise BadRequest(message)
+
+
+_compiled_schemas = {}
 
-            Returns:
-                Dict chỉ chứa các tham số hợp lệ theo schema
-            """
-            return {field: value for field, value in params.items() if field in schema.get("properties", {}).keys()}
 
+def compile_schema(schema: dict) -> SchemaValidator:
+    """
+    Lấy validator đã biên dịch của schema (biên dịch lần đầu và dùng lại cho các lần sau).
+
+    Args:
+        schema: JSON Schema (nên là hằng số dùng lại nhiều lần)
+
+    Returns:
+        SchemaValidator của schema
+    """
+    compiled = _compiled_schemas.get(id(schema))
+    # So sánh object để tránh dùng nhầm khi id của schema cũ được cấp lại
+    if compiled is None or compiled.schema is not schema:
+        if len(_compiled_schemas) >= MAX_COMPILED_SCHEMAS:
+            _compiled_schemas.clear()
+        compiled = _compiled_schemas[id(schema)] = SchemaValidator(schema)
+    return compiled
+
+
+def validate_params(schema: dict, params: dict) -> dict:
+    """
+    Lọc và kiểm tra tham số theo schema (dùng chung cho validate_func và kiểm tra từng phần tử
+    của request theo lô).
+
+    Args:
+        schema: JSON Schema
+        params: Các tham số đầu vào
+
+    Returns:
+        Dict các tham số hợp lệ theo schema
+
+    Raises:
+        BadRequest: Nếu thiếu trường bắt buộc hoặc tham số không hợp lệ
+    """
+    return compile_schema(schema).validate(params)
+
+
+def validate_func(**schema) -> callable:
+    """
+    Decorator kiểm tra và xác thực tham số dựa trên JSON Schema (schema được biên dịch một lần khi decorate).
+
+    Args:
+        **schema: JSON Schema định nghĩa cấu trúc và ràng buộc của tham số
+
+    Returns:
+        Decorator function
+    """
+    # Đảm bảo schema có properties
+    if schema and "properties" not in schema:
+        schema["properties"] = {}
+
+    # Biên dịch schema một lần khi decorate
+    validator = SchemaValidator(schema) if schema else None
+
+    def decorated(func):
         # def parse_params(params: dict) -> dict:
         #     """
         #     Chuyển đổi các tham số theo định nghĩa enum_type và list_enum_type trong schema.
@@ -146,15 +216,8 @@ def validate_func(**schema) -> callable:
             if not schema:
                 return func(*args, **kwargs)
 
-            # Lọc các tham số hợp lệ
-            req_args = remove_unexpected_params(kwargs)
-
-            # Kiểm tra các trường bắt buộc
-            if "required" in schema:
-                validate_required(req_args)
-
-            # Kiểm tra tính hợp lệ của các tham số
-            validate_properties(req_args)
+            # Lọc và kiểm tra các tham số theo schema
+            req_args = validator.validate(kwargs)
 
             # Chuyển đổi các tham số enum
             # parsed_args = parse_params(req_args)
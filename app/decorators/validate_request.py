@@ -1,9 +1,7 @@
 # coding: utf8
 
-from loguru import logger
-
 from functools import wraps
-from flask import request
+from flask import g, request
 
 from app.exceptions.exception import BadRequest
 
@@ -125,24 +123,115 @@ def parse_number(value, param_name: str, param_type: type) -> int | float:
         raise BadRequest(f"Trường {param_name} không hợp lệ")
 
 
-def log_request(url: str, data: dict) -> None:
-    """Log thông tin request.
+EMPTY_VALUES = (None, 0, "", [], {})
+
+
+def compile_param(param_name: str, param_attrs: dict) -> callable:
+    """Tạo hàm parse và kiểm tra giá trị của một tham số (thực hiện một lần khi decorate).
+
+    Args:
+        param_name: Tên tham số
+        param_attrs: Thuộc tính validate của tham số (xem validate_request)
+
+    Returns:
+        callable: Hàm nhận giá trị thô từ request và trả về giá trị đã parse
+
+    Raises:
+        BadRequest: (khi gọi hàm trả về) Nếu giá trị không hợp lệ
+    """
+    param_type = param_attrs.get("type", str)
+    param_required = param_attrs.get("required", False)
+    param_default = param_attrs.get("default", None)
+    min_value = param_attrs.get("min", None)
+    max_value = param_attrs.get("max", None)
+    check_bounds = min_value is not None or max_value is not None
+
+    def parse(param_value):
+        # Handle boolean
+        if param_type == bool:
+            param_value = parse_boolean(param_value, param_name, param_required, param_default)
+
+        # Check empty
+        if is_empty(param_value, param_type):
+            if param_required:
+                raise BadRequest(f"Trường {param_name} bắt buộc")
+            param_value = param_default
+
+        # Parse collections
+        if param_type in (list, dict):
+            param_value = parse_collection(param_value, param_name, param_type)
+        # Parse numbers
+        elif param_type in (int, float):
+            param_value = parse_number(param_value, param_name, param_type)
+        # Parse other types
+        elif param_type != bool:
+            try:
+                param_value = param_type(param_value) if param_value is not None else None
+            except (ValueError, TypeError):
+                raise BadRequest(f"Trường {param_name} không hợp lệ")
+
+        # Validate bounds (sau khi parse để so sánh đúng kiểu)
+        if check_bounds and param_value not in EMPTY_VALUES:
+            validate_bounds(param_value, param_name, param_type, min_value, max_value)
+        return param_value
+
+    return parse
+
+
+def compile_params(params: dict) -> list:
+    """Biên dịch các tham số của validate_request.
+
+    Args:
+        params: Thông tin validate cho từng tham số (xem validate_request)
+
+    Returns:
+        list: Danh sách tuple (tên tham số, vị trí, hàm parse)
+    """
+    return [
+        (param_name, param_attrs.get("location", "json"), compile_param(param_name, param_attrs))
+        for param_name, param_attrs in params.items()
+    ]
+
+
+def parse_request_params(compiled: list, body, query) -> dict:
+    """Parse toàn bộ tham số của request trong một lượt.
 
     Args:
-        url: URL của request
-        data: Dữ liệu request
+        compiled: Kết quả của compile_params
+        body: Body JSON của request (None nếu không có)
+        query: Query string của request (MultiDict)
+
+    Returns:
+        dict: Các tham số đã parse (bỏ các giá trị rỗng)
+
+    Raises:
+        BadRequest: Nếu tham số không hợp lệ
     """
-    logger.info("- Start log ----------------------------------------------------")
-    logger.info("Request URL:")
-    logger.info(url)
-    logger.info("Request data:")
-    logger.info(data)
-    logger.info("- End log ------------------------------------------------------")
+    if not isinstance(body, dict):
+        body = {}
+
+    validated_data = {}
+    for param_name, param_location, parse in compiled:
+        # Get param value
+        if param_location == "json":
+            param_value = body.get(param_name)
+        elif param_location == "value":
+            param_value = query.get(param_name)
+        else:
+            param_value = None
+
+        param_value = parse(param_value)
+        if param_value not in EMPTY_VALUES:
+            validated_data[param_name] = param_value
+    return validated_data
 
 
 def validate_request(params: dict) -> callable:
     """Decorator validate request parameters.
 
+    Các tham số được biên dịch thành hàm parse một lần khi decorate; mỗi request chỉ đọc body JSON
+    một lần và parse toàn bộ tham số trong một lượt.
+
     Args:
         params: Dictionary chứa thông tin validate cho từng tham số.
                Mỗi tham số có thể có các thuộc tính:
@@ -156,60 +245,16 @@ def validate_request(params: dict) -> callable:
     Returns:
         function: Decorated function
     """
+    compiled = compile_params(params)
+    read_json = any(location == "json" for _, location, _ in compiled)
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            validated_data = {}
-
-            for param_name, param_attrs in params.items():
-                param_type = param_attrs.get("type", str)
-                param_required = param_attrs.get("required", False)
-                param_default = param_attrs.get("default", None)
-                param_location = param_attrs.get("location", "json")
-                min_value = param_attrs.get("min", None)
-                max_value = param_attrs.get("max", None)
-
-                # Get param value
-                if param_location == "json":
-                    param_value = request.json.get(param_name) if request.is_json else None
-                elif param_location == "value":
-                    param_value = request.args.get(param_name)
-                else:
-                    param_value = None
-
-                # Handle boolean
-                if param_type == bool:
-                    param_value = parse_boolean(param_value, param_name, param_required, param_default)
-
-                # Check empty
-                if is_empty(param_value, param_type):
-                    if param_required:
-                        raise BadRequest(f"Trường {param_name} bắt buộc")
-                    param_value = param_default
-
-                # Parse collections
-                if param_type in [list, dict]:
-                    param_value = parse_collection(param_value, param_name, param_type)
-
-                # Validate bounds
-                if param_value not in [None, 0, "", [], {}]:
-                    validate_bounds(param_value, param_name, param_type, min_value, max_value)
-
-                # Parse numbers
-                if param_type in [int, float]:
-                    param_value = parse_number(param_value, param_name, param_type)
-                # Parse other types
-                elif param_type != bool:
-                    try:
-                        param_value = param_type(param_value) if param_value is not None else None
-                    except (ValueError, TypeError):
-                        raise BadRequest(f"Trường {param_name} không hợp lệ")
-
-                if param_value not in [None, 0, "", [], {}]:
-                    validated_data[param_name] = param_value
-
-            kwargs.update(validated_data)
-            log_request(request.url, kwargs)
+            body = request.get_json() if read_json and request.is_json else None
+            kwargs.update(parse_request_params(compiled, body, request.args))
+            # Tham số đã validate được ghi trong log của request (đã che PII)
+            g.request_params = kwargs
             return func(*args, **kwargs)
         return wrapper
     return decorator
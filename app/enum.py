@@ -63,6 +63,34 @@ class BookingStatus(EnumInterface):
     NOSHOW = "noshow"
     CANCEL = "cancel"
 
+    @classmethod
+    def sources_of(cls, target: str) -> list:
+        """Lấy danh sách trạng thái được phép chuyển sang trạng thái target.
+
+        Args:
+            target: Giá trị trạng thái đích
+
+        Returns:
+            list: Danh sách giá trị trạng thái nguồn hợp lệ
+        """
+        return [
+            source.value
+            for source, targets in BOOKING_STATUS_TRANSITIONS.items()
+            if cls.has_value(target) and cls(target) in targets
+        ]
+
+
+# Các chuyển trạng thái booking hợp lệ: trạng thái nguồn -> tập trạng thái đích
+BOOKING_STATUS_TRANSITIONS = {
+    BookingStatus.NEW: {BookingStatus.CONTACTED, BookingStatus.APPROVED, BookingStatus.REJECTED, BookingStatus.CANCEL},
+    BookingStatus.CONTACTED: {BookingStatus.APPROVED, BookingStatus.REJECTED, BookingStatus.CANCEL},
+    BookingStatus.APPROVED: {BookingStatus.USED, BookingStatus.NOSHOW, BookingStatus.CANCEL},
+    BookingStatus.REJECTED: set(),
+    BookingStatus.USED: set(),
+    BookingStatus.NOSHOW: set(),
+    BookingStatus.CANCEL: set(),
+}
+
 
 class HTTPStatusCode(EnumInterface):
     """Enum mã trạng thái HTTP."""
@@ -73,8 +101,81 @@ class HTTPStatusCode(EnumInterface):
     CLIENT_ERROR_METHOD_NOT_ALLOWED = 405
     CLIENT_ERROR_REQUEST_TIME_OUT = 408
     CLIENT_ERROR_REQUEST_CONFLICT = 409
+    CLIENT_ERROR_PRECONDITION_FAILED = 412
     CLIENT_ERROR_UNPROCESSABLE_ENTITY = 422
     SERVER_ERROR_INTERNAL_SERVER_ERROR = 500
     SERVER_ERROR_BAD_GATEWAY = 502
     SERVER_ERROR_SERVICE_UNAVAILABLE = 503
     SERVER_ERROR_GATEWAY_TIMEOUT = 504
+
+
+class PaginationMode(EnumInterface):
+    """Enum chế độ phân trang danh sách."""
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+class CountMode(EnumInterface):
+    """Enum cách tính tổng số bản ghi khi phân trang."""
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+class KafkaProducerMode(EnumInterface):
+    """Enum chế độ gửi message Kafka."""
+    SYNC = "sync"
+    ASYNC = "async"
+
+
+class BookingEvent(EnumInterface):
+    """Enum loại sự kiện booking."""
+    CREATED = "booking_created"
+    UPDATED = "booking_updated"
+    STATUS_CHANGED = "booking_status_changed"
+    DELETED = "booking_deleted"
+
+
+class EventCodecFormat(EnumInterface):
+    """Enum định dạng mã hóa sự kiện gửi qua Kafka."""
+    MSGPACK = "msgpack"
+    JSON = "json"
+
+
+class ContentEncoding(EnumInterface):
+    """Enum thuật toán nén response (theo thứ tự ưu tiên khi client chấp nhận như nhau)."""
+    ZSTD = "zstd"
+    BR = "br"
+    GZIP = "gzip"
+
+
+class JsonSerializer(EnumInterface):
+    """Enum thư viện serialize JSON của response."""
+    ORJSON = "orjson"
+    STDLIB = "stdlib"
+
+
+class EventPublishMode(EnumInterface):
+    """Enum cách phát sự kiện booking."""
+    OUTBOX = "outbox"
+    DIRECT = "direct"
+
+
+class BackpressurePolicy(EnumInterface):
+    """Enum cách xử lý khi hàng đợi gửi Kafka đầy."""
+    BLOCK = "block"
+    DROP = "drop"
+    ERROR = "error"
+
+
+class ExportFormat(EnumInterface):
+    """Enum định dạng file xuất danh sách đặt chỗ."""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class NameMatchMode(EnumInterface):
+    """Enum cách so khớp khi tìm kiếm theo tên khách hàng."""
+    CONTAINS = "contains"
+    PREFIX = "prefix"
+    FUZZY = "fuzzy"
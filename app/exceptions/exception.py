@@ -76,6 +76,17 @@ class RequestConflict(CommonException):
     message = "Request Conflict"
 
 
+class VersionConflict(RequestConflict):
+    """Lỗi phiên bản bản ghi không khớp khi cập nhật lạc quan (409)."""
+    message = "Bản ghi đã bị thay đổi bởi yêu cầu khác, vui lòng tải lại"
+
+
+class PreconditionFailed(CommonException):
+    """Lỗi Precondition Failed (412)."""
+    status_code = HTTPStatusCode.CLIENT_ERROR_PRECONDITION_FAILED
+    message = "Precondition Failed"
+
+
 class UnprocessableEntity(CommonException):
     """Lỗi Unprocessable Entity (422)."""
     status_code = HTTPStatusCode.CLIENT_ERROR_UNPROCESSABLE_ENTITY
@@ -1,3 +1,4 @@
 # coding: utf8
 
-from .response import format_response
+from .response import format_response, error_response
+from .compression import compression, etag_variants
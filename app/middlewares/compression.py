@@ -0,0 +1,226 @@
+# coding: utf8
+
+from flask import g, request, Response
+from itertools import chain
+
+from app.constants.globals import (
+    COMPRESSION_ENABLED, COMPRESSION_LEVEL_BR, COMPRESSION_LEVEL_GZIP, COMPRESSION_LEVEL_ZSTD, COMPRESSION_MIN_SIZE
+)
+from app.enum import ContentEncoding
+
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_MIMETYPES = frozenset((
+    "application/json", "application/x-ndjson", "text/csv", "text/plain", "text/html",
+))
+
+
+class GzipStream:
+    """Bộ nén gzip theo từng khối."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes, flush: bool) -> bytes:
+        data = self._compressor.compress(chunk)
+        return data + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else data
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliStream:
+    """Bộ nén brotli theo từng khối."""
+
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, chunk: bytes, flush: bool) -> bytes:
+        data = self._compressor.process(chunk)
+        return data + self._compressor.flush() if flush else data
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdStream:
+    """Bộ nén zstd theo từng khối."""
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk: bytes, flush: bool) -> bytes:
+        data = self._compressor.compress(chunk)
+        return data + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else data
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# Thuật toán khả dụng (đã cài thư viện) theo thứ tự ưu tiên
+STREAMS = {
+    encoding: stream
+    for encoding, stream, available in (
+        (ContentEncoding.ZSTD.value, ZstdStream, zstandard is not None),
+        (ContentEncoding.BR.value, BrotliStream, brotli is not None),
+        (ContentEncoding.GZIP.value, GzipStream, True),
+    )
+    if available
+}
+
+
+def etag_variants(etag: str) -> list:
+    """Các giá trị ETag của cùng một nội dung (gốc và sau khi nén bằng từng thuật toán).
+
+    Args:
+        etag: ETag gốc (chưa quote)
+
+    Returns:
+        list: [etag, etag-zstd, etag-br, etag-gzip]
+    """
+    return [etag] + [f"{etag}-{encoding}" for encoding in STREAMS]
+
+
+class Compression:
+    """Nén response theo Accept-Encoding của client.
+
+    Thuật toán được chọn theo giá trị q trong Accept-Encoding, nếu bằng nhau thì theo thứ tự
+    zstd > br > gzip (brotli/zstd chỉ dùng khi đã cài thư viện). Chỉ nén nội dung dạng văn bản
+    (JSON, NDJSON, CSV) lớn hơn min_size byte. Response dạng stream được đọc trước các khối đầu
+    cho tới khi vượt min_size rồi nén từng khối (flush sau mỗi khối để client nhận dần dữ liệu).
+    ETag của response đã nén được thêm hậu tố -<thuật toán>.
+
+    Mức nén và min_size có thể chỉnh cho từng route bằng decorator compress.
+
+    Attributes:
+        enabled: Bật/tắt nén
+        min_size: Kích thước tối thiểu (byte) để nén
+        levels: Mức nén mặc định theo thuật toán
+    """
+
+    def __init__(self, enabled: bool, min_size: int, levels: dict):
+        self.enabled = enabled
+        self.min_size = min_size
+        self.levels = levels
+
+    def init_app(self, app) -> None:
+        """Đăng ký xử lý nén sau mỗi request.
+
+        Args:
+            app: Ứng dụng Flask
+        """
+        if self.enabled:
+            app.after_request(self._compress_response)
+
+    def negotiate(self) -> str | None:
+        """Chọn thuật toán nén theo Accept-Encoding của request.
+
+        Returns:
+            str | None: Thuật toán được chọn hoặc None nếu client không chấp nhận thuật toán nào
+        """
+        best, best_quality = None, 0
+        for encoding in STREAMS:
+            quality = request.accept_encodings.quality(encoding)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def _compress_response(self, response: Response) -> Response:
+        options = g.get("compression") or {}
+        if (
+            options.get("enabled") is False
+            or response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or request.method == "HEAD"
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or "no-transform" in response.headers.get("Cache-Control", "")
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = self.negotiate()
+        if encoding is None:
+            return response
+
+        min_size = options.get("min_size", self.min_size)
+        level = options.get("levels", {}).get(encoding, self.levels[encoding])
+        if response.is_streamed:
+            chunks, head = self._peek(response.response, min_size)
+            if chunks is None:
+                response.set_data(head)
+                return self._compress_data(response, encoding, level, min_size)
+            response.response = self._compress_stream(chain([head], chunks), STREAMS[encoding](level))
+            response.headers.pop("Content-Length", None)
+        else:
+            return self._compress_data(response, encoding, level, min_size)
+
+        self._mark(response, encoding)
+        return response
+
+    def _compress_data(self, response: Response, encoding: str, level: int, min_size: int) -> Response:
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        stream = STREAMS[encoding](level)
+        response.set_data(stream.compress(data, flush=False) + stream.finish())
+        self._mark(response, encoding)
+        return response
+
+    @staticmethod
+    def _peek(iterable, min_size: int) -> tuple:
+        """Đọc trước các khối đầu của stream cho tới khi vượt min_size.
+
+        Returns:
+            tuple: (iterator các khối còn lại hoặc None nếu đã đọc hết stream, nội dung đã đọc)
+        """
+        iterator = iter(iterable)
+        head = b""
+        for chunk in iterator:
+            head += chunk.encode() if isinstance(chunk, str) else chunk
+            if len(head) >= min_size:
+                return iterator, head
+        if hasattr(iterable, "close"):
+            iterable.close()
+        return None, head
+
+    @staticmethod
+    def _compress_stream(chunks, stream):
+        try:
+            for chunk in chunks:
+                chunk = chunk.encode() if isinstance(chunk, str) else chunk
+                if chunk:
+                    yield stream.compress(chunk, flush=True)
+            yield stream.finish()
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+    @staticmethod
+    def _mark(response: Response, encoding: str) -> None:
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(f"{etag}-{encoding}", weak=weak)
+
+
+compression = Compression(
+    enabled=COMPRESSION_ENABLED,
+    min_size=COMPRESSION_MIN_SIZE,
+    levels={
+        ContentEncoding.GZIP.value: COMPRESSION_LEVEL_GZIP,
+        ContentEncoding.BR.value: COMPRESSION_LEVEL_BR,
+        ContentEncoding.ZSTD.value: COMPRESSION_LEVEL_ZSTD,
+    }
+)
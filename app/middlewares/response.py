@@ -1,6 +1,6 @@
 # coding: utf8
 
-from flask import jsonify, Response
+from flask import g, jsonify, Response
 from loguru import logger
 from werkzeug.exceptions import HTTPException
 from functools import wraps
@@ -27,6 +27,9 @@ def format_response(f) -> callable:
             *args: Tham số positional
             **kwargs: Tham số keyword
 
+        Hàm xử lý có thể trả về data, (data, status_code) hoặc (data, status_code, headers).
+        Status 304 được trả về không có body.
+
         Returns:
             Response | tuple[Response, int]: Response đã được định dạng hoặc tuple gồm response và status code
 
@@ -36,7 +39,6 @@ def format_response(f) -> callable:
             Exception: Các lỗi khác
         """
         try:
-            logger.info(1)
             response = f(*args, **kwargs)
 
             # Nếu response đã là Response object
@@ -44,28 +46,29 @@ def format_response(f) -> callable:
                 return response
 
             # Format success response
-            if isinstance(response, tuple):
+            headers = None
+            if isinstance(response, tuple) and len(response) == 3:
+                data, status_code, headers = response
+            elif isinstance(response, tuple):
                 data, status_code = response
             else:
                 data, status_code = response, 200
 
+            if status_code == 304:
+                return Response(status=304, headers=headers)
+
             response_data = {
                 "success": True
             }
             if data:
                 response_data['data'] = data
 
-            return jsonify(response_data), status_code
+            return jsonify(response_data), status_code, headers
 
         except Exception as error:
-            logger.info(2)
-            # Format error response
+            # Format error response (lỗi nghiệp vụ được ghi trong log của request)
             if isinstance(error, CommonException):
-                logger.warning(f"HTTP_STATUS_CODE: {error.status_code.value} - {error.to_dict}")
-                return jsonify({
-                    "success": False,
-                    "error": error.to_dict
-                }), error.status_code.value
+                return error_response(error)
 
             if isinstance(error, HTTPException):
                 return jsonify({
@@ -77,6 +80,7 @@ def format_response(f) -> callable:
                 }), error.code
 
             logger.exception(error)
+            g.request_error = {"code": 500, "message": repr(error)}
             return jsonify({
                 "success": False,
                 "error": {
@@ -86,3 +90,20 @@ def format_response(f) -> callable:
             }), 500
 
     return decorated_function
+
+
+def error_response(error: CommonException) -> tuple[Response, int]:
+    """
+    Tạo response lỗi nghiệp vụ theo định dạng chuẩn (lỗi được ghi trong log của request).
+
+    Args:
+        error: Lỗi nghiệp vụ
+
+    Returns:
+        tuple[Response, int]: Response và status code
+    """
+    g.request_error = error.to_dict
+    return jsonify({
+        "success": False,
+        "error": error.to_dict
+    }), error.status_code.value
@@ -3,3 +3,8 @@
 from .base import BaseModel
 
 from .booking import BookingModel
+from .booking_summary import BookingSummaryHourlyModel
+from .booking_generation import BookingGenerationModel
+from .query_sample import QuerySampleModel
+from .outbox_event import OutboxEventModel
+from .idempotency_key import IdempotencyKeyModel
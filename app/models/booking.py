@@ -6,6 +6,7 @@ from app import db
 from app.enum import BookingStatus
 from app.models import BaseModel
 from sqlalchemy.dialects.postgresql import ENUM, TIMESTAMP
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 booking_status_enum = ENUM(
@@ -26,6 +27,11 @@ class BookingModel(BaseModel):
 
     id = db.Column(db.BigInteger, primary_key=True)
     customer_name = db.Column(db.String(100), nullable=False)
+    # Tên đã chuẩn hóa (chữ thường, bỏ dấu) để tìm kiếm, do database tự tính
+    customer_name_normalized = deferred(db.Column(
+        db.String(100),
+        db.Computed("f_unaccent(lower(customer_name))", persisted=True)
+    ))
     phone = db.Column(db.BigInteger, nullable=False)
     booking_date = db.Column(TIMESTAMP(timezone=True), nullable=False)
     status = db.Column(booking_status_enum, nullable=False, default='new')
@@ -33,6 +39,8 @@ class BookingModel(BaseModel):
     created_at = db.Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
     updated_at = db.Column(TIMESTAMP(timezone=True))
     is_deleted = db.Column(db.Boolean, nullable=False, default=False)
+    # Phiên bản bản ghi, do trigger booking_version_bump tăng sau mỗi lần UPDATE
+    version = db.Column(db.BigInteger, nullable=False, server_default="1", server_onupdate=db.FetchedValue())
 
     def __init__(self, *args, **kwargs):
         """
@@ -0,0 +1,16 @@
+# coding: utf8
+
+from app import db
+
+
+class BookingGenerationModel(db.Model):
+    """
+    Model đại diện cho bảng booking_generation trong database.
+    Bộ đếm được chia theo slot; trigger tăng value của slot ứng với kết nối sau mỗi câu lệnh ghi
+    trên bảng booking. Thế hệ ghi là tổng value của mọi slot.
+    """
+
+    __tablename__ = 'booking_generation'
+
+    slot = db.Column(db.Integer, primary_key=True)
+    value = db.Column(db.BigInteger, nullable=False, default=0)
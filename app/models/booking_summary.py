@@ -0,0 +1,19 @@
+# coding: utf8
+
+from app import db
+from app.models.booking import booking_status_enum
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+
+
+class BookingSummaryHourlyModel(db.Model):
+    """
+    Model đại diện cho bảng booking_summary_hourly trong database.
+    Số lượng booking chưa xóa theo giờ (UTC) của booking_date và trạng thái,
+    được cập nhật tăng dần bởi trigger trên bảng booking.
+    """
+
+    __tablename__ = 'booking_summary_hourly'
+
+    bucket = db.Column(TIMESTAMP(timezone=True), primary_key=True)
+    status = db.Column(booking_status_enum, primary_key=True)
+    total = db.Column(db.BigInteger, nullable=False, default=0)
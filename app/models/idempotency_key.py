@@ -0,0 +1,23 @@
+# coding: utf8
+
+from app import db
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.sql import func
+
+
+class IdempotencyKeyModel(db.Model):
+    """
+    Model đại diện cho bảng idempotency_key trong database.
+    Lưu response của request có header Idempotency-Key để trả lại khi client gửi lại request.
+    """
+
+    __tablename__ = 'idempotency_key'
+
+    scope = db.Column(db.String(100), primary_key=True)
+    key = db.Column(db.String(255), primary_key=True)
+    request_hash = db.Column(db.String(64), nullable=False)
+    status_code = db.Column(db.Integer, nullable=True)
+    response_body = db.Column(db.Text, nullable=True)
+    content_type = db.Column(db.String(100), nullable=True)
+    created_at = db.Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    expires_at = db.Column(TIMESTAMP(timezone=True), nullable=False)
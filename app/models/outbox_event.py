@@ -0,0 +1,24 @@
+# coding: utf8
+
+from app import db
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy.sql import func
+
+
+class OutboxEventModel(db.Model):
+    """
+    Model đại diện cho bảng booking_outbox trong database.
+    Sự kiện được ghi cùng transaction với thay đổi của booking và được relay gửi tới Kafka.
+    """
+
+    __tablename__ = 'booking_outbox'
+
+    id = db.Column(db.BigInteger, primary_key=True)
+    topic = db.Column(db.String(255), nullable=False)
+    message_key = db.Column(db.String(255), nullable=False)
+    event_type = db.Column(db.String(50), nullable=False)
+    payload = db.Column(JSONB, nullable=False)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    sent_at = db.Column(TIMESTAMP(timezone=True), nullable=True)
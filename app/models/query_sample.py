@@ -0,0 +1,21 @@
+# coding: utf8
+
+from app import db
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+from sqlalchemy.sql import func
+
+
+class QuerySampleModel(db.Model):
+    """
+    Model đại diện cho bảng query_sample trong database.
+    Lưu mẫu các truy vấn chậm kèm plan thực thi, dùng cho việc gợi ý index.
+    """
+
+    __tablename__ = 'query_sample'
+
+    id = db.Column(db.BigInteger, primary_key=True)
+    signature = db.Column(db.String(255), nullable=False)
+    duration_ms = db.Column(db.Float, nullable=False)
+    statement = db.Column(db.Text, nullable=False)
+    plan = db.Column(JSONB, nullable=True)
+    created_at = db.Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
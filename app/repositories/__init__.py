@@ -3,3 +3,6 @@
 from .base import BaseRepository
 
 from .booking import booking_repo
+from .query_sample import query_sample_repo
+from .outbox import outbox_repo
+from .idempotency import idempotency_repo
@@ -1,7 +1,5 @@
 # coding: utf8
 
-from loguru import logger
-
 from app import db
 from app.utils import paginate_format
 from app.models import BaseModel
@@ -12,7 +10,10 @@ class BaseRepository:
 
     Attributes:
         model: Model class được quản lý bởi repository
+        FILTER_FIELDS: Tên các tham số lọc mà repository hỗ trợ
     """
+    FILTER_FIELDS = ()
+
     def __init__(self, model):
         """Khởi tạo repository với model tương ứng."""
         self.model = model
@@ -64,6 +65,21 @@ class BaseRepository:
         entity.save()
         return entity
 
+    def add(self, **kwargs) -> BaseModel:
+        """Thêm mới bản ghi trong transaction hiện tại (flush, không commit).
+
+        Args:
+            **kwargs: Các trường dữ liệu của bản ghi
+
+        Returns:
+            object: Bản ghi đã được thêm mới (đã có ID và giá trị mặc định từ database)
+        """
+        entity = self.model(**kwargs)
+        db.session.add(entity)
+        db.session.flush()
+        db.session.refresh(entity)
+        return entity
+
     def update_by_id(self, entity_id: int, **kwargs) -> BaseModel:
         """Cập nhật bản ghi theo ID (yêu cầu entity đã được lock trước đó).
 
@@ -80,18 +96,21 @@ class BaseRepository:
             if hasattr(entity, key):
                 setattr(entity, key, value)
 
-        logger.info(kwargs)
-
         db.session.flush()
         db.session.refresh(entity)
         return entity
 
-    def delete_by_id(self, entity_id: int) -> None:
+    def delete_by_id(self, entity_id: int) -> BaseModel:
         """Xóa mềm bản ghi theo ID (yêu cầu entity đã được lock trước đó).
 
         Args:
             entity_id: ID của bản ghi cần xóa
+
+        Returns:
+            object: Bản ghi đã xóa
         """
         entity = db.session.query(self.model).filter(self.model.id == entity_id).first()
         # Không cần kiểm tra sự tồn tại của bản ghi vì decorator đã lock và đảm bảo entity tồn tại
         entity.is_deleted = True
+        db.session.flush()
+        return entity
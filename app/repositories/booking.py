@@ -1,28 +1,72 @@
 # coding: utf8
 
-from app.models import BookingModel
+from collections.abc import Iterator
+from datetime import datetime
+from sqlalchemy import and_, any_, bindparam, func, insert, literal, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
+
+from app import db
+from app.constants.globals import (
+    COUNT_CACHE_MAX_SIZE, COUNT_CACHE_TTL, COUNT_ESTIMATE_THRESHOLD, EXPORT_FETCH_SIZE, MAX_BATCH_SIZE
+)
+from app.decorators import profile_query
+from app.enum import CountMode, NameMatchMode
+from app.models import BookingModel, BookingGenerationModel, BookingSummaryHourlyModel
 from app.repositories.base import BaseRepository
-from app.utils import paginate_format
+from app.utils import TTLCache, page_format, cursor_paginate_format, decode_cursor
+from app.utils.search_helper import escape_like, normalize_search_text
 
 
 class BookingRepository(BaseRepository):
     """Repository xử lý truy vấn dữ liệu cho đặt phòng.
 
     Class này cung cấp phương thức để lấy danh sách đặt phòng có phân trang và lọc theo các tiêu chí.
+    Các phương thức đọc dùng Core select() trên READ_COLUMNS và trả về Row (tuple gọn nhẹ),
+    không tạo ORM instance và không đưa vào identity map của session.
 
     Inheritance:
         BaseRepository: Kế thừa các phương thức cơ bản từ base repository
     """
 
+    FILTER_FIELDS = (
+        "customer_name", "name_match", "phone", "booking_from", "booking_to", "status", "created_from", "created_to"
+    )
+
+    READ_COLUMNS = (
+        BookingModel.id,
+        BookingModel.customer_name,
+        BookingModel.phone,
+        BookingModel.booking_date,
+        BookingModel.status,
+        BookingModel.note,
+        BookingModel.created_at,
+        BookingModel.updated_at,
+        BookingModel.version,
+    )
+
+    # Các trường được phép cập nhật qua update_returning
+    UPDATE_FIELDS = ("customer_name", "phone", "booking_date", "status", "note")
+
+    # Advisory lock theo số điện thoại, lấy theo thứ tự tăng dần (lock_phones)
+    LOCK_PHONES_SQL = text(
+        "SELECT pg_advisory_xact_lock(hashtextextended('booking_phone:' || phone, 0)) "
+        "FROM (SELECT DISTINCT unnest(CAST(:phones AS int8[])) AS phone ORDER BY phone) AS phones"
+    )
+
     def __init__(self):
         super().__init__(BookingModel)
+        self.count_cache = TTLCache(max_size=COUNT_CACHE_MAX_SIZE, ttl=COUNT_CACHE_TTL)
 
+    @profile_query("paginate_all")
     def paginate_all(self, **kwargs) -> object:
         """Lấy danh sách đặt phòng có phân trang và lọc.
 
         Args:
             kwargs: Các tham số lọc và phân trang
-                - customer_name (str, optional): Lọc theo tên khách hàng
+                - customer_name (str, optional): Lọc theo tên khách hàng (không phân biệt dấu),
+                  kết quả được sắp xếp theo độ liên quan
+                - name_match (str, optional): Cách so khớp tên (contains/prefix/fuzzy), mặc định contains
                 - phone (str, optional): Lọc theo số điện thoại
                 - booking_from (datetime, optional): Lọc từ ngày đặt phòng
                 - booking_to (datetime, optional): Lọc đến ngày đặt phòng
@@ -31,17 +75,570 @@ class BookingRepository(BaseRepository):
                 - created_to (datetime, optional): Lọc đến ngày tạo
                 - page (int, optional): Trang (số) đích
                 - size (int, optional): Số lượng item mỗi trang
+                - count (str, optional): Cách tính tổng số bản ghi (exact/estimate/none), mặc định exact
+
+        Returns:
+            object: Đối tượng pagination đã được format thêm thông tin phân trang, items là danh sách Row.
+        """
+        page = kwargs.get("page")
+        size = kwargs.get("size")
+        count_mode = kwargs.get("count") or CountMode.EXACT.value
+        statement = self._apply_filters(self._select_active(), **kwargs)
+
+        items = db.session.execute(self._page_statement(statement, **kwargs)).all()
+
+        if count_mode == CountMode.EXACT.value:
+            total = self._count_total(statement)
+        elif count_mode == CountMode.ESTIMATE.value:
+            total = self._estimate_total(statement, **kwargs)
+        else:
+            total = None
+
+        return page_format(items[:size], page, size, total, len(items) > size)
+
+    @profile_query("paginate_cursor")
+    def paginate_cursor(self, **kwargs) -> object:
+        """Lấy danh sách đặt phòng phân trang theo cursor (keyset).
+
+        Trang được xác định bởi vị trí (created_at, id) của bản ghi làm mốc thay vì OFFSET,
+        không cần truy vấn COUNT(*) nên độ trễ không phụ thuộc vào độ sâu của trang.
+        Khi tìm theo tên, kết quả vẫn được sắp xếp theo thời gian tạo (không theo độ liên quan).
+
+        Args:
+            kwargs: Các tham số lọc giống paginate_all và
+                - cursor (str, optional): Cursor nhận từ next_cursor/prev_cursor của trang trước
+                - size (int, optional): Số lượng item mỗi trang
 
         Returns:
-            object: Đối tượng pagination đã được format thêm thông tin phân trang.
+            object: Đối tượng phân trang theo cursor, items là danh sách Row
         """
+        statement, backward = self._cursor_statement(**kwargs)
+        items = db.session.execute(statement).all()
+        return self._cursor_page(items, backward, **kwargs)
+
+    def _page_statement(self, statement, **kwargs):
+        """Câu lệnh lấy một trang theo số trang (OFFSET/LIMIT).
+
+        Lấy dư 1 bản ghi để xác định has_next mà không phụ thuộc vào tổng số bản ghi.
+
+        Args:
+            statement: Câu lệnh select đã áp dụng bộ lọc
+            kwargs: Các tham số lọc và phân trang (page, size)
+
+        Returns:
+            Select: Câu lệnh select
+        """
+        page, size = kwargs.get("page"), kwargs.get("size")
+        return statement.order_by(
+            *self._listing_order(**kwargs)
+        ).offset((page - 1) * size).limit(size + 1)
+
+    def _cursor_statement(self, **kwargs) -> tuple:
+        """Câu lệnh lấy một trang theo cursor (lấy dư 1 bản ghi để biết còn trang tiếp theo hay không).
+
+        Args:
+            kwargs: Các tham số lọc và phân trang giống paginate_cursor
+
+        Returns:
+            tuple: (câu lệnh select, True nếu đọc ngược về trang trước)
+        """
+        size = kwargs.get("size")
+        cursor = kwargs.get("cursor")
+        backward = False
+
+        statement = self._apply_filters(self._select_active(), **kwargs)
+
+        if cursor:
+            created_at, entity_id, backward = decode_cursor(cursor)
+            position = tuple_(self.model.created_at, self.model.id)
+            if backward:
+                statement = statement.filter(position > tuple_(created_at, entity_id)).order_by(
+                    self.model.created_at.asc(),
+                    self.model.id.asc()
+                )
+            else:
+                statement = statement.filter(position < tuple_(created_at, entity_id))
+
+        if not backward:
+            statement = statement.order_by(
+                self.model.created_at.desc(),
+                self.model.id.desc()
+            )
+
+        return statement.limit(size + 1), backward
+
+    @staticmethod
+    def _cursor_page(items: list, backward: bool, **kwargs) -> object:
+        """Định dạng kết quả của _cursor_statement thành trang theo cursor.
+
+        Args:
+            items: Các Row đọc được (dư tối đa 1 bản ghi)
+            backward: True nếu đọc ngược về trang trước
+            kwargs: Các tham số phân trang (size, cursor)
+
+        Returns:
+            object: Đối tượng phân trang theo cursor, items là danh sách Row
+        """
+        size = kwargs.get("size")
+        has_more = len(items) > size
+        items = items[:size]
+        if backward:
+            items.reverse()
+
+        return cursor_paginate_format(items, size, has_more, backward, bool(kwargs.get("cursor")))
+
+    def stream_all(self, **kwargs) -> Iterator[list]:
+        """Đọc toàn bộ đặt phòng khớp bộ lọc qua server-side cursor.
+
+        Kết quả được lấy theo từng khối EXPORT_FETCH_SIZE dòng (yield_per) nên bộ nhớ không phụ
+        thuộc vào số lượng bản ghi. Thứ tự sắp xếp giống danh sách (created_at, id giảm dần).
+
+        Args:
+            kwargs: Các tham số lọc giống paginate_all
+
+        Yields:
+            list: Từng khối Row theo READ_COLUMNS
+        """
+        statement = self._apply_filters(self._select_active(), **kwargs).order_by(
+            self.model.created_at.desc(),
+            self.model.id.desc()
+        )
+        result = db.session.execute(statement, execution_options={"yield_per": EXPORT_FETCH_SIZE})
+        try:
+            yield from result.partitions()
+        finally:
+            result.close()
+
+    def bulk_insert(self, rows: list) -> list:
+        """Thêm mới nhiều bản ghi bằng INSERT ... VALUES (...), (...) ... RETURNING.
+
+        Không commit, transaction được quản lý bởi tầng service.
+
+        Args:
+            rows: Danh sách dict dữ liệu (customer_name, phone, booking_date, note)
+
+        Returns:
+            list: Danh sách Row các bản ghi đã thêm, theo đúng thứ tự của rows
+        """
+        return db.session.execute(self._insert_statement(), self._insert_values(rows)).all()
+
+    def _insert_statement(self):
+        """Câu lệnh INSERT ... RETURNING READ_COLUMNS (theo thứ tự của các dòng truyền vào).
+
+        Returns:
+            Insert: Câu lệnh insert
+        """
+        return insert(self.model).returning(*self.READ_COLUMNS, sort_by_parameter_order=True)
+
+    @staticmethod
+    def _insert_values(rows: list) -> list:
+        return [
+            {
+                "customer_name": row.get("customer_name") or "",
+                "phone": row.get("phone") or 0,
+                "booking_date": row.get("booking_date"),
+                "note": row.get("note") or "",
+            }
+            for row in rows
+        ]
+
+    def bulk_update_status(self, status: str, allowed_from: list, ids: list = None, filters: dict = None) -> list:
+        """Chuyển trạng thái nhiều bản ghi bằng một câu lệnh UPDATE ... RETURNING.
+
+        Chỉ các bản ghi chưa xóa và đang ở một trong các trạng thái allowed_from được cập nhật.
+        Không commit, transaction được quản lý bởi tầng service.
+
+        Args:
+            status: Trạng thái mới
+            allowed_from: Danh sách trạng thái được phép chuyển sang status
+            ids: Danh sách ID cần cập nhật
+            filters: Bộ lọc (như paginate_all) nếu không truyền ids, tối đa MAX_BATCH_SIZE bản ghi
+
+        Returns:
+            list: Danh sách Row (previous_status, *READ_COLUMNS) các bản ghi đã cập nhật
+        """
+        # Khóa và đọc trạng thái cũ trong cùng câu lệnh (UPDATE ... FROM) để trả về previous_status
+        locked = select(
+            self.model.id,
+            self.model.status
+        ).where(
+            self._bulk_target(ids, filters),
+            self.model.status.in_(allowed_from)
+        ).with_for_update().subquery("locked")
+        statement = update(self.model).where(
+            self.model.id == locked.c.id
+        ).values(
+            status=status
+        ).returning(
+            locked.c.status.label("previous_status"), *self.READ_COLUMNS
+        ).execution_options(synchronize_session=False)
+        return db.session.execute(statement).all()
+
+    def bulk_soft_delete(self, ids: list = None, filters: dict = None) -> list:
+        """Xóa mềm nhiều bản ghi bằng một câu lệnh UPDATE ... RETURNING.
+
+        Không commit, transaction được quản lý bởi tầng service.
+
+        Args:
+            ids: Danh sách ID cần xóa
+            filters: Bộ lọc (như paginate_all) nếu không truyền ids, tối đa MAX_BATCH_SIZE bản ghi
+
+        Returns:
+            list: Danh sách Row (READ_COLUMNS) các bản ghi đã xóa
+        """
+        statement = update(self.model).where(
+            self._bulk_target(ids, filters)
+        ).values(
+            is_deleted=True
+        ).returning(
+            *self.READ_COLUMNS
+        ).execution_options(synchronize_session=False)
+        return db.session.execute(statement).all()
+
+    def select_status_by_ids(self, ids: list) -> dict:
+        """Lấy trạng thái hiện tại của các bản ghi chưa xóa theo danh sách ID.
+
+        Args:
+            ids: Danh sách ID
+
+        Returns:
+            dict: {id: status}
+        """
+        rows = db.session.execute(
+            select(self.model.id, self.model.status).where(
+                self.model.id == any_(bindparam("ids", ids, type_=ARRAY(db.BigInteger))),
+                self.model.is_deleted.is_(False)
+            )
+        ).all()
+        return {row.id: row.status for row in rows}
+
+    def lock_phones(self, phones: list) -> None:
+        """Lấy advisory lock (giữ tới hết transaction) theo số điện thoại.
+
+        Lock được lấy theo thứ tự số điện thoại tăng dần để hai transaction cùng khóa nhiều số
+        không bị deadlock.
+
+        Args:
+            phones: Danh sách số điện thoại
+        """
+        db.session.execute(self.LOCK_PHONES_SQL, {"phones": list(phones)})
+
+    def select_duplicates(self, pairs: list, ignored_statuses: list) -> set:
+        """Tìm các booking chưa xóa trùng số điện thoại và thời gian đặt.
+
+        Args:
+            pairs: Danh sách tuple (phone, booking_date)
+            ignored_statuses: Các trạng thái không tính là trùng (ví dụ đã hủy/từ chối)
+
+        Returns:
+            set: Các tuple (phone, booking_date) đã tồn tại
+        """
+        rows = db.session.execute(self._duplicates_statement(pairs, ignored_statuses)).all()
+        return {(row.phone, row.booking_date) for row in rows}
+
+    def _duplicates_statement(self, pairs: list, ignored_statuses: list):
+        return select(self.model.phone, self.model.booking_date).where(
+            tuple_(self.model.phone, self.model.booking_date).in_(pairs),
+            self.model.is_deleted.is_(False),
+            self.model.status.not_in(ignored_statuses)
+        )
+
+    def _bulk_target(self, ids: list = None, filters: dict = None):
+        """Điều kiện chọn bản ghi (chưa xóa) cho các thao tác theo lô.
+
+        Args:
+            ids: Danh sách ID, dùng điều kiện id = ANY(:ids)
+            filters: Bộ lọc như paginate_all, giới hạn MAX_BATCH_SIZE bản ghi mới nhất
+
+        Returns:
+            Điều kiện lọc SQL
+        """
+        if ids:
+            target = self.model.id == any_(bindparam("ids", ids, type_=ARRAY(db.BigInteger)))
+        else:
+            target = self.model.id.in_(
+                self._apply_filters(
+                    select(self.model.id).where(self.model.is_deleted.is_(False)),
+                    **(filters or {})
+                ).order_by(
+                    self.model.created_at.desc(),
+                    self.model.id.desc()
+                ).limit(MAX_BATCH_SIZE)
+            )
+        return and_(target, self.model.is_deleted.is_(False))
+
+    def select_row_by_id(self, entity_id: int) -> Row | None:
+        """Lấy bản ghi đặt phòng (chưa xóa) theo ID dưới dạng Row.
 
-        query = self.model.query.filter(
+        Args:
+            entity_id: ID của bản ghi cần lấy
+
+        Returns:
+            Row | None: Bản ghi tương ứng hoặc None nếu không tìm thấy
+        """
+        return db.session.execute(
+            self._select_active().where(self.model.id == entity_id)
+        ).first()
+
+    def select_version_by_id(self, entity_id: int) -> int | None:
+        """Lấy phiên bản hiện tại của bản ghi chưa xóa.
+
+        Args:
+            entity_id: ID của bản ghi
+
+        Returns:
+            int | None: Phiên bản hoặc None nếu không tìm thấy
+        """
+        return db.session.execute(self._version_statement(entity_id)).scalar()
+
+    def _version_statement(self, entity_id: int):
+        return select(self.model.version).where(
+            self.model.id == entity_id,
             self.model.is_deleted.is_(False)
         )
 
+    def update_returning(self, entity_id: int, version: int = None, **kwargs) -> Row | None:
+        """Cập nhật bản ghi (chưa xóa) bằng một câu lệnh UPDATE ... RETURNING.
+
+        Không SELECT/lock trước: kiểm tra sự tồn tại (và phiên bản nếu có) nằm trong điều kiện của
+        câu lệnh, trạng thái cũ được đọc qua subquery FOR UPDATE trong cùng câu lệnh.
+        Trigger booking_version_bump tăng phiên bản. Không commit, transaction được quản lý bởi
+        tầng service.
+
+        Args:
+            entity_id: ID của bản ghi
+            version: Phiên bản mong đợi (cập nhật lạc quan), None nếu không kiểm tra phiên bản
+            **kwargs: Các trường cần cập nhật (chỉ các trường trong UPDATE_FIELDS, ít nhất một trường)
+
+        Returns:
+            Row | None: Row (previous_status, *READ_COLUMNS) sau khi cập nhật, hoặc None nếu bản ghi
+            không tồn tại/đã xóa hoặc phiên bản không khớp
+        """
+        return db.session.execute(self._update_returning_statement(entity_id, version, **kwargs)).first()
+
+    def _update_returning_statement(self, entity_id: int, version: int = None, **kwargs):
+        """Câu lệnh UPDATE ... RETURNING của update_returning.
+
+        Returns:
+            Update: Câu lệnh update
+        """
+        # Khóa và đọc trạng thái cũ trong cùng câu lệnh (UPDATE ... FROM), FOR UPDATE đọc phiên bản
+        # mới nhất của hàng nếu có giao dịch khác vừa ghi
+        locked = select(
+            self.model.id,
+            self.model.status
+        ).where(
+            self._write_target(entity_id, version)
+        ).with_for_update().subquery("locked")
+        return update(self.model).where(
+            self.model.id == locked.c.id
+        ).values(
+            **{field: kwargs[field] for field in self.UPDATE_FIELDS if field in kwargs}
+        ).returning(
+            locked.c.status.label("previous_status"), *self.READ_COLUMNS
+        ).execution_options(synchronize_session=False)
+
+    def soft_delete_returning(self, entity_id: int, version: int = None) -> Row | None:
+        """Xóa mềm bản ghi (chưa xóa) bằng một câu lệnh UPDATE ... RETURNING.
+
+        Không commit, transaction được quản lý bởi tầng service.
+
+        Args:
+            entity_id: ID của bản ghi
+            version: Phiên bản mong đợi (cập nhật lạc quan), None nếu không kiểm tra phiên bản
+
+        Returns:
+            Row | None: Row (READ_COLUMNS) của bản ghi đã xóa, hoặc None nếu bản ghi không tồn tại/đã
+            xóa hoặc phiên bản không khớp
+        """
+        return db.session.execute(self._soft_delete_statement(entity_id, version)).first()
+
+    def _soft_delete_statement(self, entity_id: int, version: int = None):
+        return update(self.model).where(
+            self._write_target(entity_id, version)
+        ).values(
+            is_deleted=True
+        ).returning(
+            *self.READ_COLUMNS
+        ).execution_options(synchronize_session=False)
+
+    def _write_target(self, entity_id: int, version: int = None):
+        """Điều kiện chọn bản ghi (chưa xóa, đúng phiên bản nếu có) cho update_returning/soft_delete_returning.
+
+        Args:
+            entity_id: ID của bản ghi
+            version: Phiên bản mong đợi
+
+        Returns:
+            Điều kiện lọc SQL
+        """
+        target = and_(self.model.id == entity_id, self.model.is_deleted.is_(False))
+        if version is not None:
+            target = and_(target, self.model.version == version)
+        return target
+
+    def select_generation(self) -> int:
+        """Lấy thế hệ ghi hiện tại của bảng booking (tăng sau mỗi câu lệnh ghi).
+
+        Returns:
+            int: Giá trị thế hệ ghi
+        """
+        return db.session.execute(
+            select(BookingGenerationModel.value).where(BookingGenerationModel.id == 1)
+        ).scalar() or 0
+
+    def count_by_booking_date(self, start: datetime, end: datetime, timezone: str, status: str = None) -> list:
+        """Đếm số đặt phòng (chưa xóa) theo ngày đặt và trạng thái từ bảng tổng hợp theo giờ.
+
+        Đọc từ booking_summary_hourly (được trigger cập nhật tăng dần) thay vì quét bảng booking,
+        các giờ được gộp thành ngày theo múi giờ yêu cầu.
+
+        Args:
+            start: Thời điểm bắt đầu (bao gồm), có timezone
+            end: Thời điểm kết thúc (không bao gồm), có timezone
+            timezone: Tên múi giờ IANA dùng để gộp theo ngày, ví dụ "Asia/Ho_Chi_Minh"
+            status: Lọc theo trạng thái đặt phòng
+
+        Returns:
+            list: Danh sách Row (booking_date, status, total)
+        """
+        summary = BookingSummaryHourlyModel
+        booking_date = func.date(func.timezone(timezone, summary.bucket)).label("booking_date")
+        query = select(
+            booking_date,
+            summary.status,
+            func.sum(summary.total).cast(db.BigInteger).label("total")
+        ).where(
+            summary.bucket >= start,
+            summary.bucket < end,
+            summary.total > 0
+        )
+        if status:
+            query = query.where(summary.status == status)
+
+        return db.session.execute(
+            query.group_by(booking_date, summary.status).order_by(booking_date)
+        ).all()
+
+    def _select_active(self):
+        """Tạo câu lệnh select READ_COLUMNS trên các bản ghi chưa bị xóa mềm.
+
+        Returns:
+            Select: Câu lệnh select
+        """
+        return select(*self.READ_COLUMNS).where(self.model.is_deleted.is_(False))
+
+    def _count_total(self, statement) -> int:
+        """Đếm chính xác tổng số bản ghi của câu lệnh select.
+
+        Args:
+            statement: Câu lệnh select đã áp dụng bộ lọc
+
+        Returns:
+            int: Tổng số bản ghi
+        """
+        return db.session.execute(self._count_statement(statement)).scalar()
+
+    @staticmethod
+    def _count_statement(statement):
+        return select(func.count()).select_from(statement.order_by(None).subquery())
+
+    def _estimate_total(self, statement, **kwargs) -> int:
+        """Ước lượng tổng số bản ghi khớp với bộ lọc.
+
+        Dùng số dòng ước lượng của planner (EXPLAIN). Nếu ước lượng nhỏ hơn ngưỡng
+        COUNT_ESTIMATE_THRESHOLD thì đếm chính xác vì chi phí COUNT(*) thấp.
+        Kết quả được cache theo bộ lọc trong COUNT_CACHE_TTL giây.
+
+        Args:
+            statement: Câu lệnh select đã áp dụng bộ lọc
+            kwargs: Các tham số lọc
+
+        Returns:
+            int: Tổng số bản ghi (ước lượng)
+        """
+        cache_key = self._filter_key(**kwargs)
+        total = self.count_cache.get(cache_key)
+        if total is not None:
+            return total
+
+        compiled = statement.compile(dialect=db.engine.dialect)
+        plan = db.session.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar()
+        total = int(plan[0]["Plan"]["Plan Rows"])
+        if total < COUNT_ESTIMATE_THRESHOLD:
+            total = self._count_total(statement)
+
+        self.count_cache.set(cache_key, total)
+        return total
+
+    def _filter_key(self, **kwargs) -> tuple:
+        """Tạo key chuẩn hóa cho bộ lọc (bỏ qua các tham số phân trang).
+
+        Args:
+            kwargs: Các tham số lọc và phân trang
+
+        Returns:
+            tuple: Các cặp (tên bộ lọc, giá trị) có giá trị, theo thứ tự cố định
+        """
+        return tuple((field, kwargs[field]) for field in self.FILTER_FIELDS if kwargs.get(field))
+
+    def _listing_order(self, **kwargs) -> list:
+        """Thứ tự sắp xếp danh sách phân trang theo số trang.
+
+        Khi tìm theo tên khách hàng, bản ghi liên quan nhất (word_similarity cao nhất) được
+        đưa lên trước, sau đó mới đến thứ tự (created_at DESC, id DESC).
+
+        Args:
+            kwargs: Các tham số lọc
+
+        Returns:
+            list: Danh sách biểu thức ORDER BY
+        """
+        order = [self.model.created_at.desc(), self.model.id.desc()]
         if kwargs.get("customer_name"):
-            query = query.filter(self.model.customer_name.ilike(f"%{kwargs.get('customer_name')}%"))
+            relevance = func.word_similarity(
+                normalize_search_text(kwargs.get("customer_name")),
+                self.model.customer_name_normalized
+            )
+            order.insert(0, relevance.desc())
+        return order
+
+    def _name_search_clause(self, customer_name: str, name_match: str = None):
+        """Tạo điều kiện tìm kiếm theo tên khách hàng trên cột đã chuẩn hóa.
+
+        Các điều kiện đều được phục vụ bởi GIN trigram index b_customer_name_trgm.
+
+        Args:
+            customer_name: Chuỗi tìm kiếm
+            name_match: Cách so khớp (contains/prefix/fuzzy), mặc định contains
+
+        Returns:
+            Điều kiện lọc SQL
+        """
+        column = self.model.customer_name_normalized
+        if name_match == NameMatchMode.FUZZY.value:
+            return normalize_search_text(customer_name).op("<%")(column)
+
+        keyword = normalize_search_text(escape_like(customer_name))
+        if name_match == NameMatchMode.PREFIX.value:
+            return column.like(keyword.concat("%"), escape="!")
+        return column.like(literal("%").concat(keyword).concat("%"), escape="!")
+
+    def _apply_filters(self, query, **kwargs):
+        """Áp dụng các điều kiện lọc đặt phòng vào truy vấn.
+
+        Args:
+            query: Truy vấn (Query hoặc Select) cần áp dụng bộ lọc
+            kwargs: Các tham số lọc (customer_name, name_match, phone, booking_from, booking_to,
+                status, created_from, created_to)
+
+        Returns:
+            Truy vấn đã được áp dụng bộ lọc
+        """
+        if kwargs.get("customer_name"):
+            query = query.filter(self._name_search_clause(kwargs.get("customer_name"), kwargs.get("name_match")))
 
         if kwargs.get("phone"):
             query = query.filter(self.model.phone == kwargs.get('phone'))
@@ -61,14 +658,7 @@ class BookingRepository(BaseRepository):
         if kwargs.get("created_to"):
             query = query.filter(self.model.created_at <= kwargs.get('created_to'))
 
-        query = query.order_by(
-            self.model.created_at.desc(),
-            self.model.id.desc()
-        ).paginate(
-            page=kwargs.get("page"),
-            per_page=kwargs.get("size")
-        )
-        return paginate_format(query)
+        return query
 
 
 booking_repo = BookingRepository()
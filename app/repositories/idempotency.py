@@ -0,0 +1,134 @@
+# coding: utf8
+
+from datetime import timedelta
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+
+from app import db
+from app.models import IdempotencyKeyModel
+from app.repositories.base import BaseRepository
+
+
+class IdempotencyRepository(BaseRepository):
+    """Repository ghi và đọc Idempotency-Key cùng response đã lưu.
+
+    Các phương thức không commit, transaction được quản lý bởi tầng service.
+
+    Inheritance:
+        BaseRepository: Kế thừa các phương thức cơ bản từ base repository
+    """
+
+    def __init__(self):
+        super().__init__(IdempotencyKeyModel)
+
+    def claim(self, scope: str, key: str, request_hash: str, ttl: int) -> bool:
+        """Ghi key ở trạng thái đang xử lý bằng một câu lệnh INSERT ... ON CONFLICT.
+
+        Key đã hết hạn được ghi đè như key mới; key còn hạn không bị thay đổi. Dòng được ghi bị khóa tới
+        khi transaction kết thúc: request khác với cùng key chờ tại câu lệnh này rồi thấy kết quả đã commit.
+
+        Args:
+            scope: Phạm vi của key (ví dụ tên route)
+            key: Giá trị header Idempotency-Key
+            request_hash: Hash nội dung request
+            ttl: Thời gian lưu (giây)
+
+        Returns:
+            bool: True nếu key được ghi (request cần được xử lý), False nếu key đã tồn tại và còn hạn
+        """
+        statement = insert(self.model).values(
+            scope=scope,
+            key=key,
+            request_hash=request_hash,
+            expires_at=func.now() + timedelta(seconds=ttl)
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[self.model.scope, self.model.key],
+            set_={
+                "request_hash": statement.excluded.request_hash,
+                "status_code": None,
+                "response_body": None,
+                "content_type": None,
+                "created_at": func.now(),
+                "expires_at": statement.excluded.expires_at,
+            },
+            where=self.model.expires_at <= func.now()
+        ).returning(self.model.key)
+        return db.session.execute(statement).first() is not None
+
+    def select_by_key(self, scope: str, key: str) -> Row | None:
+        """Lấy key còn hạn.
+
+        Args:
+            scope: Phạm vi của key
+            key: Giá trị header Idempotency-Key
+
+        Returns:
+            Row | None: Row (request_hash, status_code, response_body, content_type) hoặc None
+        """
+        return db.session.execute(
+            select(
+                self.model.request_hash,
+                self.model.status_code,
+                self.model.response_body,
+                self.model.content_type
+            ).where(
+                self.model.scope == scope,
+                self.model.key == key,
+                self.model.expires_at > func.now()
+            )
+        ).first()
+
+    def save_response(self, scope: str, key: str, status_code: int, body: str, content_type: str) -> None:
+        """Lưu response của request đã xử lý xong.
+
+        Chỉ gọi trong transaction đã ghi key (claim): dòng đang bị khóa bởi transaction này nên không
+        request nào khác thay đổi được.
+
+        Args:
+            scope: Phạm vi của key
+            key: Giá trị header Idempotency-Key
+            status_code: Mã trạng thái HTTP
+            body: Nội dung response
+            content_type: Content-Type của response
+        """
+        db.session.execute(
+            update(self.model).where(
+                self.model.scope == scope,
+                self.model.key == key
+            ).values(
+                status_code=status_code,
+                response_body=body,
+                content_type=content_type
+            ).execution_options(synchronize_session=False)
+        )
+
+    def delete_key(self, scope: str, key: str) -> None:
+        """Xóa key (để client có thể gửi lại request với cùng key).
+
+        Chỉ gọi trong transaction đã ghi key (claim), như save_response.
+
+        Args:
+            scope: Phạm vi của key
+            key: Giá trị header Idempotency-Key
+        """
+        db.session.execute(
+            delete(self.model).where(
+                self.model.scope == scope,
+                self.model.key == key
+            ).execution_options(synchronize_session=False)
+        )
+
+    def purge_expired(self) -> int:
+        """Xóa các key đã hết hạn.
+
+        Returns:
+            int: Số key đã xóa
+        """
+        return db.session.execute(
+            delete(self.model).where(self.model.expires_at <= func.now()).execution_options(synchronize_session=False)
+        ).rowcount
+
+
+idempotency_repo = IdempotencyRepository()
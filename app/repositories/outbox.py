@@ -0,0 +1,100 @@
+# coding: utf8
+
+from datetime import datetime
+from sqlalchemy import delete, func, insert, select, update
+
+from app import db
+from app.models import OutboxEventModel
+from app.repositories.base import BaseRepository
+
+
+class OutboxRepository(BaseRepository):
+    """Repository ghi và nhận (claim) các sự kiện trong bảng outbox.
+
+    Các phương thức không commit, transaction được quản lý bởi tầng service.
+
+    Inheritance:
+        BaseRepository: Kế thừa các phương thức cơ bản từ base repository
+    """
+
+    def __init__(self):
+        super().__init__(OutboxEventModel)
+
+    def add_events(self, events: list) -> None:
+        """Ghi các sự kiện vào outbox trong transaction hiện tại (một câu lệnh INSERT).
+
+        Args:
+            events: Danh sách dict (topic, message_key, event_type, payload)
+        """
+        if events:
+            db.session.execute(insert(self.model), events)
+
+    def claim_batch(self, limit: int) -> list:
+        """Nhận một lô sự kiện chưa gửi, khóa các dòng tới khi transaction kết thúc.
+
+        Dùng FOR UPDATE SKIP LOCKED nên nhiều relay chạy song song sẽ nhận các lô khác nhau.
+
+        Args:
+            limit: Số sự kiện tối đa
+
+        Returns:
+            list: Danh sách Row (id, topic, message_key, event_type, payload, attempts) theo thứ tự id
+        """
+        return db.session.execute(
+            select(
+                self.model.id,
+                self.model.topic,
+                self.model.message_key,
+                self.model.event_type,
+                self.model.payload,
+                self.model.attempts
+            ).where(
+                self.model.sent_at.is_(None)
+            ).order_by(
+                self.model.id
+            ).limit(limit).with_for_update(skip_locked=True)
+        ).all()
+
+    def mark_sent(self, ids: list) -> None:
+        """Đánh dấu các sự kiện đã gửi thành công.
+
+        Args:
+            ids: Danh sách ID sự kiện
+        """
+        if ids:
+            db.session.execute(
+                update(self.model).where(self.model.id.in_(ids)).values(
+                    sent_at=func.now(),
+                    attempts=self.model.attempts + 1
+                ).execution_options(synchronize_session=False)
+            )
+
+    def mark_failed(self, errors: dict) -> None:
+        """Ghi nhận lỗi gửi của các sự kiện (sẽ được gửi lại ở lần claim sau).
+
+        Args:
+            errors: Dict {ID sự kiện: thông báo lỗi}
+        """
+        for event_id, error in errors.items():
+            db.session.execute(
+                update(self.model).where(self.model.id == event_id).values(
+                    attempts=self.model.attempts + 1,
+                    last_error=str(error)[:1000]
+                ).execution_options(synchronize_session=False)
+            )
+
+    def purge_sent(self, before: datetime) -> int:
+        """Xóa các sự kiện đã gửi trước thời điểm before.
+
+        Args:
+            before: Mốc thời gian
+
+        Returns:
+            int: Số sự kiện đã xóa
+        """
+        return db.session.execute(
+            delete(self.model).where(self.model.sent_at < before).execution_options(synchronize_session=False)
+        ).rowcount
+
+
+outbox_repo = OutboxRepository()
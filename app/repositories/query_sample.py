@@ -0,0 +1,72 @@
+# coding: utf8
+
+from datetime import datetime
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from app import db
+from app.models import QuerySampleModel
+from app.repositories.base import BaseRepository
+
+
+class QuerySampleRepository(BaseRepository):
+    """Repository truy vấn các mẫu truy vấn chậm và thông tin index hiện có.
+
+    Inheritance:
+        BaseRepository: Kế thừa các phương thức cơ bản từ base repository
+    """
+
+    def __init__(self):
+        super().__init__(QuerySampleModel)
+
+    def summarize(self, since: datetime) -> list:
+        """Tổng hợp các mẫu truy vấn chậm theo chữ ký bộ lọc.
+
+        Args:
+            since: Chỉ tính các mẫu được ghi nhận từ thời điểm này
+
+        Returns:
+            list: Các dòng (signature, samples, avg_ms, max_ms, last_plan, last_statement),
+                  sắp xếp theo tổng thời gian giảm dần
+        """
+        total_ms = func.sum(self.model.duration_ms)
+        query = select(
+            self.model.signature,
+            func.count().label("samples"),
+            func.avg(self.model.duration_ms).label("avg_ms"),
+            func.max(self.model.duration_ms).label("max_ms"),
+            func.array_agg(
+                aggregate_order_by(self.model.plan, self.model.created_at.desc())
+            )[1].label("last_plan"),
+            func.array_agg(
+                aggregate_order_by(self.model.statement, self.model.created_at.desc())
+            )[1].label("last_statement"),
+        ).where(
+            self.model.created_at >= since
+        ).group_by(
+            self.model.signature
+        ).order_by(
+            total_ms.desc()
+        )
+        return db.session.execute(query).all()
+
+    def existing_indexes(self, table_name: str) -> dict:
+        """Lấy danh sách index hiện có của bảng trong schema hiện tại.
+
+        Args:
+            table_name: Tên bảng
+
+        Returns:
+            dict: {tên index: câu lệnh định nghĩa index}
+        """
+        rows = db.session.execute(
+            text(
+                "SELECT indexname, indexdef FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND tablename = :table_name"
+            ),
+            {"table_name": table_name}
+        ).all()
+        return {row.indexname: row.indexdef for row in rows}
+
+
+query_sample_repo = QuerySampleRepository()
@@ -3,6 +3,10 @@
 def register_routes(app):
     from .health_check import health_check_bp
     from .booking import booking_bp
+    from .admin import admin_bp
+    from .report import report_bp
 
     app.register_blueprint(health_check_bp, url_prefix="/v1")
     app.register_blueprint(booking_bp, url_prefix="/v1/bookings")
+    app.register_blueprint(admin_bp, url_prefix="/v1/admin")
+    app.register_blueprint(report_bp, url_prefix="/v1/reports")
@@ -0,0 +1,105 @@
+# coding: utf8
+
+from loguru import logger
+
+from flask import Blueprint
+
+from app.decorators import validate_request, require_admin_key
+from app.middlewares import format_response
+from app.services import AdminService
+from app.routes.base import BaseRoute
+
+"""Routes quản trị, vận hành.
+
+Module này cung cấp các endpoint API quản trị (yêu cầu header X-Admin-Key) bao gồm:
+- Thống kê truy vấn chậm theo chữ ký bộ lọc (GET /query-samples) -> list
+- Gợi ý index cho các tổ hợp bộ lọc (GET /index-advice) -> list
+- Thống kê hit/miss của các cache (GET /cache-stats) -> dict
+- Thống kê gửi message Kafka (GET /kafka-stats) -> dict
+"""
+
+admin_bp = Blueprint("admin", __name__)
+
+
+class AdminRoute(BaseRoute):
+    """Xử lý các routes quản trị, kế thừa từ BaseRoute.
+
+    Schemas:
+        SINCE_SCHEMA: Khoảng thời gian (giờ) cần thống kê
+    """
+
+    # Schemas
+    SINCE_SCHEMA = {
+        "since_hours": {"type": int, "required": False, "location": "value", "default": 24, "min": 1, "max": 24 * 30},
+    }
+
+    def __init__(self):
+        super().__init__(admin_bp)
+
+    def register_routes(self) -> None:
+        """Đăng ký tất cả các routes quản trị với blueprint.
+
+        Maps các URL endpoint tới các phương thức xử lý tương ứng.
+        """
+        routes = [
+            ("/query-samples", "router_query_samples", self._query_samples, ["GET"]),
+            ("/index-advice", "router_index_advice", self._index_advice, ["GET"]),
+            ("/cache-stats", "router_cache_stats", self._cache_stats, ["GET"]),
+            ("/kafka-stats", "router_kafka_stats", self._kafka_stats, ["GET"]),
+        ]
+
+        for path, endpoint, view_func, methods in routes:
+            self.blueprint.add_url_rule(path, endpoint, view_func=view_func, methods=methods)
+
+    @format_response
+    @require_admin_key
+    @validate_request(SINCE_SCHEMA)
+    def _query_samples(self, **kwargs) -> list:
+        """Thống kê các truy vấn chậm đã được lấy mẫu.
+
+        Args:
+            **kwargs:
+                - since_hours (int, optional): Số giờ gần nhất cần thống kê (mặc định 24)
+
+        Returns:
+            list: Thống kê theo chữ ký bộ lọc
+        """
+        return AdminService.query_samples(kwargs.get("since_hours"))
+
+    @format_response
+    @require_admin_key
+    @validate_request(SINCE_SCHEMA)
+    def _index_advice(self, **kwargs) -> list:
+        """Gợi ý index cho các tổ hợp bộ lọc có truy vấn chậm.
+
+        Args:
+            **kwargs:
+                - since_hours (int, optional): Số giờ gần nhất cần phân tích (mặc định 24)
+
+        Returns:
+            list: Danh sách gợi ý index
+        """
+        return AdminService.index_advice(kwargs.get("since_hours"))
+
+    @format_response
+    @require_admin_key
+    def _cache_stats(self) -> dict:
+        """Thống kê hit/miss của các cache trong worker xử lý request.
+
+        Returns:
+            dict: Thống kê theo từng cache
+        """
+        return AdminService.cache_stats()
+
+    @format_response
+    @require_admin_key
+    def _kafka_stats(self) -> dict:
+        """Thống kê gửi message Kafka trong worker xử lý request.
+
+        Returns:
+            dict: Thống kê gửi message
+        """
+        return AdminService.kafka_stats()
+
+
+AdminRoute().register_routes()
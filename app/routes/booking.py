@@ -2,25 +2,34 @@
 
 from loguru import logger
 
-from flask import Blueprint
+from flask import Blueprint, Response, stream_with_context
 
-from app.constants.globals import DEFAULT_PAGE_NUMBER, DEFAULT_PAGE_LIMIT
-from app.decorators import validate_request
+from app.enum import ExportFormat
+from app.decorators import validate_request, read_replica, conditional_get, compress, if_match, idempotent
 from app.middlewares import format_response
 from app.services import BookingService
 from app.routes.base import BaseRoute
+from app.routes.schemas import (
+    PAGINATE_SCHEMA, EXPORT_SCHEMA, CREATE_SCHEMA, BATCH_CREATE_SCHEMA, BULK_STATUS_SCHEMA, BULK_DELETE_SCHEMA,
+    UPDATE_SCHEMA
+)
 from app.utils import remove_none_in_dict
 
 """Routes quản lý đặt chỗ.
 
 Module này cung cấp các endpoint API để quản lý đặt chỗ bao gồm:
 - Phân trang và tìm kiếm đặt chỗ (GET /) -> dict
+- Xuất toàn bộ đặt chỗ khớp bộ lọc dạng CSV/NDJSON (GET /export) -> stream
 - Tạo đặt chỗ mới (POST /) -> dict
+- Tạo nhiều đặt chỗ theo lô (POST /batch) -> dict
+- Chuyển trạng thái nhiều đặt chỗ (POST /bulk/status) -> dict
+- Xóa (xóa mềm) nhiều đặt chỗ (POST /bulk/delete) -> dict
 - Xem chi tiết đặt chỗ (GET /<id>) -> dict
 - Cập nhật thông tin đặt chỗ (PUT /<id>) -> dict
 - Xóa (xóa mềm) đặt chỗ (POST /delete/<id>) -> None
 
 Tính hợp lệ của request được xử lý bởi decorator validate_request sử dụng các schema đã định nghĩa.
+Các route tạo đặt chỗ hỗ trợ header Idempotency-Key (decorator idempotent) để client gửi lại an toàn.
 """
 
 booking_bp = Blueprint("bookings", __name__)
@@ -30,38 +39,12 @@ class BookingRoute(BaseRoute):
     """Xử lý các routes đặt chỗ.
 
     Định nghĩa các endpoint API cho việc quản lý đặt chỗ, kế thừa từ BaseRoute.
-    Sử dụng các schema để kiểm tra tính hợp lệ của request.
-
-    Schemas:
-        PAGINATE_SCHEMA: Tham số phân trang và lọc
-        CREATE_SCHEMA: Các trường bắt buộc để tạo đặt chỗ
-        UPDATE_SCHEMA: Các trường tùy chọn để cập nhật đặt chỗ
+    Sử dụng các schema trong app/routes/schemas.py để kiểm tra tính hợp lệ của request.
     """
 
-    # Schemas
-    PAGINATE_SCHEMA = {
-        "customer_name": {"type": str, "required": False, "location": "value"},
-        "phone": {"type": str, "required": False, "location": "value"},
-        "booking_from": {"type": str, "required": False, "location": "value"},
-        "booking_to": {"type": str, "required": False, "location": "value"},
-        "status": {"type": str, "required": False, "location": "value"},
-        "created_from": {"type": str, "required": False, "location": "value"},
-        "created_to": {"type": str, "required": False, "location": "value"},
-        "page": {"type": int, "required": False, "location": "value", "default": DEFAULT_PAGE_NUMBER},
-        "size": {"type": int, "required": False, "location": "value", "default": DEFAULT_PAGE_LIMIT},
-    }
-    CREATE_SCHEMA = {
-        "customer_name": {"type": str, "required": True, "location": "json"},
-        "phone": {"type": int, "required": True, "location": "json"},
-        "booking_date": {"type": str, "required": True, "location": "json"},
-        "note": {"type": str, "required": False, "location": "json"}
-    }
-    UPDATE_SCHEMA = {
-        "customer_name": {"type": str, "required": False, "location": "json"},
-        "phone": {"type": int, "required": False, "location": "json"},
-        "booking_date": {"type": str, "required": False, "location": "json"},
-        "note": {"type": str, "required": False, "location": "json"},
-        "status": {"type": str, "required": False, "location": "json"}
+    EXPORT_MIMETYPES = {
+        ExportFormat.CSV.value: "text/csv",
+        ExportFormat.NDJSON.value: "application/x-ndjson",
     }
 
     def __init__(self):
@@ -76,6 +59,10 @@ class BookingRoute(BaseRoute):
         routes = [
             ("", "router_paginate_booking", self._paginate_booking, ["GET"]),
             ("", "router_create_booking", self._create_booking, ["POST"]),
+            ("/export", "router_export_booking", self._export_booking, ["GET"]),
+            ("/batch", "router_bulk_create_booking", self._bulk_create_booking, ["POST"]),
+            ("/bulk/status", "router_bulk_update_status", self._bulk_update_status, ["POST"]),
+            ("/bulk/delete", "router_bulk_delete_booking", self._bulk_delete_booking, ["POST"]),
             ("/<int:booking_id>", "router_get_booking", self._get_booking, ["GET"]),
             ("/<int:booking_id>", "router_update_booking", self._update_booking, ["PUT"]),
             ("/<int:booking_id>", "router_delete_booking", self._delete_booking, ["DELETE"]),
@@ -85,13 +72,16 @@ class BookingRoute(BaseRoute):
             self.blueprint.add_url_rule(path, endpoint, view_func=view_func, methods=methods)
 
     @format_response
+    @read_replica
     @validate_request(PAGINATE_SCHEMA)
+    @conditional_get(BookingService.paginate_booking_etag)
     def _paginate_booking(self, **kwargs) -> dict:
         """Lấy danh sách đặt chỗ theo phân trang và bộ lọc.
 
         Args:
             **kwargs: Các tham số lọc:
                 - customer_name (str, optional): Lọc theo tên khách hàng
+                - name_match (str, optional): Cách so khớp tên (contains/prefix/fuzzy)
                 - phone (str, optional): Lọc theo số điện thoại
                 - booking_from (datetime, optional): Thời gian đặt chỗ (từ)
                 - booking_to (datetime, optional): Thời gian đặt chỗ (đến)
@@ -100,6 +90,9 @@ class BookingRoute(BaseRoute):
                 - created_to (datetime, optional): Thời gian tạo (đến)
                 - page (int, optional): Trang (số) đích
                 - size (int, optional): Số lượng trên một trang
+                - pagination (str, optional): Chế độ phân trang (offset/cursor)
+                - cursor (str, optional): Cursor của trang cần lấy
+                - count (str, optional): Cách tính tổng số bản ghi (exact/estimate/none)
 
         Output:
             dict: {
@@ -109,6 +102,33 @@ class BookingRoute(BaseRoute):
         """
         return BookingService.paginate_booking(**remove_none_in_dict(kwargs))
 
+    @format_response
+    @read_replica
+    @compress(levels={"gzip": 1, "br": 1, "zstd": 1})
+    @validate_request(EXPORT_SCHEMA)
+    def _export_booking(self, **kwargs) -> Response:
+        """Xuất toàn bộ đặt chỗ khớp bộ lọc dưới dạng file CSV hoặc NDJSON.
+
+        Nội dung được stream theo từng khối đọc từ server-side cursor, giữ request context
+        (session và kết nối database) cho tới khi gửi xong. Nén với mức thấp nhất để không làm
+        chậm stream.
+
+        Args:
+            **kwargs: Các tham số lọc giống _paginate_booking và:
+                - format (str, optional): Định dạng xuất (csv/ndjson), mặc định csv
+
+        Output:
+            Response: File CSV (text/csv) hoặc NDJSON (application/x-ndjson) dạng stream
+        """
+        export_format = kwargs.get("format")
+        chunks = BookingService.export_booking(**remove_none_in_dict(kwargs))
+        return Response(
+            stream_with_context(chunks),
+            mimetype=self.EXPORT_MIMETYPES.get(export_format, "text/csv"),
+            headers={"Content-Disposition": f'attachment; filename="bookings.{export_format}"'}
+        )
+
+    @idempotent("create_booking")
     @format_response
     @validate_request(CREATE_SCHEMA)
     def _create_booking(self, **kwargs) -> dict:
@@ -125,7 +145,56 @@ class BookingRoute(BaseRoute):
         """
         return BookingService.create_booking(**remove_none_in_dict(kwargs))
 
+    @idempotent("bulk_create_booking")
+    @format_response
+    @validate_request(BATCH_CREATE_SCHEMA)
+    def _bulk_create_booking(self, **kwargs) -> dict:
+        """Tạo nhiều đặt chỗ trong một request.
+
+        Args:
+            **kwargs:
+                - bookings (list): Danh sách đặt chỗ, mỗi phần tử gồm customer_name, phone,
+                  booking_date, note như khi tạo đặt chỗ mới
+
+        Returns:
+            dict: Tổng hợp và kết quả (thành công/thất bại) theo từng phần tử
+        """
+        return BookingService.bulk_create_booking(**remove_none_in_dict(kwargs))
+
     @format_response
+    @validate_request(BULK_STATUS_SCHEMA)
+    def _bulk_update_status(self, **kwargs) -> dict:
+        """Chuyển trạng thái nhiều đặt chỗ.
+
+        Args:
+            **kwargs:
+                - ids (list, optional): Danh sách ID đặt chỗ
+                - filter (dict, optional): Bộ lọc như khi lấy danh sách (dùng khi không truyền ids)
+                - status (str): Trạng thái mới
+
+        Returns:
+            dict: Tổng hợp và kết quả theo từng ID
+        """
+        return BookingService.bulk_update_status(**remove_none_in_dict(kwargs))
+
+    @format_response
+    @validate_request(BULK_DELETE_SCHEMA)
+    def _bulk_delete_booking(self, **kwargs) -> dict:
+        """Xóa (xóa mềm) nhiều đặt chỗ.
+
+        Args:
+            **kwargs:
+                - ids (list, optional): Danh sách ID đặt chỗ
+                - filter (dict, optional): Bộ lọc như khi lấy danh sách (dùng khi không truyền ids)
+
+        Returns:
+            dict: Tổng hợp và kết quả theo từng ID
+        """
+        return BookingService.bulk_delete_booking(**remove_none_in_dict(kwargs))
+
+    @format_response
+    @read_replica
+    @conditional_get(BookingService.booking_etag)
     def _get_booking(self, booking_id: int) -> dict:
         """Lấy chi tiết thông tin đặt chỗ theo ID.
 
@@ -139,9 +208,13 @@ class BookingRoute(BaseRoute):
 
     @format_response
     @validate_request(UPDATE_SCHEMA)
+    @if_match("booking_id", BookingService.response_etag)
     def _update_booking(self, booking_id: int, **kwargs) -> dict:
         """Cập nhật thông tin đặt chỗ theo ID.
 
+        Gửi header If-Match (ETag của chi tiết đặt chỗ) hoặc trường version để cập nhật lạc quan:
+        không lock bản ghi, trả về 412 (If-Match) hoặc 409 (version) nếu bản ghi đã bị thay đổi.
+
         Args:
             booking_id (int): ID đặt chỗ cần cập nhật
             **kwargs: Các trường cần cập nhật:
@@ -149,6 +222,7 @@ class BookingRoute(BaseRoute):
                 - phone (str, optional): Số điện thoại mới
                 - booking_date (datetime, optional): Thời gian đặt chỗ mới
                 - status (str, optional): Trạng thái mới
+                - version (int, optional): Phiên bản mong đợi của đặt chỗ
 
         Returns:
             dict: Thông tin đặt chỗ sau khi cập nhật
@@ -157,13 +231,17 @@ class BookingRoute(BaseRoute):
         return BookingService.update_booking(**remove_none_in_dict(kwargs))
 
     @format_response
-    def _delete_booking(self, booking_id: int) -> None:
+    @if_match("booking_id")
+    def _delete_booking(self, booking_id: int, version: int = None) -> None:
         """Xóa (xóa mềm) đặt chỗ theo ID.
 
+        Gửi header If-Match để chỉ xóa khi đặt chỗ chưa bị thay đổi (412 nếu đã thay đổi).
+
         Args:
             booking_id (int): ID đặt chỗ cần xóa
+            version (int, optional): Phiên bản mong đợi (đọc từ If-Match)
         """
-        return BookingService.delete_booking(**{"booking_id": booking_id})
+        return BookingService.delete_booking(**remove_none_in_dict({"booking_id": booking_id, "version": version}))
 
 
 BookingRoute().register_routes()
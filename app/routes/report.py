@@ -4,6 +4,7 @@ from loguru import logger
 
 from flask import Blueprint
 
+from app.decorators import validate_request, read_replica
 from app.middlewares import format_response
 from app.services import ReportService
 from app.routes.base import BaseRoute
@@ -22,8 +23,20 @@ class ReportRoute(BaseRoute):
     """Xử lý các routes báo cáo thông tin đặt chỗ.
 
     Định nghĩa các endpoint API cho việc báo cáo thông tin đặt chỗ, kế thừa từ BaseRoute.
+
+    Schemas:
+        SUMMARY_SCHEMA: Khoảng ngày, múi giờ và tùy chọn chia theo trạng thái
     """
 
+    # Schemas
+    SUMMARY_SCHEMA = {
+        "date_from": {"type": str, "required": False, "location": "value"},
+        "date_to": {"type": str, "required": False, "location": "value"},
+        "timezone": {"type": str, "required": False, "location": "value"},
+        "status": {"type": str, "required": False, "location": "value"},
+        "group_by_status": {"type": bool, "required": False, "location": "value", "default": False},
+    }
+
     def __init__(self):
         super().__init__(report_bp)
 
@@ -40,13 +53,23 @@ class ReportRoute(BaseRoute):
             self.blueprint.add_url_rule(path, endpoint, view_func=view_func, methods=methods)
 
     @format_response
-    def _report_summary(self) -> dict:
+    @read_replica
+    @validate_request(SUMMARY_SCHEMA)
+    def _report_summary(self, **kwargs) -> dict:
         """Tổng hợp số lượng đặt chỗ theo ngày
 
+        Args:
+            **kwargs: Các tham số báo cáo:
+                - date_from (str, optional): Từ ngày (YYYY-MM-DD)
+                - date_to (str, optional): Đến ngày (YYYY-MM-DD)
+                - timezone (str, optional): Múi giờ dùng để xác định ngày, mặc định Asia/Ho_Chi_Minh
+                - status (str, optional): Chỉ đếm đặt chỗ ở trạng thái này
+                - group_by_status (bool, optional): Chia số lượng theo trạng thái
+
         Output:
             dict: Danh sách tổng các đặt chỗ theo ngày
         """
-        return ReportService.summary_by_date()
+        return ReportService.summary_by_date(**remove_none_in_dict(kwargs))
 
 
 ReportRoute().register_routes()
@@ -0,0 +1,76 @@
+# coding: utf8
+
+from app.constants.globals import DEFAULT_PAGE_NUMBER, DEFAULT_PAGE_LIMIT, MAX_BATCH_SIZE
+from app.enum import ExportFormat
+
+"""Schema của request các route đặt chỗ (dùng với validate_request).
+
+Dùng chung cho phiên bản WSGI (app/routes/booking.py) và ASGI (app/asgi/routes.py), để phiên bản ASGI
+không phải import module route của Flask.
+"""
+
+# Tham số phân trang và lọc
+PAGINATE_SCHEMA = {
+    "customer_name": {"type": str, "required": False, "location": "value"},
+    "name_match": {"type": str, "required": False, "location": "value"},
+    "phone": {"type": str, "required": False, "location": "value"},
+    "booking_from": {"type": str, "required": False, "location": "value"},
+    "booking_to": {"type": str, "required": False, "location": "value"},
+    "status": {"type": str, "required": False, "location": "value"},
+    "created_from": {"type": str, "required": False, "location": "value"},
+    "created_to": {"type": str, "required": False, "location": "value"},
+    "page": {"type": int, "required": False, "location": "value", "default": DEFAULT_PAGE_NUMBER},
+    "size": {"type": int, "required": False, "location": "value", "default": DEFAULT_PAGE_LIMIT},
+    "pagination": {"type": str, "required": False, "location": "value"},
+    "cursor": {"type": str, "required": False, "location": "value"},
+    "count": {"type": str, "required": False, "location": "value"},
+}
+
+# Tham số lọc và định dạng xuất
+EXPORT_SCHEMA = {
+    "customer_name": {"type": str, "required": False, "location": "value"},
+    "name_match": {"type": str, "required": False, "location": "value"},
+    "phone": {"type": str, "required": False, "location": "value"},
+    "booking_from": {"type": str, "required": False, "location": "value"},
+    "booking_to": {"type": str, "required": False, "location": "value"},
+    "status": {"type": str, "required": False, "location": "value"},
+    "created_from": {"type": str, "required": False, "location": "value"},
+    "created_to": {"type": str, "required": False, "location": "value"},
+    "format": {"type": str, "required": False, "location": "value", "default": ExportFormat.CSV.value},
+}
+
+# Các trường bắt buộc để tạo đặt chỗ
+CREATE_SCHEMA = {
+    "customer_name": {"type": str, "required": True, "location": "json"},
+    "phone": {"type": int, "required": True, "location": "json"},
+    "booking_date": {"type": str, "required": True, "location": "json"},
+    "note": {"type": str, "required": False, "location": "json"}
+}
+
+# Danh sách đặt chỗ cần tạo theo lô
+BATCH_CREATE_SCHEMA = {
+    "bookings": {"type": list, "required": True, "location": "json", "max": MAX_BATCH_SIZE},
+}
+
+# Danh sách ID/bộ lọc và trạng thái mới
+BULK_STATUS_SCHEMA = {
+    "ids": {"type": list, "required": False, "location": "json", "max": MAX_BATCH_SIZE},
+    "filter": {"type": dict, "required": False, "location": "json"},
+    "status": {"type": str, "required": True, "location": "json"},
+}
+
+# Danh sách ID/bộ lọc cần xóa
+BULK_DELETE_SCHEMA = {
+    "ids": {"type": list, "required": False, "location": "json", "max": MAX_BATCH_SIZE},
+    "filter": {"type": dict, "required": False, "location": "json"},
+}
+
+# Các trường tùy chọn để cập nhật đặt chỗ
+UPDATE_SCHEMA = {
+    "customer_name": {"type": str, "required": False, "location": "json"},
+    "phone": {"type": int, "required": False, "location": "json"},
+    "booking_date": {"type": str, "required": False, "location": "json"},
+    "note": {"type": str, "required": False, "location": "json"},
+    "status": {"type": str, "required": False, "location": "json"},
+    "version": {"type": int, "required": False, "location": "json"}
+}
@@ -2,4 +2,8 @@
 
 from .base import BaseService
 
+from .event import EventService
+from .idempotency import IdempotencyService
 from .booking import BookingService
+from .admin import AdminService
+from .report import ReportService
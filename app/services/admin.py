@@ -0,0 +1,104 @@
+# coding: utf8
+
+from loguru import logger
+
+from datetime import datetime, timedelta, timezone
+
+from app.models import BookingModel
+from app.repositories import booking_repo, query_sample_repo
+from app.services.base import BaseService
+from app.services.booking import booking_list_cache
+from app.utils import kafka_producer
+from app.utils.entity_cache import booking_cache
+from app.utils.index_advisor import parse_signature, suggest_index, find_covering_index
+from config import Config
+
+
+class AdminService(BaseService):
+    """Service xử lý các chức năng quản trị, vận hành.
+
+    Class này cung cấp các phương thức để:
+    - Xem thống kê các truy vấn chậm đã được lấy mẫu
+    - Gợi ý index cho các tổ hợp bộ lọc chạy nhiều/chậm
+    - Xem thống kê hit/miss của các cache
+    - Xem thống kê gửi message Kafka
+
+    Inheritance:
+        BaseService: Kế thừa các phương thức cơ bản từ base service
+    """
+
+    @classmethod
+    def query_samples(cls, since_hours: int) -> list:
+        """Thống kê các truy vấn chậm theo chữ ký bộ lọc.
+
+        Args:
+            since_hours: Số giờ gần nhất cần thống kê
+
+        Returns:
+            list: Thống kê theo chữ ký bộ lọc kèm plan EXPLAIN (ANALYZE, BUFFERS) gần nhất
+        """
+        since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
+        return [
+            {
+                "signature": row.signature,
+                "samples": row.samples,
+                "avg_ms": round(row.avg_ms, 2),
+                "max_ms": round(row.max_ms, 2),
+                "last_statement": row.last_statement,
+                "last_plan": row.last_plan,
+            }
+            for row in query_sample_repo.summarize(since)
+        ]
+
+    @classmethod
+    def index_advice(cls, since_hours: int) -> list:
+        """Gợi ý index cho các tổ hợp bộ lọc có truy vấn chậm.
+
+        Args:
+            since_hours: Số giờ gần nhất cần phân tích
+
+        Returns:
+            list: Gợi ý theo chữ ký bộ lọc, sắp xếp theo tổng thời gian chậm giảm dần.
+                  covered_by là tên index hiện có đã bao phủ gợi ý (nếu có)
+        """
+        since = datetime.now(timezone.utc) - timedelta(hours=since_hours)
+        table_name = BookingModel.__tablename__
+        existing_indexes = query_sample_repo.existing_indexes(table_name)
+
+        advice = []
+        for row in query_sample_repo.summarize(since):
+            name, fields = parse_signature(row.signature)
+            if not name.startswith(f"{table_name}."):
+                continue
+            suggestion = suggest_index(f'"{Config.POSTGRES_SCHEMA}"."{table_name}"', fields)
+            advice.append({
+                "signature": row.signature,
+                "samples": row.samples,
+                "avg_ms": round(row.avg_ms, 2),
+                "total_ms": round(row.avg_ms * row.samples, 2),
+                "suggested_index": suggestion["definition"] if suggestion else None,
+                "covered_by": find_covering_index(suggestion["columns"], existing_indexes) if suggestion else None,
+            })
+        return advice
+
+    @classmethod
+    def cache_stats(cls) -> dict:
+        """Thống kê hoạt động của các cache trong worker hiện tại.
+
+        Returns:
+            dict: Thống kê (kích thước, hit/miss, tỉ lệ hit, số phần tử bị loại bỏ) của từng cache
+        """
+        return {
+            "booking_list": booking_list_cache.stats(),
+            "booking_detail": booking_cache.stats(),
+            "booking_count_estimate": booking_repo.count_cache.stats(),
+        }
+
+    @classmethod
+    def kafka_stats(cls) -> dict:
+        """Thống kê gửi message Kafka trong worker hiện tại.
+
+        Returns:
+            dict: Số message đã gửi/thành công/lỗi/gửi lại/bị bỏ, đang chờ và độ trễ trung bình
+        """
+        return kafka_producer.stats()
@@ -2,13 +2,112 @@
 
 from loguru import logger
 
-from app.constants.globals import KAFKA_BOOKING_TOPIC
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from flask import g, has_request_context
+
+from app.constants.globals import BOOKING_DUPLICATE_CHECK, LIST_CACHE_MAX_SIZE, LIST_CACHE_TTL, MAX_BATCH_SIZE
 from app.decorators import validate_func, transactional_with_lock
-from app.enum import BookingStatus
-from app.models import BookingModel
+from app.decorators.validate_func import validate_params
+from app.enum import BookingEvent, BookingStatus, CountMode, ExportFormat, NameMatchMode, PaginationMode
+from app.exceptions.exception import BadRequest, NotFound, RequestConflict, UnprocessableEntity, VersionConflict
 from app.repositories import booking_repo
 from app.services.base import BaseService
-from app.utils import kafka_producer
+from app.services.event import EventService
+from app.utils import TTLCache, dumps_json, make_etag, make_version_etag
+from app.utils.entity_cache import booking_cache
+from app.utils.event_codec import EVENT_SCHEMA_VERSION
+
+import csv
+import io
+
+CREATE_BOOKING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "customer_name": {"type": "string"},
+        "phone": {"type": "integer"},
+        "booking_date": {"type": "string", "format": "date-time"},
+        "note": {"type": "string"}
+    },
+    "required": ["customer_name", "phone", "booking_date"]
+}
+
+# Booking đã hủy/từ chối không tính là trùng khi kiểm tra BOOKING_DUPLICATE_CHECK
+DUPLICATE_IGNORED_STATUSES = [BookingStatus.REJECTED.value, BookingStatus.CANCEL.value]
+DUPLICATE_BOOKING_MESSAGE = "Đã có booking với cùng số điện thoại và thời gian đặt"
+
+BOOKING_FILTER_PROPERTIES = {
+    "customer_name": {"type": "string"},
+    "name_match": {
+        "type": "string",
+        "enum": [e.value for e in NameMatchMode],
+        "name": "Cách so khớp tên khách hàng"
+    },
+    "phone": {"type": "integer"},
+    "booking_from": {"type": "string", "format": "date-time"},
+    "booking_to": {"type": "string", "format": "date-time"},
+    "status": {"type": "string"},
+    "created_from": {"type": "string", "format": "date-time"},
+    "created_to": {"type": "string", "format": "date-time"},
+}
+
+BOOKING_FILTER_SCHEMA = {"type": "object", "properties": BOOKING_FILTER_PROPERTIES}
+
+PAGINATE_BOOKING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        **BOOKING_FILTER_PROPERTIES,
+        "page": {"type": "integer", "minimum": 1, "name": "Trang"},
+        "size": {"type": "integer", "minimum": 1, "name": "Kích thước trang"},
+        "pagination": {
+            "type": "string",
+            "enum": [e.value for e in PaginationMode],
+            "name": "Chế độ phân trang"
+        },
+        "cursor": {"type": "string", "name": "Cursor"},
+        "count": {
+            "type": "string",
+            "enum": [e.value for e in CountMode],
+            "name": "Cách tính tổng số bản ghi"
+        },
+    },
+    "enum_type": {
+        "status": BookingStatus
+    }
+}
+
+UPDATE_BOOKING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "booking_id": {"type": "integer"},
+        "customer_name": {"type": "string"},
+        "phone": {"type": "integer"},
+        "booking_date": {"type": "string", "format": "date-time"},
+        "note": {"type": "string"},
+        "status": {"type": "string"},
+        "version": {"type": "integer"}
+    },
+    "required": ["booking_id"],
+    "enum_type": {
+        "status": BookingStatus
+    }
+}
+
+DELETE_BOOKING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "booking_id": {"type": "integer"},
+        "version": {"type": "integer"}
+    },
+    "required": ["booking_id"]
+}
+
+EXPORT_FIELDS = (
+    "id", "customer_name", "phone", "booking_date", "status", "note", "created_at", "updated_at", "version"
+)
+
+# Cache kết quả danh sách theo (thế hệ ghi, tham số đã validate); ghi bất kỳ làm tăng thế hệ ghi
+booking_list_cache = TTLCache(max_size=LIST_CACHE_MAX_SIZE, ttl=LIST_CACHE_TTL)
 
 
 class BookingService(BaseService):
@@ -22,32 +121,15 @@ class BookingService(BaseService):
     """
 
     @classmethod
-    @validate_func(
-        **{
-            "type": "object",
-            "properties": {
-                "customer_name": {"type": "string"},
-                "phone": {"type": "integer"},
-                "booking_from": {"type": "string", "format": "date-time"},
-                "booking_to": {"type": "string", "format": "date-time"},
-                "status": {"type": "string"},
-                "created_from": {"type": "string", "format": "date-time"},
-                "created_to": {"type": "string", "format": "date-time"},
-                "page": {"type": "integer"},
-                "size": {"type": "integer"},
-            },
-            "enum_type": {
-                "status": BookingStatus
-            }
-        }
-    )
+    @validate_func(**PAGINATE_BOOKING_SCHEMA)
     def paginate_booking(cls, args, **kwargs) -> dict:
         """Lấy danh sách booking có phân trang.
 
         Args:
             args: Schema validation args
             kwargs: Tham số lọc và phân trang
-                customer_name (str, optional): Lọc theo tên khách hàng
+                customer_name (str, optional): Lọc theo tên khách hàng (không phân biệt dấu)
+                name_match (str, optional): Cách so khớp tên (contains/prefix/fuzzy), mặc định contains
                 phone (int, optional): Lọc theo số điện thoại
                 booking_from (string, optional): Lọc theo ngày đặt từ
                 booking_to (string, optional): Lọc theo ngay đặt đến
@@ -56,18 +138,51 @@ class BookingService(BaseService):
                 created_to (string, optional): Lọc theo ngày tạo đến
                 page (int, optional): Trang (số) đích
                 size (int, optional): Số lượng trên một trang
+                pagination (str, optional): Chế độ phân trang (offset/cursor), mặc định offset
+                cursor (str, optional): Cursor của trang cần lấy (chỉ dùng với pagination=cursor)
+                count (str, optional): Cách tính tổng số bản ghi (exact/estimate/none), mặc định exact
+
+        Returns:
+            dict: Kết quả phân trang (có thể lấy từ cache nếu chưa có thay đổi nào trên bảng booking)
+        """
+        if LIST_CACHE_TTL <= 0:
+            return cls._paginate_booking(**kwargs)
+
+        key = (cls._write_generation(), tuple(sorted(kwargs.items())))
+        result = booking_list_cache.get(key)
+        if result is None:
+            result = cls._paginate_booking(**kwargs)
+            booking_list_cache.set(key, result)
+        return result
+
+    @classmethod
+    def _paginate_booking(cls, **kwargs) -> dict:
+        """Truy vấn danh sách booking (không qua cache).
+
+        Args:
+            kwargs: Tham số lọc và phân trang đã được validate bởi paginate_booking
 
         Returns:
             dict: Kết quả phân trang
         """
-        list_booking = booking_repo.paginate_all(**kwargs)
+        if kwargs.get("pagination") == PaginationMode.CURSOR.value:
+            return cls._paginate_booking_by_cursor(**kwargs)
+
+        return cls._page_response(booking_repo.paginate_all(**kwargs), **kwargs)
+
+    @classmethod
+    def _page_response(cls, list_booking, **kwargs) -> dict:
+        """Định dạng kết quả phân trang theo số trang.
 
-        response_data = []
-        for booking in list_booking.items:
-            response_data.append(cls._format_booking_response(booking))
+        Args:
+            list_booking: Kết quả của BookingRepository.paginate_all
+            kwargs: Tham số lọc và phân trang
 
+        Returns:
+            dict: Kết quả phân trang
+        """
         return {
-            "data": response_data,
+            "data": cls._format_booking_rows(list_booking.items),
             "pagination": {
                 "has_next": list_booking.has_next,
                 "has_previous": list_booking.has_previous,
@@ -76,7 +191,41 @@ class BookingService(BaseService):
                 "current_page": list_booking.page,
                 "total_pages": list_booking.pages,
                 "per_page": list_booking.per_page,
-                "total": list_booking.total
+                "total": list_booking.total,
+                "count_mode": kwargs.get("count") or CountMode.EXACT.value
+            }
+        }
+
+    @classmethod
+    def _paginate_booking_by_cursor(cls, **kwargs) -> dict:
+        """Lấy danh sách booking phân trang theo cursor (keyset).
+
+        Args:
+            kwargs: Tham số lọc và phân trang đã được validate bởi paginate_booking
+
+        Returns:
+            dict: Kết quả phân trang với next_cursor/prev_cursor thay cho số trang
+        """
+        return cls._cursor_page_response(booking_repo.paginate_cursor(**kwargs))
+
+    @classmethod
+    def _cursor_page_response(cls, list_booking) -> dict:
+        """Định dạng kết quả phân trang theo cursor.
+
+        Args:
+            list_booking: Kết quả của BookingRepository.paginate_cursor
+
+        Returns:
+            dict: Kết quả phân trang với next_cursor/prev_cursor thay cho số trang
+        """
+        return {
+            "data": cls._format_booking_rows(list_booking.items),
+            "pagination": {
+                "has_next": list_booking.has_next,
+                "has_previous": list_booking.has_previous,
+                "next_cursor": list_booking.next_cursor,
+                "prev_cursor": list_booking.prev_cursor,
+                "per_page": list_booking.per_page
             }
         }
 
@@ -85,14 +234,73 @@ class BookingService(BaseService):
         **{
             "type": "object",
             "properties": {
-                "customer_name": {"type": "string"},
-                "phone": {"type": "integer"},
-                "booking_date": {"type": "string", "format": "date-time"},
-                "note": {"type": "string"}
-            },
-            "required": ["customer_name", "phone", "booking_date"]
+                **BOOKING_FILTER_PROPERTIES,
+                "format": {
+                    "type": "string",
+                    "enum": [e.value for e in ExportFormat],
+                    "name": "Định dạng xuất"
+                },
+            }
         }
     )
+    def export_booking(cls, args, **kwargs) -> Iterator[str | bytes]:
+        """Xuất toàn bộ booking khớp bộ lọc dưới dạng CSV hoặc NDJSON.
+
+        Tham số được kiểm tra ngay khi gọi, dữ liệu được đọc dần từ server-side cursor khi duyệt
+        kết quả trả về nên có thể dùng trực tiếp làm body của response dạng stream.
+
+        Args:
+            args: Schema validation args
+            kwargs: Tham số lọc giống paginate_booking và
+                format (str, optional): Định dạng xuất (csv/ndjson), mặc định csv
+
+        Returns:
+            Iterator[str | bytes]: Các khối nội dung file (CSV có dòng tiêu đề ở khối đầu tiên)
+        """
+        if kwargs.get("format") == ExportFormat.NDJSON.value:
+            return cls._export_ndjson(**kwargs)
+        return cls._export_csv(**kwargs)
+
+    @classmethod
+    def _export_csv(cls, **kwargs) -> Iterator[str]:
+        """Sinh nội dung CSV theo từng khối dòng đọc từ repository.
+
+        Args:
+            kwargs: Tham số lọc đã được validate bởi export_booking
+
+        Yields:
+            str: Dòng tiêu đề, sau đó là từng khối dòng dữ liệu
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        yield buffer.getvalue()
+
+        for rows in booking_repo.stream_all(**kwargs):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(
+                [value.isoformat() if isinstance(value, datetime) else value for value in row]
+                for row in rows
+            )
+            yield buffer.getvalue()
+
+    @classmethod
+    def _export_ndjson(cls, **kwargs) -> Iterator[bytes]:
+        """Sinh nội dung NDJSON (mỗi dòng một booking) theo từng khối dòng đọc từ repository.
+
+        Args:
+            kwargs: Tham số lọc đã được validate bởi export_booking
+
+        Yields:
+            bytes: Từng khối dòng JSON
+        """
+        for rows in booking_repo.stream_all(**kwargs):
+            yield b"".join(dumps_json(booking) + b"\n" for booking in cls._format_booking_rows(rows))
+
+    @classmethod
+    @transactional_with_lock()
+    @validate_func(**CREATE_BOOKING_SCHEMA)
     def create_booking(cls, args, **kwargs) -> dict:
         """Tạo mới booking.
 
@@ -105,21 +313,122 @@ class BookingService(BaseService):
 
         Returns:
             dict: Thông tin booking đã tạo
+
+        Raises:
+            RequestConflict: Khi bật BOOKING_DUPLICATE_CHECK và đã có booking cùng số điện thoại, thời gian đặt
         """
+        if BOOKING_DUPLICATE_CHECK and cls._find_duplicates([kwargs]):
+            raise RequestConflict(DUPLICATE_BOOKING_MESSAGE)
 
-        booking = booking_repo.insert(**kwargs)
+        booking = cls._format_booking_response(booking_repo.add(**kwargs))
 
-        # Gửi thông báo qua Kafka sau khi tạo booking thành công
-        kafka_producer.send(
-            topic=KAFKA_BOOKING_TOPIC,
-            key=str(booking.id),
-            value={
-                "event": "booking_created",
-                "booking_id": booking.id
-            }
-        )
+        # Sự kiện được ghi cùng transaction, chỉ được gửi tới Kafka khi booking đã commit
+        EventService.publish([cls._booking_event(BookingEvent.CREATED, booking)])
 
-        return cls._format_booking_response(booking)
+        return booking
+
+    @classmethod
+    @transactional_with_lock()
+    @validate_func(
+        **{
+            "type": "object",
+            "properties": {
+                "bookings": {"type": "array", "minItems": 1, "maxItems": MAX_BATCH_SIZE, "name": "Danh sách booking"}
+            },
+            "required": ["bookings"]
+        }
+    )
+    def bulk_create_booking(cls, args, **kwargs) -> dict:
+        """Tạo mới nhiều booking trong một lần.
+
+        Toàn bộ danh sách được kiểm tra trong một lượt, các booking hợp lệ được thêm bằng một
+        câu lệnh INSERT nhiều dòng và các sự kiện được ghi vào outbox trong cùng transaction.
+        Booking không hợp lệ (hoặc trùng khi bật BOOKING_DUPLICATE_CHECK) không làm ảnh hưởng tới
+        các booking còn lại.
+
+        Args:
+            args: Schema validation args
+            kwargs: Thông tin
+                bookings (list): Danh sách booking cần tạo, mỗi phần tử có cấu trúc như create_booking
+
+        Returns:
+            dict: Số lượng thành công/thất bại và kết quả theo từng phần tử (theo index trong danh sách)
+        """
+        results = []
+        valid_items = []
+        for index, item in enumerate(kwargs.get("bookings")):
+            try:
+                if not isinstance(item, dict):
+                    raise BadRequest("Dữ liệu không hợp lệ")
+                valid_items.append((index, validate_params(CREATE_BOOKING_SCHEMA, item)))
+            except BadRequest as error:
+                results.append({"index": index, "success": False, "error": error.to_dict})
+
+        if BOOKING_DUPLICATE_CHECK and valid_items:
+            valid_items = cls._exclude_duplicates(valid_items, results)
+
+        if valid_items:
+            bookings = booking_repo.bulk_insert([item for _, item in valid_items])
+            formatted = cls._format_booking_rows(bookings)
+            results.extend(
+                {"index": index, "success": True, "data": data}
+                for (index, _), data in zip(valid_items, formatted)
+            )
+
+            EventService.publish([cls._booking_event(BookingEvent.CREATED, booking) for booking in formatted])
+
+        results.sort(key=lambda result: result["index"])
+        return {
+            "total": len(results),
+            "succeeded": len(valid_items),
+            "failed": len(results) - len(valid_items),
+            "results": results
+        }
+
+    @classmethod
+    def _find_duplicates(cls, items: list) -> set:
+        """Tìm các booking đang hiệu lực trùng số điện thoại và thời gian đặt với danh sách cần tạo.
+
+        Lấy advisory lock theo số điện thoại (tới hết transaction) trước khi kiểm tra để hai request
+        tạo cùng một booking chạy đồng thời không cùng vượt qua kiểm tra.
+
+        Args:
+            items: Danh sách booking đã validate (có phone, booking_date)
+
+        Returns:
+            set: Các tuple (phone, booking_date) đã tồn tại
+        """
+        pairs = {cls._duplicate_key(item) for item in items}
+        booking_repo.lock_phones([phone for phone, _ in pairs])
+        return booking_repo.select_duplicates(list(pairs), DUPLICATE_IGNORED_STATUSES)
+
+    @classmethod
+    def _exclude_duplicates(cls, valid_items: list, results: list) -> list:
+        """Loại các booking trùng (với database hoặc với phần tử trước đó trong lô) khỏi danh sách cần tạo.
+
+        Args:
+            valid_items: Danh sách tuple (index, booking đã validate)
+            results: Danh sách kết quả, phần tử trùng được thêm vào với lỗi 409
+
+        Returns:
+            list: Các tuple (index, booking) không trùng
+        """
+        seen = cls._find_duplicates([item for _, item in valid_items])
+        remaining = []
+        for index, item in valid_items:
+            key = cls._duplicate_key(item)
+            if key in seen:
+                results.append({
+                    "index": index, "success": False, "error": RequestConflict(DUPLICATE_BOOKING_MESSAGE).to_dict
+                })
+                continue
+            seen.add(key)
+            remaining.append((index, item))
+        return remaining
+
+    @staticmethod
+    def _duplicate_key(item: dict) -> tuple:
+        return item["phone"], datetime.fromisoformat(item["booking_date"])
 
     @classmethod
     def get_booking(cls, booking_id: int) -> dict:
@@ -134,35 +443,100 @@ class BookingService(BaseService):
         Raises:
             NotFound: Khi booking không tồn tại hoặc đã bị xóa
         """
-        booking = cls.validate_entity_id(booking_repo, booking_id)
-        return cls._format_booking_response(booking)
+        booking = booking_cache.get_or_load(booking_id, lambda: cls._load_booking(booking_id))
+        if not booking:
+            raise NotFound(f"#{booking_id} không tồn tại trên hệ thống")
+        return booking
 
     @classmethod
-    @transactional_with_lock(
-        lock_models=[
-            (BookingModel, lambda kwargs: BookingModel.id == kwargs.get("booking_id"))
-        ]
-    )
-    @validate_func(
-        **{
-            "type": "object",
-            "properties": {
-                "booking_id": {"type": "integer"},
-                "customer_name": {"type": "string"},
-                "phone": {"type": "integer"},
-                "booking_date": {"type": "string", "format": "date-time"},
-                "note": {"type": "string"},
-                "status": {"type": "string"}
-            },
-            "required": ["booking_id"],
-            "enum_type": {
-                "status": BookingStatus
-            }
-        }
-    )
+    def booking_etag(cls, booking_id: int) -> str:
+        """Tính ETag của booking từ ID và phiên bản (dạng "<id>.<version>", dùng lại được cho If-Match).
+
+        Dùng bản đã cache nếu có, nếu không chỉ đọc phiên bản (không đọc toàn bộ bản ghi).
+
+        Args:
+            booking_id (int): ID của booking
+
+        Returns:
+            str: Giá trị ETag
+
+        Raises:
+            NotFound: Khi booking không tồn tại hoặc đã bị xóa
+        """
+        booking = booking_cache.get(booking_id)
+        if booking:
+            return make_version_etag(booking_id, booking["version"])
+
+        version = booking_repo.select_version_by_id(booking_id)
+        if version is None:
+            raise NotFound(f"#{booking_id} không tồn tại trên hệ thống")
+        return make_version_etag(booking_id, version)
+
+    @classmethod
+    def response_etag(cls, booking: dict) -> str:
+        """Tính ETag của booking vừa ghi (trả về cùng response để client dùng cho If-Match tiếp theo).
+
+        Args:
+            booking (dict): Booking đã định dạng như response
+
+        Returns:
+            str: Giá trị ETag
+        """
+        return make_version_etag(booking["id"], booking["version"])
+
+    @classmethod
+    def paginate_booking_etag(cls, **kwargs) -> str:
+        """Tính ETag của danh sách booking từ tham số lọc/phân trang và thế hệ ghi của bảng booking.
+
+        Thế hệ ghi tăng sau mỗi câu lệnh ghi đã commit nên ETag thay đổi khi có bất kỳ thay đổi nào.
+
+        Args:
+            kwargs: Tham số lọc và phân trang giống paginate_booking
+
+        Returns:
+            str: Giá trị ETag
+        """
+        return make_etag("bookings", cls._write_generation(), kwargs)
+
+    @classmethod
+    def _write_generation(cls) -> int:
+        """Lấy thế hệ ghi của bảng booking, chỉ đọc một lần trong mỗi request.
+
+        Thế hệ ghi được đọc qua cùng bind với dữ liệu (primary hoặc replica) nên luôn khớp với snapshot
+        dùng để truy vấn danh sách.
+
+        Returns:
+            int: Giá trị thế hệ ghi (tổng các slot của booking_generation)
+        """
+        if not has_request_context():
+            return booking_repo.select_generation()
+        if "booking_generation" not in g:
+            g.booking_generation = booking_repo.select_generation()
+        return g.booking_generation
+
+    @classmethod
+    def _load_booking(cls, booking_id: int) -> dict | None:
+        """Đọc booking từ database và định dạng response (dùng để nạp cache).
+
+        Args:
+            booking_id (int): ID của booking
+
+        Returns:
+            dict | None: Thông tin chi tiết của booking hoặc None nếu không tồn tại
+        """
+        booking = booking_repo.select_row_by_id(booking_id)
+        return cls._format_booking_rows([booking])[0] if booking else None
+
+    @classmethod
+    @transactional_with_lock()
+    @validate_func(**UPDATE_BOOKING_SCHEMA)
     def update_booking(cls, args, **kwargs) -> dict:
         """Cập nhật thông tin booking.
 
+        Booking được cập nhật bằng một câu lệnh UPDATE ... RETURNING chỉ gồm các trường được truyền
+        (không SELECT/lock trước, trạng thái cũ và dữ liệu sau cập nhật được trả về trong cùng câu
+        lệnh). Nếu truyền version (cập nhật lạc quan), booking chỉ được cập nhật khi phiên bản khớp.
+
         Args:
             args: Schema validation args
             kwargs: Thông tin cập nhật
@@ -171,49 +545,267 @@ class BookingService(BaseService):
                 phone (int, optional): Số điện thoại mới
                 booking_date (string, optional): Ngày đặt mới
                 status (int, optional): Tình trạng booking mới
+                version (int, optional): Phiên bản mong đợi của booking
 
         Returns:
             dict: Thông tin booking sau khi cập nhật
 
         Raises:
             NotFound: Khi booking cần cập nhật không tồn tại hoặc đã bị xóa
+            VersionConflict: Khi phiên bản không khớp
         """
-        booking = booking_repo.update_by_id(kwargs.get("booking_id"), **kwargs)
+        booking_id, version = kwargs.get("booking_id"), kwargs.get("version")
+        changes = {field: kwargs[field] for field in booking_repo.UPDATE_FIELDS if field in kwargs}
+        if not changes:
+            # Không có trường cần cập nhật: chỉ kiểm tra sự tồn tại và phiên bản, không làm mới cache/phát sự kiện
+            row = booking_repo.select_row_by_id(booking_id)
+            if row is None or (version is not None and row.version != version):
+                cls._raise_write_error(booking_id, version)
+            return cls._format_booking_rows([row])[0]
+
+        row = booking_repo.update_returning(booking_id, version, **changes)
+        if row is None:
+            cls._raise_write_error(booking_id, version)
+        previous_status, booking = row[0], cls._format_booking_rows([row[1:]])[0]
+        booking_cache.invalidate(booking["id"])
+        EventService.publish([cls._update_event(booking, previous_status)])
+
+        return booking
+
+    @classmethod
+    @transactional_with_lock()
+    @validate_func(**DELETE_BOOKING_SCHEMA)
+    def delete_booking(cls, args, **kwargs) -> None:
+        """Xóa booking bằng một câu lệnh UPDATE ... RETURNING (không SELECT/lock trước).
+
+        Nếu truyền version, booking chỉ bị xóa khi phiên bản khớp.
+
+        Args:
+            args: Schema validation args
+            kwargs: Thông tin
+                booking_id: ID booking cần xóa
+                version (int, optional): Phiên bản mong đợi của booking
 
-        return cls._format_booking_response(booking)
+        Raises:
+            NotFound: Khi booking cần cập nhật không tồn tại hoặc đã bị xóa
+            VersionConflict: Khi phiên bản không khớp
+        """
+        booking_id, version = kwargs.get("booking_id"), kwargs.get("version")
+        row = booking_repo.soft_delete_returning(booking_id, version)
+        if row is None:
+            cls._raise_write_error(booking_id, version)
+        booking_cache.invalidate(booking_id)
+        EventService.publish([cls._booking_event(BookingEvent.DELETED, cls._format_booking_rows([row])[0])])
 
     @classmethod
-    @transactional_with_lock(
-        lock_models=[
-            (BookingModel, lambda kwargs: BookingModel.id == kwargs.get("booking_id"))
-        ]
-    )
+    def _raise_write_error(cls, booking_id: int, version: int = None) -> None:
+        """Báo lỗi khi câu lệnh cập nhật/xóa không tác động tới bản ghi nào.
+
+        Chỉ đọc lại phiên bản hiện tại khi cập nhật lạc quan (để phân biệt không tồn tại và lệch phiên bản).
+
+        Raises:
+            NotFound: Khi booking không tồn tại hoặc đã bị xóa
+            VersionConflict: Khi booking tồn tại nhưng phiên bản khác version
+        """
+        current = booking_repo.select_version_by_id(booking_id) if version is not None else None
+        if current is None:
+            raise NotFound(f"#{booking_id} không tồn tại trên hệ thống")
+        raise VersionConflict(f"#{booking_id} đã được cập nhật (phiên bản {current}, yêu cầu phiên bản {version})")
+
+    @classmethod
+    @transactional_with_lock()
     @validate_func(
         **{
             "type": "object",
             "properties": {
-                "booking_id": {"type": "integer"}
+                "ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "maxItems": MAX_BATCH_SIZE,
+                    "name": "Danh sách ID"
+                },
+                "filter": {"type": "object", "name": "Bộ lọc"},
+                "status": {"type": "string", "enum": [e.value for e in BookingStatus], "name": "Trạng thái"}
             },
-            "required": ["booking_id"]
+            "required": ["status"]
         }
     )
-    def delete_booking(cls, args, **kwargs) -> None:
-        """Xóa booking.
+    def bulk_update_status(cls, args, **kwargs) -> dict:
+        """Chuyển trạng thái nhiều booking trong một câu lệnh UPDATE.
+
+        Chỉ các booking đang ở trạng thái được phép chuyển sang trạng thái mới
+        (BOOKING_STATUS_TRANSITIONS) mới được cập nhật.
 
         Args:
             args: Schema validation args
             kwargs: Thông tin
-                booking_id: ID booking cần xóa
+                ids (list, optional): Danh sách ID booking cần cập nhật
+                filter (dict, optional): Bộ lọc như khi lấy danh sách (dùng khi không truyền ids)
+                status (str): Trạng thái mới
+
+        Returns:
+            dict: Số lượng thành công/thất bại và kết quả theo từng ID
 
         Raises:
-            NotFound: Khi booking cần cập nhật không tồn tại hoặc đã bị xóa
+            BadRequest: Khi không truyền ids hoặc filter
         """
-        booking_repo.delete_by_id(kwargs.get("booking_id"))
+        ids, filters = cls._validate_bulk_target(**kwargs)
+        status = kwargs.get("status")
+
+        updated = booking_repo.bulk_update_status(status, BookingStatus.sources_of(status), ids=ids, filters=filters)
+        updated_ids = {row.id for row in updated}
+        booking_cache.invalidate(*updated_ids)
+        EventService.publish([
+            cls._booking_event(BookingEvent.STATUS_CHANGED, booking, previous_status=row.previous_status)
+            for row, booking in zip(updated, cls._format_booking_rows([row[1:] for row in updated]))
+        ])
+        results = [{"id": row.id, "success": True} for row in updated]
+
+        missing_ids = [booking_id for booking_id in dict.fromkeys(ids or []) if booking_id not in updated_ids]
+        if missing_ids:
+            current_status = booking_repo.select_status_by_ids(missing_ids)
+            for booking_id in missing_ids:
+                if booking_id in current_status:
+                    error = UnprocessableEntity(
+                        f"#{booking_id} không thể chuyển trạng thái từ {current_status[booking_id]} sang {status}"
+                    )
+                else:
+                    error = NotFound(f"#{booking_id} không tồn tại trên hệ thống")
+                results.append({"id": booking_id, "success": False, "error": error.to_dict})
+
+        return {
+            "status": status,
+            "succeeded": len(updated),
+            "failed": len(results) - len(updated),
+            "results": results
+        }
+
+    @classmethod
+    @transactional_with_lock()
+    @validate_func(
+        **{
+            "type": "object",
+            "properties": {
+                "ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "maxItems": MAX_BATCH_SIZE,
+                    "name": "Danh sách ID"
+                },
+                "filter": {"type": "object", "name": "Bộ lọc"}
+            }
+        }
+    )
+    def bulk_delete_booking(cls, args, **kwargs) -> dict:
+        """Xóa mềm nhiều booking trong một câu lệnh UPDATE.
+
+        Args:
+            args: Schema validation args
+            kwargs: Thông tin
+                ids (list, optional): Danh sách ID booking cần xóa
+                filter (dict, optional): Bộ lọc như khi lấy danh sách (dùng khi không truyền ids)
+
+        Returns:
+            dict: Số lượng thành công/thất bại và kết quả theo từng ID
+
+        Raises:
+            BadRequest: Khi không truyền ids hoặc filter
+        """
+        ids, filters = cls._validate_bulk_target(**kwargs)
+
+        deleted = cls._format_booking_rows(booking_repo.bulk_soft_delete(ids=ids, filters=filters))
+        deleted_ids = [booking["id"] for booking in deleted]
+        booking_cache.invalidate(*deleted_ids)
+        EventService.publish([cls._booking_event(BookingEvent.DELETED, booking) for booking in deleted])
+        results = [{"id": booking_id, "success": True} for booking_id in deleted_ids]
+
+        missing_ids = [booking_id for booking_id in dict.fromkeys(ids or []) if booking_id not in set(deleted_ids)]
+        results.extend(
+            {
+                "id": booking_id,
+                "success": False,
+                "error": NotFound(f"#{booking_id} không tồn tại trên hệ thống").to_dict
+            }
+            for booking_id in missing_ids
+        )
+
+        return {
+            "succeeded": len(deleted_ids),
+            "failed": len(results) - len(deleted_ids),
+            "results": results
+        }
+
+    @classmethod
+    def _validate_bulk_target(cls, **kwargs) -> tuple:
+        """Kiểm tra đối tượng của thao tác theo lô (danh sách ID hoặc bộ lọc).
+
+        Args:
+            kwargs: Tham số chứa ids hoặc filter
+
+        Returns:
+            tuple: (ids, filters) đã được kiểm tra
+
+        Raises:
+            BadRequest: Khi không truyền ids hoặc filter, hoặc bộ lọc không hợp lệ
+        """
+        ids = kwargs.get("ids")
+        filters = kwargs.get("filter")
+        if not ids and not filters:
+            raise BadRequest("Cần truyền danh sách ID hoặc bộ lọc")
+        if ids:
+            return ids, None
+        filters = validate_params(BOOKING_FILTER_SCHEMA, filters)
+        if not filters:
+            raise BadRequest("Bộ lọc không hợp lệ")
+        return None, filters
+
+    @classmethod
+    def _booking_event(cls, event_type: BookingEvent, booking: dict, previous_status: str = None) -> tuple:
+        """Tạo sự kiện booking (kèm toàn bộ dữ liệu booking) để phát qua EventService.publish.
+
+        Args:
+            event_type (BookingEvent): Loại sự kiện
+            booking (dict): Booking đã định dạng như response
+            previous_status (str, optional): Trạng thái trước khi thay đổi (sự kiện booking_status_changed)
+
+        Returns:
+            tuple: (event_type, key, payload)
+        """
+        payload = {
+            "event": event_type.value,
+            "version": EVENT_SCHEMA_VERSION,
+            "booking_id": booking["id"],
+            "occurred_at": datetime.now(timezone.utc).isoformat(),
+            "booking": {
+                key: value.isoformat() if isinstance(value, datetime) else value for key, value in booking.items()
+            },
+        }
+        if previous_status:
+            payload["previous_status"] = previous_status
+        return event_type.value, str(booking["id"]), payload
+
+    @classmethod
+    def _update_event(cls, booking: dict, previous_status: str) -> tuple:
+        """Tạo sự kiện sau khi cập nhật booking: booking_status_changed nếu trạng thái thay đổi, ngược lại booking_updated.
+
+        Args:
+            booking (dict): Booking sau cập nhật đã định dạng như response
+            previous_status (str): Trạng thái trước khi cập nhật
+
+        Returns:
+            tuple: (event_type, key, payload)
+        """
+        if previous_status != booking["status"]:
+            return cls._booking_event(BookingEvent.STATUS_CHANGED, booking, previous_status=previous_status)
+        return cls._booking_event(BookingEvent.UPDATED, booking)
 
     @classmethod
     def _format_booking_response(cls, booking) -> dict:
         """Định dạng dữ liệu response cho bản ghi booking.
 
+        Các trường thời gian được giữ nguyên kiểu datetime, JSON provider của ứng dụng serialize
+        trực tiếp theo ISO 8601.
+
         Args:
             booking (bookingModel): Booking entity
 
@@ -224,9 +816,39 @@ class BookingService(BaseService):
             "id": booking.id,
             "customer_name": booking.customer_name,
             "phone": booking.phone,
-            "booking_date": booking.booking_date.isoformat(),
+            "booking_date": booking.booking_date,
             "status": booking.status,
             "note": booking.note,
-            "created_at": booking.created_at.isoformat(),
-            "updated_at": booking.updated_at.isoformat() if booking.updated_at else None,
+            "created_at": booking.created_at,
+            "updated_at": booking.updated_at,
+            "version": booking.version,
         }
+
+    @classmethod
+    def _format_booking_rows(cls, rows: list) -> list:
+        """Định dạng dữ liệu response cho danh sách bản ghi booking dạng Row.
+
+        Row được đọc theo vị trí cột của BookingRepository.READ_COLUMNS
+        (id, customer_name, phone, booking_date, status, note, created_at, updated_at, version),
+        kết quả giống hệt _format_booking_response.
+
+        Args:
+            rows (list): Danh sách Row đọc từ BookingRepository
+
+        Returns:
+            list: Danh sách dict response
+        """
+        return [
+            {
+                "id": booking_id,
+                "customer_name": customer_name,
+                "phone": phone,
+                "booking_date": booking_date,
+                "status": status,
+                "note": note,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "version": version,
+            }
+            for booking_id, customer_name, phone, booking_date, status, note, created_at, updated_at, version in rows
+        ]
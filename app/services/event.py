@@ -0,0 +1,126 @@
+# coding: utf8
+
+from loguru import logger
+
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event
+
+from app import db
+from app.constants.globals import (
+    EVENT_PUBLISH_MODE, KAFKA_BOOKING_TOPIC, OUTBOX_PUBLISH_TIMEOUT, OUTBOX_RETENTION_HOURS
+)
+from app.enum import EventPublishMode
+from app.repositories import outbox_repo
+from app.services.base import BaseService
+from app.utils import event_codec, kafka_producer
+from app.utils.db_router import RoutingSession
+
+PENDING_EVENTS_KEY = "pending_events"
+
+
+class EventService(BaseService):
+    """Service phát sự kiện booking.
+
+    Class này cung cấp các phương thức để:
+    - Phát sự kiện trong transaction hiện tại (publish)
+    - Gửi các sự kiện trong outbox tới Kafka (relay_batch, purge_sent)
+
+    Chế độ outbox (mặc định): sự kiện được ghi vào bảng booking_outbox cùng transaction với thay đổi
+    của booking nên không bị mất khi process dừng giữa chừng; relay gửi tới Kafka sau đó.
+    Chế độ direct: sự kiện được giữ trong session và gửi tới Kafka ngay sau khi transaction commit.
+    Sự kiện được mã hóa bằng event_codec khi gửi (outbox lưu dạng JSON).
+
+    Inheritance:
+        BaseService: Kế thừa các phương thức cơ bản từ base service
+    """
+
+    @classmethod
+    def publish(cls, events: list, topic: str = KAFKA_BOOKING_TOPIC) -> None:
+        """Phát các sự kiện trong transaction hiện tại (chỉ được gửi đi nếu transaction commit).
+
+        Args:
+            events: Danh sách tuple (event_type, key, payload)
+            topic: Topic Kafka
+        """
+        if not events:
+            return
+        if EVENT_PUBLISH_MODE == EventPublishMode.DIRECT.value:
+            db.session.info.setdefault(PENDING_EVENTS_KEY, []).extend(
+                (topic, key, payload) for _, key, payload in events
+            )
+            return
+
+        outbox_repo.add_events([
+            {"topic": topic, "message_key": key, "event_type": event_type, "payload": payload}
+            for event_type, key, payload in events
+        ])
+
+    @classmethod
+    def relay_batch(cls, batch_size: int) -> int:
+        """Nhận một lô sự kiện chưa gửi trong outbox, gửi tới Kafka và đánh dấu đã gửi.
+
+        Các dòng được khóa bằng FOR UPDATE SKIP LOCKED trong suốt quá trình gửi nên nhiều relay
+        có thể chạy song song mà không gửi trùng. Sự kiện gửi lỗi được giữ lại để gửi ở lần sau
+        (at-least-once).
+
+        Args:
+            batch_size: Số sự kiện tối đa của một lô
+
+        Returns:
+            int: Số sự kiện đã nhận trong lô
+        """
+        try:
+            rows = outbox_repo.claim_batch(batch_size)
+            if rows:
+                errors = kafka_producer.deliver(
+                    [(row.topic, row.message_key, *event_codec.encode(row.payload)) for row in rows],
+                    timeout=OUTBOX_PUBLISH_TIMEOUT
+                )
+                outbox_repo.mark_sent([row.id for row, error in zip(rows, errors) if error is None])
+                failed = {row.id: error for row, error in zip(rows, errors) if error is not None}
+                if failed:
+                    logger.warning(f"Outbox: {len(failed)}/{len(rows)} sự kiện gửi lỗi, sẽ gửi lại")
+                    outbox_repo.mark_failed(failed)
+            db.session.commit()
+            return len(rows)
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            db.session.close()
+
+    @classmethod
+    def purge_sent(cls) -> int:
+        """Xóa các sự kiện đã gửi lâu hơn OUTBOX_RETENTION_HOURS giờ.
+
+        Returns:
+            int: Số sự kiện đã xóa
+        """
+        try:
+            deleted = outbox_repo.purge_sent(datetime.now(timezone.utc) - timedelta(hours=OUTBOX_RETENTION_HOURS))
+            db.session.commit()
+            return deleted
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            db.session.close()
+
+
+def _send_pending_events(session) -> None:
+    """Gửi các sự kiện của chế độ direct sau khi transaction commit."""
+    events = session.info.pop(PENDING_EVENTS_KEY, None)
+    for topic, key, payload in events or []:
+        try:
+            value, headers = event_codec.encode(payload)
+            kafka_producer.send(topic=topic, key=key, value=value, headers=headers)
+        except RuntimeError as e:
+            logger.error(f"Không thể gửi sự kiện {topic}/{key}: {e}")
+
+
+def _discard_pending_events(session, previous_transaction) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+event.listen(RoutingSession, "after_commit", _send_pending_events)
+event.listen(RoutingSession, "after_soft_rollback", _discard_pending_events)
@@ -0,0 +1,88 @@
+# coding: utf8
+
+from sqlalchemy.engine import Row
+
+from app.constants.globals import IDEMPOTENCY_TTL
+from app.decorators import transactional_with_lock
+from app.exceptions.exception import RequestConflict, UnprocessableEntity
+from app.repositories import idempotency_repo
+from app.services.base import BaseService
+
+
+class IdempotencyService(BaseService):
+    """Service quản lý Idempotency-Key của các request ghi.
+
+    Class này cung cấp các phương thức để:
+    - Giữ key trước khi xử lý request hoặc lấy response đã lưu (begin)
+    - Lưu response sau khi xử lý (complete) hoặc bỏ key khi response không lưu được (release)
+    - Dọn các key đã hết hạn (purge_expired)
+
+    begin/complete/release không commit: chúng chạy trong cùng transaction với việc xử lý request, do
+    decorator idempotent quản lý. Key vừa ghi bị khóa tới khi transaction kết thúc nên request gửi lại
+    đồng thời với cùng key phải chờ, không request nào khác ghi đè hoặc xóa được key này.
+
+    Inheritance:
+        BaseService: Kế thừa các phương thức cơ bản từ base service
+    """
+
+    @classmethod
+    def begin(cls, scope: str, key: str, request_hash: str) -> Row | None:
+        """Giữ key cho request hiện tại, hoặc lấy response đã lưu nếu key đã được dùng.
+
+        Args:
+            scope: Phạm vi của key (ví dụ tên route)
+            key: Giá trị header Idempotency-Key
+            request_hash: Hash nội dung request
+
+        Nếu một transaction khác đang giữ key, câu lệnh ghi key chờ transaction đó kết thúc.
+
+        Returns:
+            Row | None: None nếu request cần được xử lý, ngược lại là Row
+            (request_hash, status_code, response_body, content_type) của response đã lưu
+
+        Raises:
+            UnprocessableEntity: Khi key đã được dùng cho request có nội dung khác
+            RequestConflict: Khi key bị request khác thay đổi trong lúc đọc (client thử lại)
+        """
+        if idempotency_repo.claim(scope, key, request_hash, IDEMPOTENCY_TTL):
+            return None
+
+        stored = idempotency_repo.select_by_key(scope, key)
+        if stored is None or stored.status_code is None:
+            raise RequestConflict("Request với Idempotency-Key này đang được xử lý, vui lòng thử lại sau")
+        if stored.request_hash != request_hash:
+            raise UnprocessableEntity("Idempotency-Key đã được dùng cho request có nội dung khác")
+        return stored
+
+    @classmethod
+    def complete(cls, scope: str, key: str, status_code: int, body: str, content_type: str) -> None:
+        """Lưu response của request đã xử lý xong (trong transaction đã ghi key).
+
+        Args:
+            scope: Phạm vi của key
+            key: Giá trị header Idempotency-Key
+            status_code: Mã trạng thái HTTP
+            body: Nội dung response
+            content_type: Content-Type của response
+        """
+        idempotency_repo.save_response(scope, key, status_code, body, content_type)
+
+    @classmethod
+    def release(cls, scope: str, key: str) -> None:
+        """Bỏ key trong transaction đã ghi key, khi response không lưu được (client có thể gửi lại với cùng key).
+
+        Args:
+            scope: Phạm vi của key
+            key: Giá trị header Idempotency-Key
+        """
+        idempotency_repo.delete_key(scope, key)
+
+    @classmethod
+    @transactional_with_lock()
+    def purge_expired(cls) -> int:
+        """Xóa các key đã hết hạn.
+
+        Returns:
+            int: Số key đã xóa
+        """
+        return idempotency_repo.purge_expired()
@@ -2,6 +2,13 @@
 
 from loguru import logger
 
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.constants.globals import REPORT_DEFAULT_DAYS, REPORT_MAX_DAYS, REPORT_TIMEZONE
+from app.decorators import validate_func
+from app.enum import BookingStatus
+from app.exceptions.exception import BadRequest
 from app.repositories import booking_repo
 from app.services.base import BaseService
 
@@ -17,12 +24,83 @@ class ReportService(BaseService):
     """
 
     @classmethod
-    def summary_by_date(cls) -> dict:
+    @validate_func(
+        **{
+            "type": "object",
+            "properties": {
+                "date_from": {"type": "string", "format": "date", "name": "Từ ngày"},
+                "date_to": {"type": "string", "format": "date", "name": "Đến ngày"},
+                "timezone": {"type": "string", "maxLength": 64, "name": "Múi giờ"},
+                "status": {
+                    "type": "string",
+                    "enum": [e.value for e in BookingStatus],
+                    "name": "Trạng thái"
+                },
+                "group_by_status": {"type": "boolean", "name": "Chia theo trạng thái"},
+            }
+        }
+    )
+    def summary_by_date(cls, args, **kwargs) -> dict:
         """Lấy số lượng booking theo ngày.
 
+        Args:
+            args: Schema validation args
+            kwargs: Tham số báo cáo
+                date_from (str, optional): Từ ngày (YYYY-MM-DD), mặc định REPORT_DEFAULT_DAYS ngày trước date_to
+                date_to (str, optional): Đến ngày (YYYY-MM-DD, bao gồm), mặc định hôm nay
+                timezone (str, optional): Múi giờ IANA dùng để xác định ngày, mặc định REPORT_TIMEZONE
+                status (str, optional): Chỉ đếm booking ở trạng thái này
+                group_by_status (bool, optional): Trả thêm số lượng theo từng trạng thái
+
         Returns:
-            dict: Kết quả tổng hợp số lượng booking theo ngày
+            dict: {DD/MM/YYYY: số lượng} hoặc {DD/MM/YYYY: {"total", "by_status"}} nếu group_by_status,
+                gồm mọi ngày trong khoảng (ngày không có booking có giá trị 0)
+
+        Raises:
+            BadRequest: Nếu múi giờ hoặc khoảng ngày không hợp lệ
         """
-        list_booking = booking_repo.count_by_booking_date()
+        timezone = kwargs.get("timezone") or REPORT_TIMEZONE
+        try:
+            tz = ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise BadRequest("Múi giờ không hợp lệ")
+
+        date_to = date.fromisoformat(kwargs["date_to"]) if kwargs.get("date_to") else datetime.now(tz).date()
+        date_from = (
+            date.fromisoformat(kwargs["date_from"]) if kwargs.get("date_from")
+            else date_to - timedelta(days=REPORT_DEFAULT_DAYS - 1)
+        )
+        if date_from > date_to:
+            raise BadRequest("Từ ngày phải nhỏ hơn hoặc bằng đến ngày")
+        days = (date_to - date_from).days + 1
+        if days > REPORT_MAX_DAYS:
+            raise BadRequest(f"Khoảng thời gian báo cáo tối đa {REPORT_MAX_DAYS} ngày")
+
+        start = datetime.combine(date_from, time.min, tzinfo=tz)
+        end = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=tz)
+        # Bảng tổng hợp lưu theo giờ (UTC) nên chỉ hỗ trợ múi giờ lệch tròn giờ
+        if any(moment.utcoffset().total_seconds() % 3600 for moment in (start, end)):
+            raise BadRequest("Múi giờ không được hỗ trợ")
+
+        rows = booking_repo.count_by_booking_date(
+            start=start,
+            end=end,
+            timezone=timezone,
+            status=kwargs.get("status")
+        )
+
+        group_by_status = kwargs.get("group_by_status")
+        summary = {
+            date_from + timedelta(days=i): {"total": 0, "by_status": {}} if group_by_status else 0
+            for i in range(days)
+        }
+        for booking_date, status, total in rows:
+            if booking_date not in summary:
+                continue
+            if group_by_status:
+                summary[booking_date]["total"] += total
+                summary[booking_date]["by_status"][status] = total
+            else:
+                summary[booking_date] += total
 
-        return {r.booking_date: r.total for r in list_booking}
+        return {day.strftime("%d/%m/%Y"): value for day, value in summary.items()}
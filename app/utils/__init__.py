@@ -1,4 +1,7 @@
 # coding: utf8
 
-from .common_helper import paginate_format, remove_none_in_dict
+from .common_helper import paginate_format, page_format, cursor_paginate_format, remove_none_in_dict, encode_cursor, decode_cursor, make_etag, make_version_etag, parse_version_etag
+from .cache import TTLCache
 from .kafka_utils import kafka_producer
+from .event_codec import event_codec
+from .json_provider import FastJSONProvider, dumps_json
@@ -0,0 +1,106 @@
+# coding: utf8
+
+from collections import OrderedDict
+from threading import Lock
+
+import time
+
+
+class TTLCache:
+    """Cache trong bộ nhớ có giới hạn kích thước (LRU) và thời gian sống (TTL).
+
+    Cache an toàn khi dùng đa luồng, mỗi worker process có một bản riêng.
+
+    Attributes:
+        max_size: Số lượng phần tử tối đa, vượt quá sẽ loại bỏ phần tử ít dùng nhất
+        ttl: Thời gian sống (giây) của mỗi phần tử
+        hits: Số lần lấy dữ liệu trúng cache
+        misses: Số lần lấy dữ liệu không có trong cache
+        evictions: Số phần tử bị loại bỏ do vượt quá kích thước
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60):
+        """Khởi tạo cache.
+
+        Args:
+            max_size: Số lượng phần tử tối đa
+            ttl: Thời gian sống mặc định (giây) của mỗi phần tử
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """Lấy giá trị theo key.
+
+        Args:
+            key: Key cần lấy
+            default: Giá trị trả về nếu không có hoặc đã hết hạn
+
+        Returns:
+            Giá trị đã lưu hoặc default
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl: float = None) -> None:
+        """Lưu giá trị vào cache.
+
+        Args:
+            key: Key cần lưu
+            value: Giá trị cần lưu
+            ttl: Thời gian sống (giây), mặc định dùng ttl của cache
+        """
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key) -> None:
+        """Xóa phần tử khỏi cache.
+
+        Args:
+            key: Key cần xóa
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Xóa toàn bộ phần tử trong cache."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Thống kê hoạt động của cache.
+
+        Returns:
+            dict: Kích thước, số lần hit/miss, tỉ lệ hit và số phần tử bị loại bỏ
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else None,
+                "evictions": self.evictions,
+            }
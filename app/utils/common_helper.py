@@ -2,6 +2,14 @@
 
 from loguru import logger
 
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.exceptions.exception import BadRequest
+
+import base64
+import hashlib
+import json
 import random
 import string
 
@@ -11,22 +19,46 @@ def paginate_format(pagination) -> object:
     Format đối tượng pagination với các thông tin bổ sung.
 
     Args:
-        pagination: Đối tượng pagination cần format
+        pagination: Đối tượng pagination cần format. Nếu total là None (không đếm) hoặc
+                    là giá trị ước lượng, has_more (nếu có) được dùng để xác định has_next
 
     Returns:
         pagination: Đối tượng pagination đã được format thêm thông tin pages,
                    has_previous, has_next, next_page, previous_page
     """
-    pagination.__dict__["pages"] = int(pagination.total / pagination.per_page) + (
-        1 if pagination.total % pagination.per_page > 0 else 0
-    )
+    has_more = getattr(pagination, "has_more", None)
+    if pagination.total is None:
+        pagination.__dict__["pages"] = None
+    else:
+        pagination.__dict__["pages"] = int(pagination.total / pagination.per_page) + (
+            1 if pagination.total % pagination.per_page > 0 else 0
+        )
     pagination.__dict__["has_previous"] = pagination.page > 1
-    pagination.__dict__["has_next"] = pagination.page < pagination.pages
+    pagination.__dict__["has_next"] = has_more if has_more is not None else pagination.page < pagination.pages
     pagination.__dict__["next_page"] = pagination.page + 1 if pagination.has_next else None
     pagination.__dict__["previous_page"] = pagination.page - 1 if pagination.has_previous else None
     return pagination
 
 
+def page_format(items: list, page: int, per_page: int, total: int | None, has_more: bool) -> object:
+    """
+    Tạo đối tượng pagination (theo số trang) khi không dùng .paginate() của Flask-SQLAlchemy.
+
+    Args:
+        items: Danh sách bản ghi của trang hiện tại
+        page: Trang hiện tại
+        per_page: Kích thước trang
+        total: Tổng số bản ghi (có thể là ước lượng) hoặc None nếu không đếm
+        has_more: Còn bản ghi ở trang sau hay không
+
+    Returns:
+        object: Đối tượng pagination đã được format như paginate_format
+    """
+    return paginate_format(
+        SimpleNamespace(items=items, page=page, per_page=per_page, total=total, has_more=has_more)
+    )
+
+
 def remove_none_in_dict(data: dict) -> dict:
     """
     Loại bỏ các cặp key-value có value là None trong dict.
@@ -38,3 +70,121 @@ def remove_none_in_dict(data: dict) -> dict:
         dict: Dictionary mới đã loại bỏ các giá trị None
     """
     return {key: value for key, value in data.items() if value is not None}
+
+
+def make_etag(*parts) -> str:
+    """
+    Tạo giá trị ETag (strong) từ các thành phần xác định phiên bản của dữ liệu.
+
+    Args:
+        *parts: Các thành phần (ID, thời điểm cập nhật, thế hệ ghi, tham số lọc, ...)
+
+    Returns:
+        str: Giá trị ETag chưa có dấu ngoặc kép
+    """
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def make_version_etag(entity_id: int, version: int) -> str:
+    """
+    Tạo ETag (strong) của một bản ghi từ ID và phiên bản, dạng "<id>.<version>".
+
+    Khác make_etag, phiên bản đọc lại được từ ETag (parse_version_etag) để dùng cho If-Match.
+
+    Args:
+        entity_id: ID của bản ghi
+        version: Phiên bản của bản ghi
+
+    Returns:
+        str: Giá trị ETag chưa có dấu ngoặc kép
+    """
+    return f"{entity_id}.{version}"
+
+
+def parse_version_etag(etag: str) -> tuple | None:
+    """
+    Đọc ID và phiên bản từ ETag tạo bởi make_version_etag (bỏ qua hậu tố nén, ví dụ "-gzip").
+
+    Args:
+        etag: Giá trị ETag chưa có dấu ngoặc kép
+
+    Returns:
+        tuple | None: (entity_id, version) hoặc None nếu ETag không đúng định dạng
+    """
+    entity_id, _, version = etag.split("-", 1)[0].partition(".")
+    if not entity_id.isdigit() or not version.isdigit():
+        return None
+    return int(entity_id), int(version)
+
+
+def encode_cursor(created_at: datetime, entity_id: int, backward: bool = False) -> str:
+    """
+    Mã hóa vị trí keyset (created_at, id) thành cursor dạng chuỗi mờ (opaque).
+
+    Args:
+        created_at: Thời điểm tạo của bản ghi làm mốc
+        entity_id: ID của bản ghi làm mốc
+        backward: True nếu cursor dùng để lùi về trang trước
+
+    Returns:
+        str: Cursor đã mã hóa base64 (url-safe, không padding)
+    """
+    payload = json.dumps(
+        {"c": created_at.isoformat(), "i": entity_id, "d": "p" if backward else "n"},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int, bool]:
+    """
+    Giải mã cursor thành vị trí keyset.
+
+    Args:
+        cursor: Cursor nhận từ client
+
+    Returns:
+        tuple: (created_at, id, backward)
+
+    Raises:
+        BadRequest: Nếu cursor không hợp lệ
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"]), payload["d"] == "p"
+    except (ValueError, TypeError, KeyError):
+        raise BadRequest("Cursor không hợp lệ")
+
+
+def cursor_paginate_format(items: list, per_page: int, has_more: bool, backward: bool, has_cursor: bool) -> object:
+    """
+    Tạo đối tượng phân trang theo cursor.
+
+    Args:
+        items: Danh sách bản ghi của trang hiện tại (đã theo thứ tự created_at DESC, id DESC)
+        per_page: Kích thước trang
+        has_more: Còn bản ghi phía sau theo chiều đang duyệt hay không
+        backward: True nếu trang được lấy theo chiều lùi (prev_cursor)
+        has_cursor: True nếu request có truyền cursor
+
+    Returns:
+        object: Đối tượng gồm items, per_page, has_next, has_previous, next_cursor, prev_cursor
+    """
+    has_next = True if backward else has_more
+    has_previous = has_more if backward else has_cursor
+    next_cursor = None
+    prev_cursor = None
+    if items and has_next:
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    if items and has_previous:
+        prev_cursor = encode_cursor(items[0].created_at, items[0].id, backward=True)
+    return SimpleNamespace(
+        items=items,
+        per_page=per_page,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
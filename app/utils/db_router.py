@@ -0,0 +1,190 @@
+# coding: utf8
+
+from loguru import logger
+
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Select, text
+from threading import Lock
+
+from app.constants.globals import REPLICA_MAX_LAG_SECONDS, REPLICA_LAG_CHECK_INTERVAL
+from app.exceptions.exception import BadRequest
+
+import random
+import time
+
+REPLICA_BIND_PREFIX = "replica_"
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+
+
+def parse_lsn(lsn: str) -> int:
+    """
+    Chuyển LSN của PostgreSQL (dạng "16/B374D848") thành số nguyên để so sánh.
+
+    Args:
+        lsn: LSN dạng chuỗi
+
+    Returns:
+        int: Giá trị số của LSN
+
+    Raises:
+        BadRequest: Nếu LSN không hợp lệ
+    """
+    try:
+        high, low = lsn.split("/")
+        return (int(high, 16) << 32) + int(low, 16)
+    except (ValueError, AttributeError):
+        raise BadRequest(f"{CONSISTENCY_TOKEN_HEADER} không hợp lệ")
+
+
+def store_consistency_token(session) -> None:
+    """
+    Lưu LSN hiện tại của primary vào g sau khi commit một transaction ghi trong request.
+
+    LSN được đọc bằng chính session của transaction (trước khi đóng) và trả về cho client qua header
+    X-Consistency-Token. Chỉ áp dụng khi có cấu hình replica.
+
+    Args:
+        session: Session vừa commit
+    """
+    if not has_request_context() or not current_app.config["SQLALCHEMY_BINDS"]:
+        return
+    try:
+        g.db_consistency_token = session.execute(text("SELECT pg_current_wal_lsn()::text")).scalar()
+    except Exception as e:
+        logger.warning(f"Không thể lấy LSN của primary: {e}")
+
+
+class ReplicaRouter:
+    """Chọn replica cho các truy vấn đọc.
+
+    Replica được cấu hình qua SQLALCHEMY_BINDS với key có tiền tố "replica_". Độ trễ (lag) của
+    mỗi replica được kiểm tra tối đa một lần mỗi REPLICA_LAG_CHECK_INTERVAL giây; replica trễ hơn
+    REPLICA_MAX_LAG_SECONDS hoặc không kết nối được sẽ bị bỏ qua. Nếu request gửi kèm
+    X-Consistency-Token (LSN trả về sau khi ghi), chỉ replica đã replay tới LSN đó mới được dùng.
+    Không có replica phù hợp thì truy vấn được chạy trên primary.
+
+    Attributes:
+        max_lag_seconds: Độ trễ tối đa cho phép của replica
+        check_interval: Chu kỳ (giây) kiểm tra độ trễ của replica
+    """
+
+    def __init__(self, max_lag_seconds: float, check_interval: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._status = {}
+        self._lock = Lock()
+
+    def bind_keys(self, engines: dict) -> list:
+        """Lấy danh sách bind key của các replica.
+
+        Args:
+            engines: Dict engine của Flask-SQLAlchemy (db.engines)
+
+        Returns:
+            list: Danh sách bind key của replica
+        """
+        return [key for key in engines if isinstance(key, str) and key.startswith(REPLICA_BIND_PREFIX)]
+
+    def select_engine(self, engines: dict):
+        """Chọn engine replica cho request hiện tại (kết quả được giữ trong g cho cả request).
+
+        Args:
+            engines: Dict engine của Flask-SQLAlchemy (db.engines)
+
+        Returns:
+            Engine | None: Engine replica hoặc None nếu cần dùng primary
+        """
+        if "db_replica_key" not in g:
+            g.db_replica_key = self._choose(engines)
+        return engines[g.db_replica_key] if g.db_replica_key else None
+
+    def _choose(self, engines: dict) -> str | None:
+        token = request.headers.get(CONSISTENCY_TOKEN_HEADER)
+        required_lsn = parse_lsn(token) if token else None
+
+        candidates = self.bind_keys(engines)
+        random.shuffle(candidates)
+        for key in candidates:
+            status = self._replica_status(key, engines[key])
+            if status is None or status["lag"] > self.max_lag_seconds:
+                continue
+            if required_lsn is not None and status["replay_lsn"] < required_lsn:
+                # Trạng thái đã cache có thể cũ, kiểm tra lại trước khi bỏ qua replica
+                status = self._replica_status(key, engines[key], refresh=True)
+                if status is None or status["replay_lsn"] < required_lsn:
+                    continue
+            return key
+        return None
+
+    def _replica_status(self, key: str, engine, refresh: bool = False) -> dict | None:
+        """Lấy độ trễ và LSN đã replay của replica (có cache theo check_interval).
+
+        Args:
+            key: Bind key của replica
+            engine: Engine của replica
+            refresh: Bỏ qua cache và kiểm tra lại ngay
+
+        Returns:
+            dict | None: {"lag": giây, "replay_lsn": int} hoặc None nếu replica không dùng được
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._status.get(key)
+        if cached and not refresh and now - cached[0] < self.check_interval:
+            return cached[1]
+
+        try:
+            with engine.connect() as conn:
+                row = conn.execute(text(
+                    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END AS lag, "
+                    "pg_last_wal_replay_lsn()::text AS replay_lsn"
+                )).one()
+            status = {"lag": float(row.lag), "replay_lsn": parse_lsn(row.replay_lsn)} if row.replay_lsn else None
+        except Exception as e:
+            logger.warning(f"Không thể kiểm tra replica {key}: {e}")
+            status = None
+
+        with self._lock:
+            self._status[key] = (now, status)
+        return status
+
+    def stats(self) -> dict:
+        """Trạng thái các replica đã kiểm tra gần nhất.
+
+        Returns:
+            dict: {bind key: {"lag": giây, "healthy": bool}}
+        """
+        with self._lock:
+            return {
+                key: {
+                    "lag": status["lag"] if status else None,
+                    "healthy": bool(status) and status["lag"] <= self.max_lag_seconds,
+                }
+                for key, (_, status) in self._status.items()
+            }
+
+
+replica_router = ReplicaRouter(REPLICA_MAX_LAG_SECONDS, REPLICA_LAG_CHECK_INTERVAL)
+
+
+class RoutingSession(Session):
+    """Session chuyển các câu lệnh SELECT sang replica trong các request được đánh dấu đọc.
+
+    Request được đánh dấu bằng decorator read_replica (g.db_read_replica). Câu lệnh ghi,
+    flush và các truy vấn ngoài request luôn chạy trên primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and not self._flushing
+            and isinstance(clause, Select)
+            and has_request_context()
+            and g.get("db_read_replica")
+        ):
+            engine = replica_router.select_engine(self._db.engines)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
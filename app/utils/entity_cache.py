@@ -0,0 +1,207 @@
+# coding: utf8
+
+from loguru import logger
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from threading import Lock, Thread
+
+from app.constants.globals import (
+    BOOKING_CACHE_ENABLED, BOOKING_CACHE_MAX_SIZE, BOOKING_CACHE_TTL, REPLICA_MAX_LAG_SECONDS
+)
+from app.utils.cache import TTLCache
+from app.utils.db_router import CONSISTENCY_TOKEN_HEADER, RoutingSession
+
+import os
+import select
+import time
+
+LISTEN_POLL_TIMEOUT = 5
+LISTEN_MAX_BACKOFF = 30
+
+
+class EntityCache:
+    """Cache các entity đã được serialize (dict response) theo ID.
+
+    Dữ liệu được đọc qua get_or_load (read-through). Trigger của bảng (migration
+    005_booking_cache_notify.sql) gửi ID các bản ghi đã cập nhật/xóa qua pg_notify trên channel khi
+    transaction commit, nên mọi nơi ghi (ứng dụng, SQL trực tiếp) đều được bao phủ. Mỗi worker có
+    một luồng nền LISTEN trên channel để xóa các ID nhận được; tầng service gọi invalidate() trong
+    transaction để xóa ngay khỏi cache của worker hiện tại sau khi commit.
+
+    Cache chỉ được dùng khi luồng LISTEN đang kết nối; sau mỗi lần kết nối lại toàn bộ cache bị
+    xóa vì có thể đã bỏ lỡ thông báo.
+
+    Attributes:
+        channel: Tên channel LISTEN/NOTIFY
+        enabled: Bật/tắt cache
+        cache: TTLCache lưu dữ liệu
+    """
+
+    def __init__(self, channel: str, max_size: int, ttl: float, enabled: bool = True):
+        self.channel = channel
+        self.enabled = enabled
+        self.cache = TTLCache(max_size=max_size, ttl=ttl)
+        self._generation = 0
+        self._listening = False
+        self._listener = None
+        self._listener_pid = None
+        self._lock = Lock()
+        self._app = None
+        self._db = None
+
+    def init_app(self, app, db) -> None:
+        """Đăng ký event của session để xóa cache của worker hiện tại sau khi commit.
+
+        Args:
+            app: Ứng dụng Flask
+            db: Instance Flask-SQLAlchemy
+        """
+        if not self.enabled or self._app is not None:
+            return
+        self._app = app
+        self._db = db
+        event.listen(RoutingSession, "after_commit", self._after_commit)
+        event.listen(RoutingSession, "after_soft_rollback", self._after_rollback)
+
+    def get(self, key):
+        """Lấy giá trị từ cache (không nạp từ database).
+
+        Args:
+            key: Key cần lấy (ID của entity)
+
+        Returns:
+            Giá trị đã lưu hoặc None nếu không có, cache chưa sẵn sàng hoặc request gửi kèm
+            X-Consistency-Token
+        """
+        if not self._ready() or (has_request_context() and request.headers.get(CONSISTENCY_TOKEN_HEADER)):
+            return None
+        return self.cache.get(key)
+
+    def get_or_load(self, key, loader: callable):
+        """Lấy giá trị từ cache, nếu chưa có thì gọi loader và lưu kết quả.
+
+        Không đọc cache khi request gửi kèm X-Consistency-Token (cần đọc dữ liệu vừa ghi). Giá trị
+        None không được lưu. Giá trị đọc từ replica chỉ được lưu tối đa REPLICA_MAX_LAG_SECONDS giây.
+
+        Args:
+            key: Key cần lấy (ID của entity)
+            loader: Hàm không tham số trả về giá trị đã serialize hoặc None
+
+        Returns:
+            Giá trị đã lưu hoặc kết quả của loader
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        if not self._ready():
+            return loader()
+
+        generation = self._generation
+        value = loader()
+        # Bỏ qua nếu có invalidate trong lúc đọc, tránh lưu lại dữ liệu cũ
+        if value is not None and generation == self._generation:
+            ttl = None
+            if has_request_context() and g.get("db_replica_key"):
+                ttl = min(self.cache.ttl, REPLICA_MAX_LAG_SECONDS)
+            self.cache.set(key, value, ttl=ttl)
+        return value
+
+    def invalidate(self, *keys) -> None:
+        """Đánh dấu các key cần xóa khi transaction hiện tại commit.
+
+        Args:
+            *keys: Các key (ID) cần xóa
+        """
+        if not self.enabled or not keys:
+            return
+        self._db.session.info.setdefault(self._pending_key, set()).update(keys)
+
+    def stats(self) -> dict:
+        """Thống kê hoạt động của cache.
+
+        Returns:
+            dict: Thống kê của TTLCache và trạng thái luồng LISTEN
+        """
+        return {**self.cache.stats(), "listening": self._listening}
+
+    @property
+    def _pending_key(self) -> str:
+        return f"entity_cache_pending:{self.channel}"
+
+    def _ready(self) -> bool:
+        if not self.enabled or self._app is None:
+            return False
+        self._ensure_listener()
+        return self._listening
+
+    def _after_commit(self, session) -> None:
+        keys = session.info.pop(self._pending_key, None)
+        if keys:
+            self._evict(keys)
+
+    def _after_rollback(self, session, previous_transaction) -> None:
+        session.info.pop(self._pending_key, None)
+
+    def _evict(self, keys) -> None:
+        self._generation += 1
+        for key in keys:
+            self.cache.delete(key)
+
+    def _ensure_listener(self) -> None:
+        # Mỗi worker (process) cần luồng LISTEN riêng
+        if self._listener_pid == os.getpid() and self._listener.is_alive():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid() and self._listener.is_alive():
+                return
+            self._listening = False
+            self.cache.clear()
+            self._listener = Thread(target=self._listen, name=f"cache-listen-{self.channel}", daemon=True)
+            self._listener_pid = os.getpid()
+            self._listener.start()
+
+    def _listen(self) -> None:
+        """Vòng lặp của luồng nền: LISTEN trên channel và xóa các key nhận được."""
+        backoff = 1
+        while True:
+            connection = None
+            try:
+                with self._app.app_context():
+                    connection = self._db.engine.raw_connection()
+                # Kết nối dùng riêng cho LISTEN, không trả lại pool
+                connection.detach()
+                driver_connection = connection.driver_connection
+                driver_connection.autocommit = True
+                with driver_connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+
+                # Có thể đã bỏ lỡ thông báo trong lúc chưa LISTEN
+                self._evict_all()
+                self._listening = True
+                backoff = 1
+                while True:
+                    if select.select([driver_connection], [], [], LISTEN_POLL_TIMEOUT) == ([], [], []):
+                        continue
+                    driver_connection.poll()
+                    while driver_connection.notifies:
+                        notify = driver_connection.notifies.pop(0)
+                        self._evict(int(key) for key in notify.payload.split(",") if key)
+            except Exception as e:
+                logger.warning(f"Mất kết nối LISTEN {self.channel}, thử lại sau {backoff}s: {e}")
+            finally:
+                self._listening = False
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            time.sleep(backoff)
+            backoff = min(backoff * 2, LISTEN_MAX_BACKOFF)
+
+    def _evict_all(self) -> None:
+        self._generation += 1
+        self.cache.clear()
+
+
+booking_cache = EntityCache("booking_cache", BOOKING_CACHE_MAX_SIZE, BOOKING_CACHE_TTL, BOOKING_CACHE_ENABLED)
@@ -0,0 +1,135 @@
+# coding: utf8
+
+from loguru import logger
+
+from app.constants.globals import EVENT_CODEC
+from app.enum import EventCodecFormat
+
+import json
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+CONTENT_TYPE_HEADER = "content-type"
+SCHEMA_VERSION_HEADER = "schema-version"
+CONTENT_TYPES = {
+    EventCodecFormat.MSGPACK.value: "application/x-msgpack",
+    EventCodecFormat.JSON.value: "application/json",
+}
+
+EVENT_SCHEMA_VERSION = 2
+
+# Thứ tự trường của từng phiên bản schema ở dạng nén (mảng theo vị trí, không lưu tên trường).
+# Chỉ thêm phiên bản mới, không sửa phiên bản cũ để consumer vẫn đọc được message đã gửi.
+EVENT_SCHEMAS = {
+    1: {
+        "fields": ("event", "booking_id", "occurred_at", "booking", "previous_status"),
+        "booking_fields": (
+            "id", "customer_name", "phone", "booking_date", "status", "note", "created_at", "updated_at"
+        ),
+    },
+    # Thêm phiên bản của booking (optimistic concurrency)
+    2: {
+        "fields": ("event", "booking_id", "occurred_at", "booking", "previous_status"),
+        "booking_fields": (
+            "id", "customer_name", "phone", "booking_date", "status", "note", "created_at", "updated_at", "version"
+        ),
+    },
+}
+
+
+class EventCodec:
+    """Mã hóa/giải mã sự kiện booking để gửi qua Kafka.
+
+    Sự kiện ở dạng dict {event, version, booking_id, occurred_at, booking, previous_status}.
+    Định dạng msgpack (mặc định) lưu sự kiện thành mảng theo thứ tự trường của EVENT_SCHEMAS:
+    [version, event, booking_id, occurred_at, [các trường booking], previous_status].
+    Định dạng json (hoặc khi chưa cài msgpack) lưu nguyên dict. Định dạng và phiên bản được ghi
+    trong header của message; message không có header (định dạng cũ) được đọc như JSON.
+
+    Attributes:
+        format: Định dạng dùng khi mã hóa (msgpack/json)
+    """
+
+    def __init__(self, codec_format: str):
+        if codec_format == EventCodecFormat.MSGPACK.value and msgpack is None:
+            logger.warning("Chưa cài msgpack, sự kiện được mã hóa bằng JSON")
+            codec_format = EventCodecFormat.JSON.value
+        self.format = codec_format
+
+    def encode(self, event: dict) -> tuple:
+        """Mã hóa sự kiện.
+
+        Args:
+            event: Sự kiện dạng dict
+
+        Returns:
+            tuple: (value dạng bytes, danh sách header của message)
+        """
+        version = event.get("version") or EVENT_SCHEMA_VERSION
+        if self.format == EventCodecFormat.MSGPACK.value:
+            value = msgpack.packb(self._to_compact(event, version), use_bin_type=True)
+        else:
+            value = json.dumps({**event, "version": version}, ensure_ascii=False, separators=(",", ":")).encode()
+        return value, [
+            (CONTENT_TYPE_HEADER, CONTENT_TYPES[self.format].encode()),
+            (SCHEMA_VERSION_HEADER, str(version).encode()),
+        ]
+
+    def decode(self, value: bytes, headers: list = None) -> dict:
+        """Giải mã sự kiện theo header content-type của message.
+
+        Args:
+            value: Nội dung message
+            headers: Header của message (danh sách tuple (key, value))
+
+        Returns:
+            dict: Sự kiện dạng dict
+
+        Raises:
+            ValueError: Khi nội dung không hợp lệ hoặc phiên bản schema không được hỗ trợ
+        """
+        content_type = dict(headers or []).get(CONTENT_TYPE_HEADER)
+        if content_type == CONTENT_TYPES[EventCodecFormat.MSGPACK.value].encode():
+            if msgpack is None:
+                raise ValueError("Chưa cài msgpack, không thể giải mã sự kiện")
+            try:
+                return self._from_compact(msgpack.unpackb(value, raw=False))
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Sự kiện msgpack không hợp lệ: {e}")
+
+        event = json.loads(value)
+        if not isinstance(event, dict):
+            raise ValueError("Sự kiện JSON không phải object")
+        return event
+
+    def _to_compact(self, event: dict, version: int) -> list:
+        schema = self._schema(version)
+        booking = event.get("booking")
+        return [version] + [
+            [booking.get(field) for field in schema["booking_fields"]] if field == "booking" and booking
+            else event.get(field)
+            for field in schema["fields"]
+        ]
+
+    def _from_compact(self, values: list) -> dict:
+        if not isinstance(values, list) or not values:
+            raise ValueError("Sự kiện msgpack không phải mảng")
+        version, values = values[0], values[1:]
+        schema = self._schema(version)
+        event = {field: value for field, value in zip(schema["fields"], values) if value is not None}
+        if event.get("booking") is not None:
+            event["booking"] = dict(zip(schema["booking_fields"], event["booking"]))
+        event["version"] = version
+        return event
+
+    @staticmethod
+    def _schema(version: int) -> dict:
+        if version not in EVENT_SCHEMAS:
+            raise ValueError(f"Phiên bản schema sự kiện {version} không được hỗ trợ")
+        return EVENT_SCHEMAS[version]
+
+
+event_codec = EventCodec(EVENT_CODEC)
@@ -0,0 +1,110 @@
+# coding: utf8
+
+import re
+
+# Ánh xạ tham số lọc -> (cột, kiểu điều kiện)
+FILTER_COLUMNS = {
+    "phone": ("phone", "eq"),
+    "status": ("status", "eq"),
+    "booking_from": ("booking_date", "range"),
+    "booking_to": ("booking_date", "range"),
+    "created_from": ("created_at", "range"),
+    "created_to": ("created_at", "range"),
+    "customer_name": ("customer_name_normalized", "trgm"),
+}
+PARTIAL_PREDICATE = '"is_deleted" IS FALSE'
+
+
+def parse_signature(signature: str) -> tuple[str, list]:
+    """
+    Tách chữ ký bộ lọc thành tên truy vấn và danh sách tham số lọc.
+
+    Args:
+        signature: Chữ ký dạng "booking.paginate_all:phone,status|count=exact"
+
+    Returns:
+        tuple: (tên truy vấn, danh sách tham số lọc)
+    """
+    name, _, rest = signature.partition(":")
+    fields = rest.split("|", 1)[0]
+    return name, [field for field in fields.split(",") if field]
+
+
+def suggest_index(table: str, fields: list) -> dict | None:
+    """
+    Gợi ý index cho một tổ hợp bộ lọc.
+
+    Cột so sánh bằng được đặt trước, sau đó là một cột so sánh khoảng. Nếu không lọc theo
+    booking_date thì dùng (created_at DESC, id DESC) để phục vụ cả lọc theo ngày tạo và
+    thứ tự sắp xếp của danh sách. Index là partial index trên các bản ghi chưa xóa mềm.
+    Tìm kiếm theo tên dùng GIN trigram index riêng.
+
+    Args:
+        table: Tên bảng (có schema)
+        fields: Danh sách tham số lọc
+
+    Returns:
+        dict | None: Thông tin index gợi ý (columns, definition) hoặc None
+    """
+    equality = sorted({FILTER_COLUMNS[f][0] for f in fields if FILTER_COLUMNS.get(f, (None, None))[1] == "eq"})
+    ranges = {FILTER_COLUMNS[f][0] for f in fields if FILTER_COLUMNS.get(f, (None, None))[1] == "range"}
+
+    if "customer_name" in fields and not equality and not ranges:
+        return {
+            "columns": ["customer_name_normalized"],
+            "definition": (
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "b_customer_name_trgm" ON {table} '
+                f'USING gin ("customer_name_normalized" public.gin_trgm_ops);'
+            ),
+        }
+
+    columns = list(equality)
+    if "booking_date" in ranges:
+        columns.append("booking_date")
+        ordered = [f'"{column}"' for column in columns]
+    else:
+        columns += ["created_at", "id"]
+        ordered = [f'"{column}"' for column in columns[:-2]] + ['"created_at" DESC', '"id" DESC']
+
+    name = "b_adv_" + "_".join(columns)
+    return {
+        "columns": columns,
+        "definition": (
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name[:63]}" ON {table} '
+            f'({", ".join(ordered)}) WHERE {PARTIAL_PREDICATE};'
+        ),
+    }
+
+
+def index_columns(index_definition: str) -> list:
+    """
+    Lấy danh sách cột (theo thứ tự) từ câu lệnh định nghĩa index của pg_indexes.
+
+    Args:
+        index_definition: Giá trị cột indexdef, ví dụ
+            "CREATE INDEX b_status ON booking.booking USING btree (status)"
+
+    Returns:
+        list: Danh sách tên cột
+    """
+    match = re.search(r"USING \w+ \((.*?)\)(?: WHERE|$| INCLUDE)", index_definition)
+    if not match:
+        return []
+    return [part.strip().split(" ")[0].strip('"') for part in match.group(1).split(",")]
+
+
+def find_covering_index(columns: list, existing_indexes: dict) -> str | None:
+    """
+    Tìm index hiện có bao phủ các cột gợi ý (các cột gợi ý là tiền tố của index).
+
+    Args:
+        columns: Danh sách cột của index gợi ý
+        existing_indexes: Dict {tên index: indexdef}
+
+    Returns:
+        str | None: Tên index bao phủ nếu có
+    """
+    for name, definition in existing_indexes.items():
+        if index_columns(definition)[:len(columns)] == columns:
+            return name
+    return None
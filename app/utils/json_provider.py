@@ -0,0 +1,81 @@
+# coding: utf8
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from flask.json.provider import DefaultJSONProvider
+from uuid import UUID
+
+from app.constants.globals import JSON_SERIALIZER
+from app.enum import JsonSerializer
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+USE_ORJSON = orjson is not None and JSON_SERIALIZER == JsonSerializer.ORJSON.value
+
+
+def json_default(value):
+    """Chuyển các kiểu không có sẵn trong JSON (dùng chung cho orjson và json của thư viện chuẩn).
+
+    Args:
+        value: Giá trị cần chuyển
+
+    Returns:
+        Giá trị có thể serialize: datetime/date/time dạng ISO 8601, Enum theo value, Decimal/UUID dạng chuỗi
+
+    Raises:
+        TypeError: Khi kiểu dữ liệu không được hỗ trợ
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize obj thành JSON (UTF-8), dùng orjson nếu có.
+
+    Args:
+        obj: Dữ liệu cần serialize
+
+    Returns:
+        bytes: Nội dung JSON
+    """
+    if USE_ORJSON:
+        return orjson.dumps(obj, default=json_default)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=json_default).encode()
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider của Flask dùng orjson (JSON_SERIALIZER=orjson, mặc định) nếu đã cài.
+
+    datetime, date, Enum, UUID được orjson serialize trực tiếp (datetime theo ISO 8601 giống isoformat()),
+    Decimal được chuyển thành chuỗi. Khi không có orjson, dùng json của thư viện chuẩn với cùng quy tắc
+    chuyển đổi (json_default) thay cho định dạng HTTP date mặc định của Flask.
+    """
+
+    default = staticmethod(json_default)
+
+    def dumps(self, obj, **kwargs) -> str:
+        if USE_ORJSON and not kwargs:
+            return orjson.dumps(obj, default=json_default).decode()
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs):
+        if USE_ORJSON and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if not USE_ORJSON:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=json_default) + b"\n", mimetype=self.mimetype)
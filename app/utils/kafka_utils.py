@@ -1,24 +1,235 @@
 # coding: utf8
 
-from confluent_kafka import Producer
+from loguru import logger
+
+from collections import deque
+from confluent_kafka import KafkaError, Producer
+from threading import Lock, Thread
+
+from app.constants.globals import (
+    KAFKA_PRODUCER_MODE, KAFKA_LINGER_MS, KAFKA_BATCH_SIZE, KAFKA_COMPRESSION, KAFKA_QUEUE_MAX_MESSAGES,
+    KAFKA_BACKPRESSURE_POLICY, KAFKA_BACKPRESSURE_TIMEOUT, KAFKA_MAX_RETRIES, KAFKA_RETRY_QUEUE_SIZE,
+    KAFKA_CLOSE_TIMEOUT
+)
+from app.enum import BackpressurePolicy, KafkaProducerMode
 from config import Config
+import atexit
 import json
+import os
+import time
+
+POLL_INTERVAL = 0.1
 
 
 class KafkaProducer:
+    """Gửi message tới Kafka.
+
+    Chế độ sync: flush sau mỗi lần gửi (request chờ broker xác nhận).
+    Chế độ async: message được đưa vào hàng đợi của librdkafka và gửi theo lô (linger.ms,
+    batch.size, nén) mà không chờ broker. Một luồng nền gọi poll() để xử lý delivery callback:
+    cập nhật thống kê và đưa message lỗi vào hàng đợi gửi lại (tối đa max_retries lần).
+    Hàng đợi có giới hạn (queue.buffering.max.messages); khi đầy thì xử lý theo backpressure_policy:
+    block (chờ tối đa backpressure_timeout giây rồi báo lỗi), drop (bỏ message) hoặc error (báo lỗi ngay).
+
+    Attributes:
+        mode: Chế độ gửi (sync/async)
+        max_retries: Số lần gửi lại tối đa của một message lỗi (chế độ async)
+    """
+
     def __init__(self, broker: str):
-        self.producer = Producer({'bootstrap.servers': broker})
+        self.mode = KAFKA_PRODUCER_MODE
+        self.backpressure_policy = KAFKA_BACKPRESSURE_POLICY
+        self.backpressure_timeout = KAFKA_BACKPRESSURE_TIMEOUT
+        self.max_retries = KAFKA_MAX_RETRIES
+        self.producer = Producer({
+            'bootstrap.servers': broker,
+            'linger.ms': KAFKA_LINGER_MS,
+            'batch.size': KAFKA_BATCH_SIZE,
+            'compression.type': KAFKA_COMPRESSION,
+            'queue.buffering.max.messages': KAFKA_QUEUE_MAX_MESSAGES,
+            'enable.idempotence': True,
+        })
+        self._retry_queue = deque()
+        self._metrics = {"produced": 0, "delivered": 0, "failed": 0, "retried": 0, "dropped": 0}
+        self._latency_total = 0.0
+        self._lock = Lock()
+        self._poller = None
+        self._poller_pid = None
+        self._closed = False
+        if self.mode == KafkaProducerMode.ASYNC.value:
+            atexit.register(self.close)
 
-    def send(self, topic: str, key: str, value: dict):
+    def send(self, topic: str, key: str, value: dict | bytes, headers: list = None):
         try:
-            self.producer.produce(
-                topic=topic,
-                key=key,
-                value=json.dumps(value),
-            )
-            self.producer.flush()
+            self._enqueue(topic, key, self._serialize(value), headers)
+            if self.mode == KafkaProducerMode.SYNC.value:
+                self.producer.flush()
         except Exception as e:
             raise RuntimeError(f"Kafka produce failed: {e}")
 
+    def send_batch(self, topic: str, messages: list):
+        """Gửi nhiều message (chế độ sync: flush một lần sau khi đưa hết vào hàng đợi).
+
+        Args:
+            topic: Topic cần gửi
+            messages: Danh sách tuple (key, value), value là dict hoặc bytes đã mã hóa
+        """
+        try:
+            for key, value in messages:
+                self._enqueue(topic, key, self._serialize(value))
+                # Giải phóng callback đã hoàn thành để tránh đầy hàng đợi nội bộ
+                self.producer.poll(0)
+            if self.mode == KafkaProducerMode.SYNC.value:
+                self.producer.flush()
+        except Exception as e:
+            raise RuntimeError(f"Kafka produce failed: {e}")
+
+    def deliver(self, messages: list, timeout: float) -> list:
+        """Gửi nhiều message và chờ broker xác nhận (dùng cho relay của outbox).
+
+        Không áp dụng backpressure policy và không gửi lại, lỗi được trả về để bên gọi xử lý.
+
+        Args:
+            messages: Danh sách tuple (topic, key, value, headers), value là bytes đã mã hóa
+            timeout: Thời gian chờ tối đa (giây)
+
+        Returns:
+            list: Lỗi tương ứng với từng message (None nếu gửi thành công)
+        """
+        errors = ["Chưa được broker xác nhận"] * len(messages)
+
+        def on_delivery(index):
+            def callback(err, msg):
+                errors[index] = err
+            return callback
+
+        for index, (topic, key, value, headers) in enumerate(messages):
+            while True:
+                try:
+                    self.producer.produce(
+                        topic=topic, key=key, value=value, headers=headers, on_delivery=on_delivery(index)
+                    )
+                    break
+                except BufferError:
+                    self.producer.poll(POLL_INTERVAL)
+        if self.producer.flush(timeout):
+            # Bỏ các message chưa rời hàng đợi để giảm gửi trùng ở lần relay sau
+            self.producer.purge(in_queue=True, in_flight=False)
+            self.producer.poll(0)
+        return errors
+
+    def stats(self) -> dict:
+        """Thống kê gửi message của worker hiện tại.
+
+        Returns:
+            dict: Số message đã gửi/thành công/lỗi/gửi lại/bị bỏ, số message đang chờ và độ trễ trung bình (ms)
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["avg_delivery_ms"] = (
+                round(self._latency_total / metrics["delivered"] * 1000, 2) if metrics["delivered"] else None
+            )
+            metrics["retry_queue"] = len(self._retry_queue)
+        metrics["in_flight"] = len(self.producer)
+        metrics["mode"] = self.mode
+        return metrics
+
+    def close(self) -> None:
+        """Dừng luồng poll và chờ gửi hết các message còn trong hàng đợi (tối đa KAFKA_CLOSE_TIMEOUT giây)."""
+        self._closed = True
+        remaining = self.producer.flush(KAFKA_CLOSE_TIMEOUT)
+        if remaining or self._retry_queue:
+            logger.error(f"Kafka: {remaining + len(self._retry_queue)} message chưa được gửi khi dừng")
+
+    def _enqueue(self, topic: str, key: str, value, headers: list = None) -> None:
+        """Đưa message vào hàng đợi của producer, xử lý backpressure khi hàng đợi đầy.
+
+        Raises:
+            RuntimeError: Khi hàng đợi đầy (policy error, hoặc block quá thời gian chờ)
+        """
+        deadline = time.monotonic() + self.backpressure_timeout
+        while True:
+            try:
+                self._produce(topic, key, value, headers, attempt=0)
+                break
+            except BufferError:
+                if self.backpressure_policy == BackpressurePolicy.DROP.value:
+                    self._increase("dropped")
+                    logger.warning(f"Kafka: hàng đợi đầy, bỏ message {topic}/{key}")
+                    return
+                if self.backpressure_policy == BackpressurePolicy.ERROR.value or time.monotonic() >= deadline:
+                    raise RuntimeError("hàng đợi gửi đầy")
+                self.producer.poll(POLL_INTERVAL)
+
+        self._increase("produced")
+        if self.mode == KafkaProducerMode.ASYNC.value:
+            self._ensure_poller()
+
+    def _produce(self, topic: str, key, value, headers, attempt: int) -> None:
+        self.producer.produce(
+            topic=topic,
+            key=key,
+            value=value,
+            headers=headers,
+            on_delivery=lambda err, msg: self._on_delivery(err, msg, attempt),
+        )
+
+    def _on_delivery(self, err, msg, attempt: int) -> None:
+        """Delivery callback: cập nhật thống kê, đưa message lỗi vào hàng đợi gửi lại."""
+        if err is None:
+            latency = msg.latency()
+            with self._lock:
+                self._metrics["delivered"] += 1
+                self._latency_total += latency or 0
+            return
+
+        retriable = err.retriable() or err.code() == KafkaError._MSG_TIMED_OUT
+        if (
+            self.mode == KafkaProducerMode.ASYNC.value
+            and retriable
+            and attempt < self.max_retries
+            and len(self._retry_queue) < KAFKA_RETRY_QUEUE_SIZE
+        ):
+            self._retry_queue.append((msg.topic(), msg.key(), msg.value(), msg.headers(), attempt + 1))
+            self._increase("retried")
+            return
+
+        self._increase("failed")
+        logger.error(f"Kafka: gửi message {msg.topic()}/{msg.key()} thất bại sau {attempt} lần thử lại: {err}")
+
+    def _ensure_poller(self) -> None:
+        # Mỗi worker (process) cần luồng poll riêng
+        if self._poller_pid == os.getpid() and self._poller.is_alive():
+            return
+        with self._lock:
+            if self._poller_pid == os.getpid() and self._poller.is_alive():
+                return
+            self._poller = Thread(target=self._run, name="kafka-poll", daemon=True)
+            self._poller_pid = os.getpid()
+            self._poller.start()
+
+    def _run(self) -> None:
+        """Vòng lặp của luồng nền: xử lý delivery callback và gửi lại message lỗi."""
+        while not self._closed:
+            try:
+                self.producer.poll(POLL_INTERVAL)
+                while self._retry_queue:
+                    topic, key, value, headers, attempt = self._retry_queue[0]
+                    try:
+                        self._produce(topic, key, value, headers, attempt)
+                    except BufferError:
+                        break
+                    self._retry_queue.popleft()
+            except Exception as e:
+                logger.warning(f"Kafka poll lỗi: {e}")
+
+    @staticmethod
+    def _serialize(value: dict | bytes) -> bytes | str:
+        return value if isinstance(value, bytes) else json.dumps(value)
+
+    def _increase(self, metric: str) -> None:
+        with self._lock:
+            self._metrics[metric] += 1
+
 
 kafka_producer = KafkaProducer(Config.KAFKA_BROKER)
@@ -0,0 +1,132 @@
+# coding: utf8
+
+from loguru import logger
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from queue import Queue, Full
+from threading import Thread
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+
+from app.constants.globals import (
+    QUERY_PROFILER_ENABLED, SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_SAMPLE_RATE, SLOW_QUERY_QUEUE_SIZE
+)
+
+import random
+import time
+
+_current_signature: ContextVar = ContextVar("query_signature", default=None)
+
+
+class QueryProfiler:
+    """Lấy mẫu các truy vấn chậm của repository.
+
+    Các truy vấn được gắn chữ ký bộ lọc (signature) thông qua tag(). Truy vấn SELECT có gắn
+    chữ ký, chạy lâu hơn threshold_ms và được chọn theo sample_rate sẽ được đưa vào hàng đợi.
+    Một luồng nền chạy lại truy vấn với EXPLAIN (ANALYZE, BUFFERS) trên kết nối riêng của engine đã
+    chạy truy vấn (primary hoặc replica) và lưu kết quả vào bảng query_sample qua engine primary,
+    nên request không phải chờ.
+
+    Attributes:
+        enabled: Bật/tắt lấy mẫu
+        threshold_ms: Ngưỡng thời gian (ms) để coi là truy vấn chậm
+        sample_rate: Tỉ lệ lấy mẫu (0..1) trong số các truy vấn chậm
+        dropped: Số mẫu bị bỏ do hàng đợi đầy
+    """
+
+    def __init__(self, enabled: bool, threshold_ms: float, sample_rate: float, queue_size: int):
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self.dropped = 0
+        self._queue = Queue(maxsize=queue_size)
+        self._worker = None
+        self._primary = None
+        self._registered = False
+
+    def init_app(self, app) -> None:
+        """Đăng ký event listener của SQLAlchemy cho mọi engine (gọi sau db.init_app).
+
+        Args:
+            app: Ứng dụng Flask
+        """
+        if not self.enabled or self._registered:
+            return
+        # Mẫu luôn được ghi vào primary (replica chỉ đọc)
+        with app.app_context():
+            self._primary = app.extensions["sqlalchemy"].engine
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+        self._registered = True
+
+    @contextmanager
+    def tag(self, signature: str):
+        """Gắn chữ ký bộ lọc cho các truy vấn chạy trong khối with.
+
+        Args:
+            signature: Chữ ký bộ lọc, ví dụ "booking.paginate_all:phone,status|count=exact"
+        """
+        token = _current_signature.set(signature)
+        try:
+            yield
+        finally:
+            _current_signature.reset(token)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if _current_signature.get() is not None:
+            conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        signature = _current_signature.get()
+        if signature is None or not conn.info.get("query_start_time"):
+            return
+        duration_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        if (
+            executemany
+            or duration_ms < self.threshold_ms
+            or random.random() >= self.sample_rate
+            or not statement.lstrip().upper().startswith("SELECT")
+        ):
+            return
+
+        try:
+            self._queue.put_nowait((conn.engine, signature, duration_ms, statement, parameters))
+        except Full:
+            self.dropped += 1
+            return
+        self._ensure_worker()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = Thread(target=self._run, name="query-profiler", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Vòng lặp của luồng nền: chạy EXPLAIN ANALYZE và lưu mẫu."""
+        from app.models import QuerySampleModel
+
+        while True:
+            engine, signature, duration_ms, statement, parameters = self._queue.get()
+            try:
+                with engine.connect() as conn:
+                    plan = conn.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+                    ).scalar()
+                    conn.rollback()
+                with self._primary.begin() as conn:
+                    conn.execute(insert(QuerySampleModel.__table__).values(
+                        signature=signature[:255],
+                        duration_ms=duration_ms,
+                        statement=statement,
+                        plan=plan,
+                    ))
+            except Exception as e:
+                logger.warning(f"Không thể lưu mẫu truy vấn chậm: {e}")
+            finally:
+                self._queue.task_done()
+
+
+query_profiler = QueryProfiler(
+    QUERY_PROFILER_ENABLED, SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_SAMPLE_RATE, SLOW_QUERY_QUEUE_SIZE
+)
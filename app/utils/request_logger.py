@@ -0,0 +1,182 @@
+# coding: utf8
+
+from loguru import logger
+
+from datetime import datetime, timezone
+from flask import g, has_request_context, request, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.constants.globals import (
+    LOG_LEVEL, LOG_REDACT_FIELDS, REQUEST_LOG_ENABLED, REQUEST_LOG_ROUTE_SAMPLE_RATES, REQUEST_LOG_SAMPLE_RATES,
+    REQUEST_LOG_SLOW_MS
+)
+
+import json
+import random
+import sys
+import time
+import uuid
+
+REQUEST_ID_HEADER = "X-Request-ID"
+REDACTED = "***"
+
+
+def parse_rates(value: str) -> dict:
+    """Đọc cấu hình tỉ lệ lấy mẫu dạng "key=rate,key=rate".
+
+    Args:
+        value: Chuỗi cấu hình
+
+    Returns:
+        dict: {key: rate}
+    """
+    rates = {}
+    for item in value.split(","):
+        key, _, rate = item.strip().rpartition("=")
+        if key:
+            rates[key] = float(rate)
+    return rates
+
+
+class RequestLogger:
+    """Cấu hình log của ứng dụng và ghi một dòng JSON cho mỗi request.
+
+    Các sink của loguru dùng enqueue=True: request chỉ đưa bản ghi vào hàng đợi, việc ghi ra
+    stream được thực hiện bởi luồng nền. Log request được ghi ra stdout (chỉ nội dung JSON),
+    log ứng dụng ra stderr.
+
+    Mỗi request có cấp độ INFO (thành công), WARNING (4xx hoặc chạy lâu hơn slow_ms) hoặc ERROR (5xx)
+    và được lấy mẫu theo tỉ lệ của cấp độ (level_rates); với request INFO, tỉ lệ theo route
+    (route_rates, theo URL rule như /v1/bookings/<int:booking_id>) được ưu tiên nếu có. Tỉ lệ đã dùng
+    được ghi vào trường sample_rate. Các trường trong redact_fields của tham số request bị che.
+
+    Attributes:
+        enabled: Bật/tắt log request
+        level: Cấp độ log tối thiểu của log ứng dụng
+        level_rates: Tỉ lệ lấy mẫu theo cấp độ
+        route_rates: Tỉ lệ lấy mẫu theo route cho request INFO
+        slow_ms: Ngưỡng thời gian (ms) để ghi request ở cấp độ WARNING
+        redact_fields: Các trường cần che trong tham số
+    """
+
+    def __init__(self, enabled: bool, level: str, level_rates: dict, route_rates: dict, slow_ms: float,
+                 redact_fields: list):
+        self.enabled = enabled
+        self.level = level
+        self.level_rates = level_rates
+        self.route_rates = route_rates
+        self.slow_ms = slow_ms
+        self.redact_fields = frozenset(redact_fields)
+        self._configured = False
+
+    def init_app(self, app) -> None:
+        """Cấu hình sink của loguru và đăng ký xử lý trước/sau mỗi request.
+
+        Args:
+            app: Ứng dụng Flask
+        """
+        if not self._configured:
+            logger.remove()
+            # diagnose=False: traceback không in giá trị biến (có thể chứa PII)
+            logger.add(
+                sys.stderr, level=self.level, enqueue=True, diagnose=False,
+                filter=lambda record: "request_log" not in record["extra"]
+            )
+            if self.enabled:
+                logger.add(
+                    sys.stdout, format="{message}", enqueue=True, filter=lambda record: "request_log" in record["extra"]
+                )
+                event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+                event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+            self._configured = True
+
+        if self.enabled:
+            app.before_request(self._start_request)
+            app.after_request(self._finish_request)
+
+    def redact(self, value):
+        """Che các trường nhạy cảm (đệ quy trong dict/list).
+
+        Args:
+            value: Giá trị cần che
+
+        Returns:
+            Bản sao đã che các trường trong redact_fields
+        """
+        if isinstance(value, dict):
+            return {
+                key: REDACTED if key in self.redact_fields and item not in (None, "") else self.redact(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [self.redact(item) for item in value]
+        return value
+
+    def _start_request(self) -> None:
+        g.request_started_at = time.perf_counter()
+        g.request_id = request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+        g.db_time = 0.0
+        g.db_queries = 0
+
+    def _finish_request(self, response: Response) -> Response:
+        if "request_started_at" not in g:
+            return response
+        response.headers[REQUEST_ID_HEADER] = g.request_id
+        duration_ms = (time.perf_counter() - g.request_started_at) * 1000
+
+        if response.status_code >= 500:
+            level = "ERROR"
+        elif response.status_code >= 400 or duration_ms >= self.slow_ms:
+            level = "WARNING"
+        else:
+            level = "INFO"
+        route = request.url_rule.rule if request.url_rule else None
+        sample_rate = self.level_rates.get(level, 1.0)
+        if level == "INFO" and route in self.route_rates:
+            sample_rate = self.route_rates[route]
+        if sample_rate <= 0 or (sample_rate < 1 and random.random() >= sample_rate):
+            return response
+
+        record = {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "level": level,
+            "request_id": g.request_id,
+            "method": request.method,
+            "path": request.path,
+            "route": route,
+            "status": response.status_code,
+            "duration_ms": round(duration_ms, 2),
+            "db_ms": round(g.db_time * 1000, 2),
+            "db_queries": g.db_queries,
+            "db_replica": g.get("db_replica_key"),
+            "response_bytes": response.content_length,
+            "remote_addr": request.remote_addr,
+            "params": self.redact(g.get("request_params")),
+            "error": g.get("request_error"),
+            "sample_rate": sample_rate,
+        }
+        logger.bind(request_log=True).log(level, json.dumps(record, ensure_ascii=False, default=str))
+        return response
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if has_request_context():
+            conn.info.setdefault("request_query_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not has_request_context() or not conn.info.get("request_query_start"):
+            return
+        duration = time.perf_counter() - conn.info["request_query_start"].pop()
+        if "db_queries" in g:
+            g.db_time += duration
+            g.db_queries += 1
+
+
+request_logger = RequestLogger(
+    enabled=REQUEST_LOG_ENABLED,
+    level=LOG_LEVEL,
+    level_rates=parse_rates(REQUEST_LOG_SAMPLE_RATES),
+    route_rates=parse_rates(REQUEST_LOG_ROUTE_SAMPLE_RATES),
+    slow_ms=REQUEST_LOG_SLOW_MS,
+    redact_fields=[field.strip() for field in LOG_REDACT_FIELDS.split(",") if field.strip()]
+)
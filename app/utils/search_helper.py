@@ -0,0 +1,34 @@
+# coding: utf8
+
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def escape_like(value: str, escape: str = "!") -> str:
+    """
+    Escape các ký tự đặc biệt của LIKE/ILIKE trong chuỗi tìm kiếm.
+
+    Args:
+        value: Chuỗi tìm kiếm từ người dùng
+        escape: Ký tự escape
+
+    Returns:
+        str: Chuỗi đã escape các ký tự %, _ và ký tự escape
+    """
+    return value.replace(escape, escape * 2).replace("%", f"{escape}%").replace("_", f"{escape}_")
+
+
+def normalize_search_text(value) -> ColumnElement:
+    """
+    Chuẩn hóa chuỗi tìm kiếm phía database (chữ thường, bỏ dấu tiếng Việt).
+
+    Dùng cùng hàm f_unaccent với cột customer_name_normalized để hai phía luôn
+    được chuẩn hóa giống nhau.
+
+    Args:
+        value: Chuỗi hoặc biểu thức SQL cần chuẩn hóa
+
+    Returns:
+        ColumnElement: Biểu thức SQL f_unaccent(lower(value))
+    """
+    return func.f_unaccent(func.lower(value))
@@ -0,0 +1,144 @@
+# coding: utf8
+"""Benchmark số round trip tới database và độ trễ của cập nhật/xóa một booking.
+
+So sánh cách cũ (SELECT ... FOR UPDATE NOWAIT để lock, SELECT trạng thái cũ, SELECT entity trong
+update_by_id, UPDATE khi flush, SELECT khi refresh, COMMIT) với một câu lệnh UPDATE ... RETURNING
+(update_returning/soft_delete_returning) và COMMIT. Chỉ đo tầng repository + commit (không gồm
+outbox và thông báo cache, giống nhau ở cả hai cách).
+
+Cần database thật (cùng biến môi trường của ứng dụng); script tạo booking thử nghiệm và xóa hẳn khi
+kết thúc.
+
+Chạy: python -m benchmarks.round_trips [--number 200]
+"""
+
+from loguru import logger
+
+from datetime import datetime, timezone
+from sqlalchemy import delete, event
+
+from app import create_app, db
+from app.models import BookingModel
+from app.repositories import booking_repo
+
+import argparse
+import time
+
+
+class RoundTripCounter:
+    """Đếm số câu lệnh gửi tới database (kể cả COMMIT) trên engine chính."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._increase)
+        event.listen(engine, "commit", self._increase)
+
+    def _increase(self, *args, **kwargs) -> None:
+        self.count += 1
+
+
+def legacy_update(booking_id: int, changes: dict) -> None:
+    """Cách cũ: lock bằng SELECT, đọc trạng thái cũ, cập nhật qua ORM rồi refresh."""
+    session = db.session
+    try:
+        session.query(BookingModel).filter(
+            BookingModel.id == booking_id,
+            BookingModel.is_deleted.is_(False)
+        ).with_for_update(nowait=True).first()
+        if "status" in changes:
+            booking_repo.select_by_id(booking_id)
+        booking_repo.update_by_id(booking_id, **changes)
+        session.commit()
+    finally:
+        session.close()
+
+
+def returning_update(booking_id: int, changes: dict) -> None:
+    session = db.session
+    try:
+        booking_repo.update_returning(booking_id, **changes)
+        session.commit()
+    finally:
+        session.close()
+
+
+def legacy_delete(booking_id: int) -> None:
+    """Cách cũ: lock bằng SELECT, đọc entity rồi xóa mềm qua ORM."""
+    session = db.session
+    try:
+        session.query(BookingModel).filter(
+            BookingModel.id == booking_id,
+            BookingModel.is_deleted.is_(False)
+        ).with_for_update(nowait=True).first()
+        booking_repo.delete_by_id(booking_id)
+        session.commit()
+    finally:
+        session.close()
+
+
+def returning_delete(booking_id: int) -> None:
+    session = db.session
+    try:
+        booking_repo.soft_delete_returning(booking_id)
+        session.commit()
+    finally:
+        session.close()
+
+
+def measure(counter: RoundTripCounter, func: callable, calls: list) -> tuple:
+    """Chạy func với từng bộ tham số trong calls.
+
+    Returns:
+        tuple: (số round trip trung bình, độ trễ trung bình (ms)) mỗi lần gọi
+    """
+    counter.count = 0
+    started = time.perf_counter()
+    for args in calls:
+        func(*args)
+    elapsed = time.perf_counter() - started
+    return counter.count / len(calls), elapsed / len(calls) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200)
+    options = parser.parse_args()
+
+    logger.remove()
+    app = create_app()
+    with app.app_context():
+        rows = booking_repo.bulk_insert([
+            {"customer_name": f"Benchmark {index}", "phone": 900000000 + index,
+             "booking_date": datetime.now(timezone.utc)}
+            for index in range(options.number * 2 + 1)
+        ])
+        db.session.commit()
+        ids = [row.id for row in rows]
+        counter = RoundTripCounter(db.engine)
+        try:
+            cases = (
+                ("update", legacy_update, returning_update,
+                 [(ids[0], {"note": f"benchmark {index}"}) for index in range(options.number)]),
+                ("update+status", legacy_update, returning_update,
+                 [(ids[0], {"status": status}) for status in ("contacted", "new") * (options.number // 2)]),
+                ("delete", legacy_delete, returning_delete,
+                 [(booking_id,) for booking_id in ids[1:options.number + 1]],
+                 [(booking_id,) for booking_id in ids[options.number + 1:]]),
+            )
+            print(f"number={options.number}")
+            for name, legacy, returning, legacy_calls, *returning_calls in cases:
+                legacy_trips, legacy_ms = measure(counter, legacy, legacy_calls)
+                returning_trips, returning_ms = measure(
+                    counter, returning, returning_calls[0] if returning_calls else legacy_calls
+                )
+                print(
+                    f"{name:>14}: {legacy_trips:.0f} -> {returning_trips:.0f} round trip, "
+                    f"{legacy_ms:.3f} -> {returning_ms:.3f} ms"
+                )
+        finally:
+            db.session.execute(delete(BookingModel).where(BookingModel.id.in_(ids)))
+            db.session.commit()
+
+
+if __name__ == "__main__":
+    main()
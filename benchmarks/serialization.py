@@ -0,0 +1,84 @@
+# coding: utf8
+"""Microbenchmark serialize response danh sách booking.
+
+So sánh cách cũ (chuyển datetime thành chuỗi isoformat() khi định dạng, serialize bằng json của thư viện
+chuẩn qua jsonify) với FastJSONProvider (orjson serialize trực tiếp datetime thành bytes).
+
+Chạy: python -m benchmarks.serialization [--rows 500] [--number 200]
+"""
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from datetime import datetime, timedelta, timezone
+
+from app.services import BookingService
+from app.utils.json_provider import FastJSONProvider, USE_ORJSON
+
+import argparse
+import timeit
+
+
+def legacy_format(rows: list) -> list:
+    """Cách định dạng cũ: datetime được chuyển thành chuỗi trước khi serialize."""
+    return [
+        {
+            "id": booking_id,
+            "customer_name": customer_name,
+            "phone": phone,
+            "booking_date": booking_date.isoformat(),
+            "status": status,
+            "note": note,
+            "created_at": created_at.isoformat(),
+            "updated_at": updated_at.isoformat() if updated_at else None,
+            "version": version,
+        }
+        for booking_id, customer_name, phone, booking_date, status, note, created_at, updated_at, version in rows
+    ]
+
+
+def make_rows(count: int) -> list:
+    now = datetime.now(timezone(timedelta(hours=7)))
+    return [
+        (
+            index, f"Nguyễn Văn {index}", 900000000 + index, now + timedelta(days=index), "new",
+            "Ghi chú đặt chỗ", now, now if index % 2 else None, 1 + index % 2
+        )
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--number", type=int, default=200)
+    options = parser.parse_args()
+
+    rows = make_rows(options.rows)
+    legacy_app, fast_app = Flask("legacy"), Flask("fast")
+    legacy_app.json = DefaultJSONProvider(legacy_app)
+    legacy_app.json.compact = True
+    fast_app.json = FastJSONProvider(fast_app)
+    fast_app.json.compact = True
+
+    def legacy():
+        with legacy_app.app_context():
+            return legacy_app.json.response({"success": True, "data": legacy_format(rows)}).get_data()
+
+    def fast():
+        with fast_app.app_context():
+            return fast_app.json.response(
+                {"success": True, "data": BookingService._format_booking_rows(rows)}
+            ).get_data()
+
+    print(f"rows={options.rows}, orjson={USE_ORJSON}")
+    results = {}
+    for name, func in (("legacy", legacy), ("fast", fast)):
+        size = len(func())
+        results[name] = min(timeit.repeat(func, number=options.number, repeat=3)) / options.number * 1000
+        print(f"{name:>8}: {results[name]:8.3f} ms/response ({size} bytes)")
+    print(f"{'speedup':>8}: {results['legacy'] / results['fast']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# coding: utf8
+"""Benchmark throughput của một endpoint dưới tải đồng thời (so sánh phiên bản WSGI và ASGI).
+
+Mở N kết nối đồng thời (HTTP/1.1 keep-alive, kết nối lại nếu server đóng) và gửi request liên tục
+trong --duration giây; in số request/giây, độ trễ p50/p99 và số lỗi cho từng mức đồng thời.
+Chỉ dùng thư viện chuẩn (asyncio) nên client không phải là nút thắt ở vài nghìn kết nối.
+
+Chạy hai server trên cùng database, cùng số process:
+
+    gunicorn -w 4 -b 0.0.0.0:5000 run:app
+    hypercorn -w 4 -b 0.0.0.0:5001 run_asgi:app
+
+rồi đo từng server:
+
+    python -m benchmarks.throughput --url http://localhost:5000/v1/bookings/1 --concurrency 16 256 1024
+    python -m benchmarks.throughput --url http://localhost:5001/v1/bookings/1 --concurrency 16 256 1024
+"""
+
+from urllib.parse import urlsplit
+
+import argparse
+import asyncio
+import statistics
+import time
+
+
+class Stats:
+    """Kết quả của một lần đo."""
+
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple:
+    """Đọc một response HTTP/1.1 (Content-Length hoặc chunked).
+
+    Returns:
+        tuple: (status code, True nếu server giữ kết nối)
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Server đóng kết nối")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    else:
+        await reader.read()
+        return status, False
+    return status, headers.get("connection") != "close"
+
+
+async def client(host: str, port: int, request: bytes, deadline: float, stats: Stats) -> None:
+    """Một kết nối gửi request tuần tự tới khi hết thời gian."""
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await read_response(reader)
+            stats.latencies.append(time.perf_counter() - started)
+            if status >= 500:
+                stats.errors += 1
+            if not keep_alive:
+                writer.close()
+                writer = None
+        except (ConnectionError, OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+            stats.errors += 1
+            if writer is not None:
+                writer.close()
+            writer = None
+            await asyncio.sleep(0.01)
+    if writer is not None:
+        writer.close()
+
+
+async def measure(url: str, concurrency: int, duration: float) -> Stats:
+    """Đo throughput với một mức đồng thời."""
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    request = f"GET {path or '/'} HTTP/1.1\r\nHost: {parts.netloc}\r\nConnection: keep-alive\r\n\r\n".encode()
+    stats = Stats()
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        client(parts.hostname, parts.port or 80, request, deadline, stats) for _ in range(concurrency)
+    ))
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", required=True, help="URL cần đo (GET)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[16, 256, 1024], help="Các mức đồng thời")
+    parser.add_argument("--duration", type=float, default=10, help="Thời gian đo mỗi mức (giây)")
+    options = parser.parse_args()
+
+    print(f"url={options.url} duration={options.duration}s")
+    for concurrency in options.concurrency:
+        stats = asyncio.run(measure(options.url, concurrency, options.duration))
+        latencies = sorted(stats.latencies) or [0]
+        p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+        print(
+            f"concurrency={concurrency:>5}: {len(stats.latencies) / options.duration:>9.1f} req/s, "
+            f"p50 {statistics.median(latencies) * 1000:.1f} ms, p99 {p99 * 1000:.1f} ms, lỗi {stats.errors}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# coding: utf8
+"""Microbenchmark của tầng validate request (validate_request + validate_func).
+
+So sánh cách cũ (đọc request.json cho từng tham số, gọi jsonschema.validate với FormatChecker mới
+mỗi lần) với validator đã biên dịch khi decorate.
+
+Chạy: python -m benchmarks.validation [--number 20000]
+"""
+
+from loguru import logger
+
+from flask import Flask, request
+from jsonschema import FormatChecker, validate
+
+from app.decorators import validate_func, validate_request
+from app.services.booking import CREATE_BOOKING_SCHEMA
+
+import argparse
+import json
+import timeit
+
+ROUTE_PARAMS = {
+    "customer_name": {"type": str, "required": True, "location": "json"},
+    "phone": {"type": int, "required": True, "location": "json"},
+    "booking_date": {"type": str, "required": True, "location": "json"},
+    "note": {"type": str, "required": False, "location": "json"},
+}
+
+BODY = {
+    "customer_name": "Nguyễn Văn A",
+    "phone": 912345678,
+    "booking_date": "2025-01-01T10:00:00+07:00",
+    "note": "Bàn gần cửa sổ",
+}
+
+
+def legacy_validate(params: dict, schema: dict) -> dict:
+    """Cách cũ: đọc request.json cho từng tham số, biên dịch lại schema mỗi lần validate."""
+    data = {}
+    for name, attrs in params.items():
+        value = request.json.get(name) if request.is_json else None
+        if value not in (None, ""):
+            data[name] = attrs["type"](value)
+    data = {field: value for field, value in data.items() if field in schema["properties"]}
+    validate(instance=data, schema=schema, format_checker=FormatChecker())
+    return data
+
+
+@validate_request(ROUTE_PARAMS)
+def compiled_route(**kwargs):
+    return compiled_service(**kwargs)
+
+
+@validate_func(**CREATE_BOOKING_SCHEMA)
+def compiled_service(args, **kwargs):
+    return kwargs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20000)
+    number = parser.parse_args().number
+
+    app = Flask(__name__)
+    body = json.dumps(BODY)
+    # Không ghi log trong lúc đo
+    logger.remove()
+
+    results = {}
+    for name, func in (
+        ("legacy", lambda: legacy_validate(ROUTE_PARAMS, CREATE_BOOKING_SCHEMA)),
+        ("compiled", compiled_route),
+    ):
+        def run():
+            with app.test_request_context("/bookings", method="POST", data=body, content_type="application/json"):
+                func()
+        run()
+        results[name] = min(timeit.repeat(run, number=number, repeat=3)) / number * 1e6
+        print(f"{name:>10}: {results[name]:8.1f} µs/request")
+
+    print(f"{'saving':>10}: {results['legacy'] - results['compiled']:8.1f} µs/request "
+          f"({(1 - results['compiled'] / results['legacy']) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,20 @@ from loguru import logger
 import os
 
 
+def replica_binds(uri_template: str, replica_hosts: str) -> dict:
+    """Tạo cấu hình SQLALCHEMY_BINDS cho các replica.
+
+    Args:
+        uri_template: URI kết nối với placeholder {host}
+        replica_hosts: Danh sách replica dạng "host:port,host:port"
+
+    Returns:
+        dict: {"replica_<n>": URI kết nối}
+    """
+    hosts = [host.strip() for host in replica_hosts.split(",") if host.strip()]
+    return {f"replica_{index}": uri_template.format(host=host) for index, host in enumerate(hosts)}
+
+
 class Config:
     """Cấu hình ứng dụng Flask.
 
@@ -17,9 +31,13 @@ class Config:
         POSTGRES_PORT (str): Port PostgreSQL
         POSTGRES_DBNAME (str): Tên database PostgreSQL
         POSTGRES_SCHEMA (str): Schema PostgreSQL
+        POSTGRES_REPLICA_HOSTS (str): Danh sách replica dạng "host:port,host:port" (có thể rỗng)
         SQLALCHEMY_DATABASE_URI (str): URI kết nối database
+        SQLALCHEMY_BINDS (dict): URI kết nối các replica (bind key "replica_<n>")
         SQLALCHEMY_TRACK_MODIFICATIONS (bool): Cờ theo dõi sửa đổi
         SQLALCHEMY_ENGINE_OPTIONS (dict): Tùy chọn engine SQLAlchemy
+        ASYNC_SQLALCHEMY_DATABASE_URI (str): URI kết nối database của phiên bản ASGI (asyncpg)
+        ASYNC_SQLALCHEMY_ENGINE_OPTIONS (dict): Tùy chọn engine bất đồng bộ (pool dùng chung cho mọi request của process)
         SECRET_KEY (str): Khóa bí mật cho ứng dụng
         DEBUG (bool): Chế độ debug
     """
@@ -31,19 +49,42 @@ class Config:
     POSTGRES_PORT = os.environ.get("POSTGRES_PORT", "<your-postgres-port>")
     POSTGRES_DBNAME = os.environ.get("POSTGRES_DBNAME", "<your-postgres-dbname>")
     POSTGRES_SCHEMA = os.environ.get("POSTGRES_SCHEMA", "<your-postgres-schema>")
+    POSTGRES_REPLICA_HOSTS = os.environ.get("POSTGRES_REPLICA_HOSTS", "")
 
     SQLALCHEMY_DATABASE_URI = (
         f"{DB_TYPE}+{DB_DRIVER}://{POSTGRES_USER}:{POSTGRES_PASS}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DBNAME}"
     )
 
+    SQLALCHEMY_BINDS = replica_binds(
+        f"{DB_TYPE}+{DB_DRIVER}://{POSTGRES_USER}:{POSTGRES_PASS}@{{host}}/{POSTGRES_DBNAME}",
+        POSTGRES_REPLICA_HOSTS
+    )
+
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {
         "pool_pre_ping": True,
         "pool_recycle": 280,
         "connect_args": {
-            "options": f"-c search_path={POSTGRES_SCHEMA}"
+            "options": f"-c search_path={POSTGRES_SCHEMA},public"
         }
     }
+
+    # Phiên bản ASGI (app.asgi): engine bất đồng bộ, chỉ kết nối primary
+    ASYNC_DB_DRIVER = os.environ.get("ASYNC_DB_DRIVER", "asyncpg")
+    ASYNC_SQLALCHEMY_DATABASE_URI = (
+        f"{DB_TYPE}+{ASYNC_DB_DRIVER}://{POSTGRES_USER}:{POSTGRES_PASS}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DBNAME}"
+    )
+    ASYNC_SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "pool_recycle": 280,
+        "pool_size": int(os.environ.get("ASYNC_DB_POOL_SIZE", 20)),
+        "max_overflow": int(os.environ.get("ASYNC_DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.environ.get("ASYNC_DB_POOL_TIMEOUT", 30)),
+        "connect_args": {
+            "server_settings": {"search_path": f"{POSTGRES_SCHEMA},public"}
+        }
+    }
+
     DEBUG = os.getenv("FLASK_ENV", "development") == "development"
 
     # Kafka config
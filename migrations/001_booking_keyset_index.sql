@@ -0,0 +1,5 @@
+-- Index phục vụ phân trang keyset (cursor) theo thứ tự (created_at DESC, id DESC)
+-- Partial index chỉ chứa các bản ghi chưa bị xóa mềm
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "b_created_at_id_active"
+  ON "booking"."booking" ("created_at" DESC, "id" DESC)
+  WHERE "is_deleted" IS FALSE;
@@ -0,0 +1,18 @@
+-- Tìm kiếm tên khách hàng không phân biệt dấu tiếng Việt, dùng index trigram (pg_trgm)
+CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public;
+CREATE EXTENSION IF NOT EXISTS unaccent SCHEMA public;
+
+-- unaccent() chỉ là STABLE nên cần wrapper IMMUTABLE để dùng trong generated column/index
+CREATE OR REPLACE FUNCTION "booking"."f_unaccent"(text)
+RETURNS text AS $$
+  SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;
+
+-- Cột tên đã chuẩn hóa (chữ thường, bỏ dấu). Lưu ý: lệnh này ghi lại toàn bộ bảng
+ALTER TABLE "booking"."booking"
+  ADD COLUMN IF NOT EXISTS "customer_name_normalized" varchar(100)
+  GENERATED ALWAYS AS ("booking"."f_unaccent"(lower("customer_name"))) STORED;
+
+-- GIN trigram index phục vụ ILIKE '%...%', ILIKE '...%' và so khớp gần đúng (<%)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "b_customer_name_trgm"
+  ON "booking"."booking" USING gin ("customer_name_normalized" public.gin_trgm_ops);
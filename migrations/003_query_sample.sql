@@ -0,0 +1,12 @@
+-- Lưu mẫu các truy vấn chậm của repository (kèm plan EXPLAIN ANALYZE) theo chữ ký bộ lọc
+CREATE TABLE IF NOT EXISTS "booking"."query_sample" (
+  "id" serial8,
+  "signature" varchar(255) NOT NULL,
+  "duration_ms" float8 NOT NULL,
+  "statement" text NOT NULL,
+  "plan" jsonb,
+  "created_at" timestamptz DEFAULT now() NOT NULL,
+  PRIMARY KEY ("id")
+);
+
+CREATE INDEX IF NOT EXISTS "qs_created_at_signature" ON "booking"."query_sample" ("created_at", "signature");
@@ -0,0 +1,64 @@
+-- Bảng tổng hợp số lượng booking (chưa xóa) theo giờ (UTC) của booking_date và trạng thái.
+-- Lưu theo giờ để báo cáo theo ngày ở bất kỳ múi giờ lệch giờ chẵn nào (ví dụ Asia/Ho_Chi_Minh).
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS "booking"."booking_summary_hourly" (
+  "bucket" timestamptz NOT NULL,
+  "status" "booking"."booking_status" NOT NULL,
+  "total" int8 DEFAULT 0 NOT NULL,
+  PRIMARY KEY ("bucket", "status")
+);
+
+-- Cộng dồn delta vào một ô (giờ, trạng thái)
+CREATE OR REPLACE FUNCTION "booking"."apply_booking_summary"(p_booking_date timestamptz, p_status "booking"."booking_status", p_delta int)
+RETURNS void AS $$
+BEGIN
+  INSERT INTO "booking"."booking_summary_hourly" ("bucket", "status", "total")
+  VALUES (date_trunc('hour', p_booking_date AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', p_status, p_delta)
+  ON CONFLICT ("bucket", "status")
+  DO UPDATE SET "total" = "booking_summary_hourly"."total" + EXCLUDED."total";
+END;
+$$ LANGUAGE plpgsql;
+
+-- Cập nhật bảng tổng hợp khi thêm/sửa/xóa booking
+CREATE OR REPLACE FUNCTION "booking"."maintain_booking_summary"()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND NOT OLD.is_deleted THEN
+    PERFORM "booking"."apply_booking_summary"(OLD.booking_date, OLD.status, -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NOT NEW.is_deleted THEN
+    PERFORM "booking"."apply_booking_summary"(NEW.booking_date, NEW.status, 1);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Chặn ghi trong lúc tạo trigger và tính lại dữ liệu ban đầu
+LOCK TABLE "booking"."booking" IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER IF EXISTS "booking_summary_insert_delete" ON "booking"."booking";
+CREATE TRIGGER "booking_summary_insert_delete"
+AFTER INSERT OR DELETE ON "booking"."booking"
+FOR EACH ROW
+EXECUTE FUNCTION "booking"."maintain_booking_summary"();
+
+DROP TRIGGER IF EXISTS "booking_summary_update" ON "booking"."booking";
+CREATE TRIGGER "booking_summary_update"
+AFTER UPDATE OF "booking_date", "status", "is_deleted" ON "booking"."booking"
+FOR EACH ROW
+WHEN (
+  OLD.booking_date IS DISTINCT FROM NEW.booking_date
+  OR OLD.status IS DISTINCT FROM NEW.status
+  OR OLD.is_deleted IS DISTINCT FROM NEW.is_deleted
+)
+EXECUTE FUNCTION "booking"."maintain_booking_summary"();
+
+TRUNCATE "booking"."booking_summary_hourly";
+INSERT INTO "booking"."booking_summary_hourly" ("bucket", "status", "total")
+SELECT date_trunc('hour', "booking_date" AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', "status", count(*)
+FROM "booking"."booking"
+WHERE NOT "is_deleted"
+GROUP BY 1, 2;
+
+COMMIT;
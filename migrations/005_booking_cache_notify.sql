@@ -0,0 +1,38 @@
+-- Thông báo ID các booking đã thay đổi tới cache chi tiết của các worker (channel booking_cache,
+-- xem EntityCache) sau mỗi câu lệnh UPDATE/DELETE, cho mọi nơi ghi (ứng dụng, SQL trực tiếp).
+-- NOTIFY chỉ được phát đi khi transaction commit thành công.
+BEGIN;
+
+CREATE OR REPLACE FUNCTION "booking"."notify_booking_cache"()
+RETURNS TRIGGER AS $$
+DECLARE
+  payload text;
+BEGIN
+  -- Payload dạng "1,2,3", mỗi payload tối đa 300 ID (dưới giới hạn 8000 byte của NOTIFY)
+  FOR payload IN
+    SELECT string_agg("id"::text, ',' ORDER BY "id")
+    FROM (SELECT "id", (row_number() OVER (ORDER BY "id") - 1) / 300 AS "chunk" FROM "changed_rows") AS "numbered"
+    GROUP BY "chunk"
+  LOOP
+    PERFORM pg_notify('booking_cache', payload);
+  END LOOP;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition table chỉ được dùng với trigger một loại câu lệnh
+DROP TRIGGER IF EXISTS "booking_cache_notify_update" ON "booking"."booking";
+CREATE TRIGGER "booking_cache_notify_update"
+AFTER UPDATE ON "booking"."booking"
+REFERENCING OLD TABLE AS "changed_rows"
+FOR EACH STATEMENT
+EXECUTE FUNCTION "booking"."notify_booking_cache"();
+
+DROP TRIGGER IF EXISTS "booking_cache_notify_delete" ON "booking"."booking";
+CREATE TRIGGER "booking_cache_notify_delete"
+AFTER DELETE ON "booking"."booking"
+REFERENCING OLD TABLE AS "changed_rows"
+FOR EACH STATEMENT
+EXECUTE FUNCTION "booking"."notify_booking_cache"();
+
+COMMIT;
@@ -0,0 +1,55 @@
+-- Bộ đếm thế hệ ghi của bảng booking: tăng sau mỗi câu lệnh INSERT/UPDATE/DELETE có thay đổi dữ liệu.
+-- Được cập nhật trong cùng transaction với dữ liệu nên chỉ thay đổi khi dữ liệu đã commit,
+-- dùng để tạo ETag cho danh sách đặt chỗ. Thế hệ ghi là tổng "value" của mọi slot.
+--
+-- Bộ đếm được chia thành 256 slot, mỗi kết nối (backend) chỉ tăng slot của mình, nên các transaction
+-- ghi song song không phải chờ lock của cùng một dòng. Cột "value" không có index và bảng để trống
+-- một nửa mỗi trang (fillfactor) nên các lần cập nhật là HOT update, dòng cũ được dọn ngay trong trang.
+-- Không dùng sequence: last_value không theo transaction (đọc được giá trị của transaction chưa commit)
+-- và trên replica chỉ thay đổi sau mỗi 32 lần nextval.
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS "booking"."booking_generation" (
+  "slot" int4 NOT NULL,
+  "value" int8 DEFAULT 0 NOT NULL,
+  PRIMARY KEY ("slot")
+) WITH (fillfactor = 50);
+
+INSERT INTO "booking"."booking_generation" ("slot", "value")
+SELECT "slot", 0 FROM generate_series(0, 255) AS "slot"
+ON CONFLICT DO NOTHING;
+
+CREATE OR REPLACE FUNCTION "booking"."bump_booking_generation"()
+RETURNS TRIGGER AS $$
+BEGIN
+  -- Bỏ qua câu lệnh không thay đổi dòng nào (ví dụ UPDATE với If-Match không khớp)
+  IF EXISTS (SELECT 1 FROM "changed_rows") THEN
+    UPDATE "booking"."booking_generation" SET "value" = "value" + 1 WHERE "slot" = pg_backend_pid() % 256;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition table chỉ được dùng với trigger một loại câu lệnh
+DROP TRIGGER IF EXISTS "booking_generation_bump_insert" ON "booking"."booking";
+CREATE TRIGGER "booking_generation_bump_insert"
+AFTER INSERT ON "booking"."booking"
+REFERENCING NEW TABLE AS "changed_rows"
+FOR EACH STATEMENT
+EXECUTE FUNCTION "booking"."bump_booking_generation"();
+
+DROP TRIGGER IF EXISTS "booking_generation_bump_update" ON "booking"."booking";
+CREATE TRIGGER "booking_generation_bump_update"
+AFTER UPDATE ON "booking"."booking"
+REFERENCING NEW TABLE AS "changed_rows"
+FOR EACH STATEMENT
+EXECUTE FUNCTION "booking"."bump_booking_generation"();
+
+DROP TRIGGER IF EXISTS "booking_generation_bump_delete" ON "booking"."booking";
+CREATE TRIGGER "booking_generation_bump_delete"
+AFTER DELETE ON "booking"."booking"
+REFERENCING OLD TABLE AS "changed_rows"
+FOR EACH STATEMENT
+EXECUTE FUNCTION "booking"."bump_booking_generation"();
+
+COMMIT;
@@ -0,0 +1,19 @@
+-- Transactional outbox: sự kiện booking được ghi cùng transaction với thay đổi dữ liệu,
+-- sau đó được relay (flask --app run outbox-relay) gửi tới Kafka.
+CREATE TABLE IF NOT EXISTS "booking"."booking_outbox" (
+  "id" bigserial NOT NULL,
+  "topic" varchar(255) NOT NULL,
+  "message_key" varchar(255) NOT NULL,
+  "event_type" varchar(50) NOT NULL,
+  "payload" jsonb NOT NULL,
+  "attempts" int4 DEFAULT 0 NOT NULL,
+  "last_error" text,
+  "created_at" timestamptz DEFAULT now() NOT NULL,
+  "sent_at" timestamptz,
+  PRIMARY KEY ("id")
+);
+
+-- Relay chỉ quét các sự kiện chưa gửi
+CREATE INDEX IF NOT EXISTS "b_outbox_pending" ON "booking"."booking_outbox" ("id") WHERE "sent_at" IS NULL;
+-- Dọn các sự kiện đã gửi
+CREATE INDEX IF NOT EXISTS "b_outbox_sent_at" ON "booking"."booking_outbox" ("sent_at") WHERE "sent_at" IS NOT NULL;
@@ -0,0 +1,21 @@
+-- Phiên bản của bản ghi booking cho cập nhật lạc quan (optimistic concurrency):
+-- tăng 1 sau mỗi lần UPDATE (kể cả cập nhật/xóa theo lô), dùng cho ETag chi tiết và If-Match.
+BEGIN;
+
+ALTER TABLE "booking"."booking" ADD COLUMN IF NOT EXISTS "version" int8 DEFAULT 1 NOT NULL;
+
+CREATE OR REPLACE FUNCTION "booking"."bump_booking_version"()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.version = OLD.version + 1;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "booking_version_bump" ON "booking"."booking";
+CREATE TRIGGER "booking_version_bump"
+BEFORE UPDATE ON "booking"."booking"
+FOR EACH ROW
+EXECUTE FUNCTION "booking"."bump_booking_version"();
+
+COMMIT;
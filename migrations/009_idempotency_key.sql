@@ -0,0 +1,22 @@
+-- Idempotency-Key: response của request tạo booking được lưu theo (scope, key) trong IDEMPOTENCY_TTL
+-- giây, request gửi lại với cùng key nhận lại response đã lưu mà không tạo booking mới.
+CREATE TABLE IF NOT EXISTS "booking"."idempotency_key" (
+  "scope" varchar(100) NOT NULL,
+  "key" varchar(255) NOT NULL,
+  "request_hash" varchar(64) NOT NULL,
+  -- NULL khi request đang được xử lý
+  "status_code" int4,
+  "response_body" text,
+  "content_type" varchar(100),
+  "created_at" timestamptz DEFAULT now() NOT NULL,
+  "expires_at" timestamptz NOT NULL,
+  PRIMARY KEY ("scope", "key")
+);
+
+-- Dọn các key đã hết hạn
+CREATE INDEX IF NOT EXISTS "ik_expires_at" ON "booking"."idempotency_key" ("expires_at");
+
+-- Kiểm tra booking trùng (cùng số điện thoại và thời gian đặt) khi BOOKING_DUPLICATE_CHECK=true
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "b_phone_booking_date_active"
+ON "booking"."booking" ("phone", "booking_date")
+WHERE "is_deleted" IS FALSE;
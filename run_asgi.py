@@ -0,0 +1,8 @@
+# coding: utf8
+
+from app.asgi import create_asgi_app
+
+app = create_asgi_app()
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=5000)